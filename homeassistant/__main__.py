@@ -105,6 +105,16 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Write a trace of the imports and setups during the startup",
+    )
+    parser.add_argument(
+        "--timer-wheel",
+        action="store_true",
+        help="Batch the timers of the time trackers on a timer wheel",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -201,6 +211,8 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        trace_startup=args.trace_startup,
+        timer_wheel=args.timer_wheel,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -87,8 +87,10 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.startup_trace import async_enable_startup_trace, async_get_startup_tracer
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
+from .helpers.timer_wheel import async_enable_timer_wheel
 from .helpers.typing import ConfigType
 from .setup import (
     # _setup_started is marked as protected to make it clear
@@ -262,6 +264,10 @@ async def async_setup_hass(
     async def create_hass() -> core.HomeAssistant:
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
+        if runtime_config.trace_startup:
+            async_enable_startup_trace(hass)
+        if runtime_config.timer_wheel:
+            async_enable_timer_wheel(hass)
         loader.async_setup(hass)
 
         await async_enable_logging(
@@ -283,6 +289,8 @@ async def async_setup_hass(
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
         """Stop hass."""
+        if tracer := async_get_startup_tracer(hass):
+            tracer.async_stop()
         # Ask integrations to shut down. It's messy but we can't
         # do a clean stop without knowing what is broken
         with contextlib.suppress(TimeoutError):
@@ -434,6 +442,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_template_code_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -451,6 +460,8 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Load the manifest cache before any integration is resolved
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -841,6 +852,20 @@ async def _async_resolve_domains_to_setup(
 
     translations_to_load = additional_manifests_to_load.copy()
 
+    manifest_cache = hass.data.get(loader.DATA_MANIFEST_CACHE)
+    if manifest_cache and manifest_cache.resolved_domains:
+        # Resolve the integrations which were resolved during the last start
+        # in a single executor job, they are likely needed again and all
+        # the resolve rounds below can use the integrations from memory
+        await loader.async_get_integrations(
+            hass,
+            {
+                *manifest_cache.resolved_domains,
+                *domains_to_setup,
+                *additional_manifests_to_load,
+            },
+        )
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
@@ -921,6 +946,9 @@ async def _async_resolve_domains_to_setup(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    if manifest_cache:
+        manifest_cache.async_save(integration_cache)
+
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
     # We do not wait for this since its an optimization only
@@ -83,6 +83,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_get,
     trace_path,
 )
@@ -702,8 +703,8 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                 trigger_path = f"trigger/{variables['trigger']['idx']}"
             else:
                 trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if trace_enabled():
+                trace_append_element(TraceElement(variables, trigger_path))
 
             if (
                 not skip_condition
@@ -21,12 +21,19 @@ from homeassistant.const import (
     CONF_ID,
     CONF_VARIABLES,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv, script
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+    script,
+)
 from homeassistant.helpers.condition import async_validate_conditions_config
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -45,6 +52,11 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "list"
 
+# The validated automations by the content of their configuration
+DATA_VALIDATED_CONFIGS: HassKey[dict[bytes, AutomationConfig]] = HassKey(
+    f"{DOMAIN}_validated_configs"
+)
+
 _MINIMAL_PLATFORM_SCHEMA = vol.Schema(
     {
         CONF_ID: str,
@@ -342,19 +354,90 @@ async def async_validate_config_item(
     return await _async_validate_config_item(hass, config, True, False)
 
 
+def _config_key(config: Any) -> bytes | None:
+    """Return the key of an automation configuration for the validation cache.
+
+    Returns None if the validated configuration can't be reused since
+    blueprint automations depend on the blueprint.
+    """
+    if not isinstance(config, dict) or blueprint.is_blueprint_instance_config(config):
+        return None
+    try:
+        return json_bytes(config)
+    except TypeError:
+        return None
+
+
+@callback
+def _async_registry_changed(
+    event_data: er.EventEntityRegistryUpdatedData | dr.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Filter registry changes which can change the validated configs."""
+    return event_data["action"] != "create"
+
+
+@callback
+def _async_get_validated_configs(hass: HomeAssistant) -> dict[bytes, AutomationConfig]:
+    """Return the validated configs of the previous validation.
+
+    The validation resolves entity registry ids and validates device
+    triggers, conditions and actions against the registries, so the
+    validated configs are dropped when a registry entry is changed or removed.
+    """
+    if (validated_configs := hass.data.get(DATA_VALIDATED_CONFIGS)) is not None:
+        return validated_configs
+
+    @callback
+    def _async_clear_validated_configs(_event: Event[Any]) -> None:
+        """Drop the validated configs."""
+        hass.data[DATA_VALIDATED_CONFIGS] = {}
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_clear_validated_configs,
+        event_filter=_async_registry_changed,
+    )
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_clear_validated_configs,
+        event_filter=_async_registry_changed,
+    )
+    validated_configs = hass.data[DATA_VALIDATED_CONFIGS] = {}
+    return validated_configs
+
+
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
+    """Validate config.
+
+    Automations which are configured exactly as they were when the
+    configuration was validated last time are not validated again, this
+    makes reloading many automations fast when only a few changed.
+    """
+    previous_validated_configs = _async_get_validated_configs(hass)
+    validated_configs: dict[bytes, AutomationConfig] = {}
+    automations: list[AutomationConfig] = []
     # No gather here since _try_async_validate_config_item is unlikely to suspend
     # and the cost of creating many tasks is not worth the benefit.
-    automations = list(
-        filter(
-            lambda x: x is not None,
-            [
-                await _try_async_validate_config_item(hass, p_config)
-                for _, p_config in config_per_platform(config, DOMAIN)
-            ],
-        )
-    )
+    for _, p_config in config_per_platform(config, DOMAIN):
+        # The key is created before validating since the validation
+        # changes the configuration
+        key = _config_key(p_config)
+        if key is None or key in validated_configs:
+            automation_config = await _try_async_validate_config_item(hass, p_config)
+        elif (automation_config := previous_validated_configs.get(key)) is None:
+            automation_config = await _try_async_validate_config_item(hass, p_config)
+            if (
+                automation_config is not None
+                and automation_config.validation_status == ValidationStatus.OK
+            ):
+                validated_configs[key] = automation_config
+        else:
+            validated_configs[key] = automation_config
+        if automation_config is not None:
+            automations.append(automation_config)
+    if hass.data[DATA_VALIDATED_CONFIGS] is previous_validated_configs:
+        # The registries were not changed while validating
+        hass.data[DATA_VALIDATED_CONFIGS] = validated_configs
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -7,7 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
@@ -34,7 +34,7 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
@@ -62,34 +62,12 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
-def _ws_get_significant_states(
-    hass: HomeAssistant,
-    msg_id: int,
-    start_time: dt,
-    end_time: dt | None,
-    entity_ids: list[str] | None,
-    include_start_time_state: bool,
-    significant_changes_only: bool,
-    minimal_response: bool,
-    no_attributes: bool,
+def _ws_significant_states_response(
+    msg_id: int, columns: dict[str, history.HistoryColumns]
 ) -> bytes:
-    """Fetch history significant_states and convert them to json in the executor."""
+    """Convert history significant_states to json in the executor."""
     return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+        messages.result_message(msg_id, history.history_columns_to_json(columns))
     )
 
 
@@ -155,24 +133,25 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    columns = await history.async_get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
-            _ws_get_significant_states,
-            hass,
-            msg["id"],
-            start_time,
-            end_time,
-            entity_ids,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
+            _ws_significant_states_response, msg["id"], columns
         )
     )
 
 
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, list[dict[str, Any]]] | dict[str, json_fragment],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -200,7 +179,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, list[dict[str, Any]]] | dict[str, json_fragment],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -211,41 +190,21 @@ def _generate_websocket_response(
 
 
 def _generate_historical_response(
-    hass: HomeAssistant,
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
-    include_start_time_state: bool,
-    significant_changes_only: bool,
-    minimal_response: bool,
-    no_attributes: bool,
+    columns: dict[str, history.HistoryColumns],
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
+    last_time_ts = max(
+        (
+            entity_columns.last_updated_ts[-1]
+            for entity_columns in columns.values()
+            if entity_columns.last_updated_ts
         ),
+        default=0.0,
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -260,7 +219,9 @@ def _generate_historical_response(
     return (
         last_time_ts,
         last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(
+            msg_id, start_time, last_time_dt, history.history_columns_to_json(columns)
+        ),
     )
 
 
@@ -270,7 +231,7 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
@@ -278,11 +239,8 @@ async def _async_send_historical_states(
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
+    columns = await history.async_get_significant_states_columns(
         hass,
-        msg_id,
         start_time,
         end_time,
         entity_ids,
@@ -290,6 +248,15 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+    )
+    last_time_ts, last_time_dt, payload = await get_instance(
+        hass
+    ).async_add_executor_job(
+        _generate_historical_response,
+        msg_id,
+        start_time,
+        end_time,
+        columns,
         send_empty,
     )
     if payload:
@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.timer_wheel import async_get_timer_wheel_stats
 
 
 @callback
@@ -21,7 +22,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health_info: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +37,8 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+    if (timer_wheel_stats := async_get_timer_wheel_stats(hass)) is not None:
+        health_info.update(
+            (f"timer_wheel_{key}", value) for key, value in timer_wheel_stats.items()
+        )
+    return health_info
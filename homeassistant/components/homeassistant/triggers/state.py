@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from datetime import timedelta
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +33,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +43,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_ENGINE: HassKey[StateTriggerEngine] = HassKey("state_trigger_engine")
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -69,6 +74,229 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+def _match_key(parameter: Any, invert: bool) -> Hashable | None:
+    """Return a key of the states a from/to parameter matches.
+
+    Returns None if the parameter is not hashable.
+    """
+    if parameter is None or parameter == MATCH_ALL:
+        return MATCH_ALL
+    try:
+        if not isinstance(parameter, str) and hasattr(parameter, "__iter__"):
+            parameter = frozenset(parameter)
+        hash(parameter)
+    except TypeError:
+        return None
+    return (invert, parameter)
+
+
+class _StateTrigger:
+    """A state trigger in the decision table of an entity."""
+
+    __slots__ = (
+        "attribute",
+        "match_all",
+        "match_from_state",
+        "match_key",
+        "match_to_state",
+        "on_match",
+    )
+
+    def __init__(
+        self,
+        attribute: str | None,
+        match_from_state: Callable[[Any], bool],
+        match_to_state: Callable[[Any], bool],
+        match_key: Hashable | None,
+        match_all: bool,
+        on_match: Callable[[Event[EventStateChangedData], Any, Any], None],
+    ) -> None:
+        """Initialize the state trigger."""
+        self.attribute = attribute
+        self.match_from_state = match_from_state
+        self.match_to_state = match_to_state
+        self.match_key = match_key
+        self.match_all = match_all
+        self.on_match = on_match
+
+
+class _SharedSameState:
+    """A `for` period shared by the triggers matching the same state change."""
+
+    __slots__ = ("actions", "cancel")
+
+    def __init__(self) -> None:
+        """Initialize the shared period."""
+        self.actions: dict[Callable[[], None], None] = {}
+        self.cancel: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_run_actions(self) -> None:
+        """Run the actions of the triggers once the period has passed."""
+        actions = list(self.actions)
+        self.actions.clear()
+        for action in actions:
+            action()
+
+    @callback
+    def async_remove_action(self, action: Callable[[], None]) -> None:
+        """Remove the action of a trigger and stop tracking once unused."""
+        if action not in self.actions:
+            return
+        del self.actions[action]
+        if self.actions:
+            return
+        if self.cancel is not None:
+            self.cancel()
+            self.cancel = None
+
+
+class StateTriggerEngine:
+    """Evaluate the state triggers of all automations.
+
+    The state triggers are kept in a decision table per entity and a single
+    state change listener per entity evaluates all of them. The value of the
+    state or attribute and the from/to matching are computed once per state
+    change for all triggers which watch the same attribute with the same
+    from/to states. The triggers with a `for` period which match the same
+    state change share the timer and the state change listener waiting for
+    the period when they wait for the same state and the same period.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self._triggers: dict[str, list[_StateTrigger]] = {}
+        self._unsub_entities: dict[str, CALLBACK_TYPE] = {}
+        # The `for` periods started by the state change being evaluated
+        self._same_states: dict[Hashable, _SharedSameState] = {}
+
+    @callback
+    def async_add_trigger(
+        self, entity_ids: str | Iterable[str], trigger: _StateTrigger
+    ) -> CALLBACK_TYPE:
+        """Add a trigger to the decision tables of the entities."""
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        # The state change listeners match the lowercased entity ids
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+        for entity_id in entity_ids:
+            if (triggers := self._triggers.get(entity_id)) is None:
+                triggers = self._triggers[entity_id] = []
+                self._unsub_entities[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            triggers.append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger from the decision tables."""
+            for entity_id in entity_ids:
+                triggers = self._triggers[entity_id]
+                triggers.remove(trigger)
+                if not triggers:
+                    del self._triggers[entity_id]
+                    self._unsub_entities.pop(entity_id)()
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Evaluate the triggers of an entity for a state change."""
+        data = event.data
+        if not (triggers := self._triggers.get(data["entity_id"])):
+            return
+        from_s = data["old_state"]
+        to_s = data["new_state"]
+        values: dict[str | None, tuple[Any, Any]] = {}
+        matches: dict[tuple[str | None, Hashable], bool] = {}
+        # A trigger action can change a state which is evaluated before
+        # this state change has been evaluated for all triggers
+        same_states = self._same_states
+        self._same_states = {}
+        # Copy the triggers since running an action can remove triggers
+        for trigger in tuple(triggers):
+            attribute = trigger.attribute
+            if (value := values.get(attribute)) is None:
+                if attribute is None:
+                    value = (
+                        None if from_s is None else from_s.state,
+                        None if to_s is None else to_s.state,
+                    )
+                else:
+                    value = (
+                        None if from_s is None else from_s.attributes.get(attribute),
+                        None if to_s is None else to_s.attributes.get(attribute),
+                    )
+                values[attribute] = value
+            old_value, new_value = value
+
+            # When we listen for state changes with `match_all`, we
+            # will trigger even if just an attribute changes. When
+            # we listen to just an attribute, we should ignore all
+            # other attribute changes.
+            if old_value == new_value and (
+                attribute is not None or not trigger.match_all
+            ):
+                continue
+
+            match_key = trigger.match_key
+            matched = None if match_key is None else matches.get((attribute, match_key))
+            if matched is None:
+                matched = trigger.match_from_state(
+                    old_value
+                ) and trigger.match_to_state(new_value)
+                if match_key is not None:
+                    matches[(attribute, match_key)] = matched
+            if not matched:
+                continue
+
+            try:
+                trigger.on_match(event, old_value, new_value)
+            except Exception:
+                _LOGGER.exception(
+                    "Error evaluating state trigger for %s", data["entity_id"]
+                )
+        self._same_states = same_states
+
+    @callback
+    def async_track_same_state(
+        self,
+        entity_id: str,
+        period: timedelta,
+        action: Callable[[], None],
+        check_same_state: Callable[[str, State | None, State | None], bool],
+        same_state_key: Hashable | None,
+    ) -> CALLBACK_TYPE:
+        """Run the action once the entity kept the same state for the period.
+
+        The triggers matching the state change which is being evaluated and
+        waiting for the same state and period share the tracking.
+        """
+        key = (entity_id, period, same_state_key)
+        if same_state_key is None or (shared := self._same_states.get(key)) is None:
+            shared = _SharedSameState()
+            shared.cancel = async_track_same_state(
+                self.hass,
+                period,
+                shared.async_run_actions,
+                check_same_state,
+                entity_ids=entity_id,
+            )
+            if same_state_key is not None:
+                self._same_states[key] = shared
+        shared.actions[action] = None
+        return partial(shared.async_remove_action, action)
+
+
+@callback
+def _async_get_state_trigger_engine(hass: HomeAssistant) -> StateTriggerEngine:
+    """Return the state trigger engine."""
+    if (engine := hass.data.get(DATA_STATE_TRIGGER_ENGINE)) is None:
+        engine = hass.data[DATA_STATE_TRIGGER_ENGINE] = StateTriggerEngine(hass)
+    return engine
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -104,17 +332,23 @@ async def async_attach_trigger(
 
     if (from_state := config.get(CONF_FROM)) is not None:
         match_from_state = process_state_match(from_state)
+        from_key = _match_key(from_state, False)
     elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
         match_from_state = process_state_match(not_from_state, invert=True)
+        from_key = _match_key(not_from_state, True)
     else:
         match_from_state = process_state_match(MATCH_ALL)
+        from_key = MATCH_ALL
 
     if (to_state := config.get(CONF_TO)) is not None:
         match_to_state = process_state_match(to_state)
+        to_key = _match_key(to_state, False)
     elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
         match_to_state = process_state_match(not_to_state, invert=True)
+        to_key = _match_key(not_to_state, True)
     else:
         match_to_state = process_state_match(MATCH_ALL)
+        to_key = MATCH_ALL
 
     time_delta = config.get(CONF_FOR)
     # If neither CONF_FROM or CONF_TO are specified,
@@ -122,49 +356,29 @@ async def async_attach_trigger(
     match_all = all(
         item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
     )
+    # A period started by a change from a state ends when the state changes
+    # back to it, otherwise when the state changes from the new state
+    same_state_changed_from = CONF_FROM in config and CONF_TO not in config
     unsub_track_same: dict[str, Callable[[], None]] = {}
     period: dict[str, timedelta] = {}
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action, f"state trigger {trigger_info}")
+    engine = _async_get_state_trigger_engine(hass)
 
     trigger_data = trigger_info["trigger_data"]
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData],
+        old_value: str | None,
+        new_value: str | None,
+    ) -> None:
+        """Call the action for a state change which matches the trigger."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -219,20 +433,41 @@ async def async_attach_trigger(
             else:
                 cur_value = new_st.attributes.get(attribute)
 
-            if CONF_FROM in config and CONF_TO not in config:
+            if same_state_changed_from:
                 return cur_value != old_value
 
             return cur_value == new_value
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
+        same_value = old_value if same_state_changed_from else new_value
+        try:
+            same_state_key: Hashable | None = (
+                attribute,
+                same_state_changed_from,
+                same_value,
+            )
+            hash(same_state_key)
+        except TypeError:
+            same_state_key = None
+
+        unsub_track_same[entity] = engine.async_track_same_state(
+            entity,
             period[entity],
             call_action,
             _check_same_state,
-            entity_ids=entity,
+            same_state_key,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = engine.async_add_trigger(
+        entity_ids,
+        _StateTrigger(
+            attribute,
+            match_from_state,
+            match_to_state,
+            None if from_key is None or to_key is None else (from_key, to_key),
+            match_all,
+            state_automation_listener,
+        ),
+    )
 
     @callback
     def async_remove() -> None:
@@ -0,0 +1,158 @@
+"""Adapt the recorder commit interval and batch size to the load."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import time
+from typing import Any
+
+from homeassistant.const import (
+    EVENT_CALL_SERVICE,
+    EVENT_COMPONENT_LOADED,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.util.event_type import EventType
+
+from .const import MAX_QUEUE_BACKLOG_MIN_VALUE
+
+# Upper bounds in seconds of the commit duration histogram buckets,
+# the last bucket counts all commits slower than the last bound
+COMMIT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# When the backlog is above the high watermark we widen the commit
+# interval and the batch size, once it is back below the low watermark
+# we narrow them again until they reach the configured values.
+BACKLOG_HIGH_WATERMARK = 1000
+BACKLOG_LOW_WATERMARK = 100
+
+# When the backlog keeps growing we drop the low priority event types
+# before the recorder has to give up recording entirely.
+DROP_LOW_PRIORITY_BACKLOG = MAX_QUEUE_BACKLOG_MIN_VALUE // 2
+LOW_PRIORITY_EVENT_TYPES: set[EventType[Any] | str] = {
+    EVENT_CALL_SERVICE,
+    EVENT_COMPONENT_LOADED,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+}
+
+MAX_COMMIT_INTERVAL = 30
+MIN_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 16000
+
+# Minimum number of seconds between two events per second samples
+EVENTS_PER_SECOND_SAMPLE_INTERVAL = 10
+
+
+class RecorderBackpressure:
+    """Track the recorder load and adapt how often it commits.
+
+    The commit interval and batch size are only ever widened beyond the
+    configured commit interval while the recorder is behind, so a recorder
+    that keeps up behaves exactly as configured.
+
+    The methods are called from the recorder thread unless noted otherwise.
+    """
+
+    def __init__(self, commit_interval: int) -> None:
+        """Initialize the backpressure tracker."""
+        self.base_commit_interval = commit_interval
+        self.commit_interval: float = commit_interval
+        self.batch_size = MIN_BATCH_SIZE
+        self.commit_duration_histogram = [0] * (len(COMMIT_DURATION_BUCKETS) + 1)
+        self.last_commit_duration = 0.0
+        self.events_per_second = 0.0
+        self.dropping_low_priority_events = False
+        self._events_since_commit = 0
+        self._last_commit = time.monotonic()
+        self._sample_events = 0
+        self._sample_start = self._last_commit
+
+    def event_processed(self) -> None:
+        """Count an event that was added to the session."""
+        self._events_since_commit += 1
+
+    def should_commit(self, queue_empty: bool) -> bool:
+        """Return if the session should be committed after an event."""
+        if not self.commit_interval or (
+            # There is no commit timer when the configured commit interval
+            # is zero so we commit as soon as the recorder has caught up
+            queue_empty and not self.base_commit_interval
+        ):
+            return True
+        if self.commit_interval <= self.base_commit_interval:
+            # The recorder keeps up, the commit timer commits the session
+            return False
+        return (
+            self._events_since_commit >= self.batch_size
+            or time.monotonic() - self._last_commit >= self.commit_interval
+        )
+
+    def should_commit_on_interval(self) -> bool:
+        """Return if a commit requested by the commit timer should happen.
+
+        The timer runs at the configured commit interval so commits are
+        skipped until the widened interval has passed. This is called
+        from the event loop.
+        """
+        return (
+            self.commit_interval <= self.base_commit_interval
+            or time.monotonic() - self._last_commit >= self.commit_interval
+        )
+
+    def commit_done(self, duration: float, backlog: int) -> None:
+        """Record a commit and adapt the commit interval and batch size."""
+        now = time.monotonic()
+        self.last_commit_duration = duration
+        self.commit_duration_histogram[
+            bisect_left(COMMIT_DURATION_BUCKETS, duration)
+        ] += 1
+        self._sample_events += self._events_since_commit
+        self._events_since_commit = 0
+        self._last_commit = now
+        if (elapsed := now - self._sample_start) >= EVENTS_PER_SECOND_SAMPLE_INTERVAL:
+            self.events_per_second = self._sample_events / elapsed
+            self._sample_events = 0
+            self._sample_start = now
+
+        if backlog >= BACKLOG_HIGH_WATERMARK or (
+            # The recorder is behind and committing takes longer
+            # than half of the interval so it will not catch up
+            backlog > BACKLOG_LOW_WATERMARK and duration * 2 > self.commit_interval
+        ):
+            self.commit_interval = min(
+                max(self.commit_interval * 2, 1), MAX_COMMIT_INTERVAL
+            )
+            self.batch_size = min(self.batch_size * 2, MAX_BATCH_SIZE)
+        elif backlog <= BACKLOG_LOW_WATERMARK:
+            if (commit_interval := self.commit_interval / 2) < max(
+                self.base_commit_interval, 1
+            ):
+                commit_interval = self.base_commit_interval
+            self.commit_interval = commit_interval
+            self.batch_size = max(self.batch_size // 2, MIN_BATCH_SIZE)
+
+    def should_drop_low_priority_events(self, backlog: int) -> bool:
+        """Return if low priority events should be dropped for the backlog."""
+        if self.dropping_low_priority_events:
+            return backlog > BACKLOG_LOW_WATERMARK
+        return backlog >= DROP_LOW_PRIORITY_BACKLOG
+
+    def commit_duration_percentile(self, percentile: float) -> float | None:
+        """Return the upper bound of the bucket containing the percentile.
+
+        Returns None if there have been no commits or the percentile
+        falls in the last, unbounded bucket. This is called from the
+        event loop.
+        """
+        if not (total := sum(histogram := self.commit_duration_histogram)):
+            return None
+        target = total * percentile / 100
+        count = 0
+        for bucket, bucket_count in zip(
+            COMMIT_DURATION_BUCKETS, histogram, strict=False
+        ):
+            count += bucket_count
+            if count >= target:
+                return bucket
+        return None
@@ -0,0 +1,263 @@
+"""Bulk insert pipeline for the recorder event session."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, cast
+
+from sqlalchemy import Column, Table, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+_STATES_META_TABLE = cast(Table, StatesMeta.__table__)
+_STATE_ATTRIBUTES_TABLE = cast(Table, StateAttributes.__table__)
+_EVENT_TYPES_TABLE = cast(Table, EventTypes.__table__)
+_EVENT_DATA_TABLE = cast(Table, EventData.__table__)
+_EVENTS_TABLE = cast(Table, Events.__table__)
+_STATES_TABLE = cast(Table, States.__table__)
+
+type _RowObject = (
+    EventData | Events | EventTypes | StateAttributes | States | StatesMeta
+)
+
+
+def _states_meta_params(db_states_meta: StatesMeta) -> dict[str, Any]:
+    """Return the insert parameters for a StatesMeta row."""
+    return {"entity_id": db_states_meta.entity_id}
+
+
+def _state_attributes_params(db_state_attributes: StateAttributes) -> dict[str, Any]:
+    """Return the insert parameters for a StateAttributes row."""
+    return {
+        "hash": db_state_attributes.hash,
+        "shared_attrs": db_state_attributes.shared_attrs,
+    }
+
+
+def _event_types_params(db_event_types: EventTypes) -> dict[str, Any]:
+    """Return the insert parameters for an EventTypes row."""
+    return {"event_type": db_event_types.event_type}
+
+
+def _event_data_params(db_event_data: EventData) -> dict[str, Any]:
+    """Return the insert parameters for an EventData row."""
+    return {"hash": db_event_data.hash, "shared_data": db_event_data.shared_data}
+
+
+def _events_params(db_event: Events) -> dict[str, Any]:
+    """Return the insert parameters for an Events row.
+
+    The ids of the related rows must already be assigned.
+    """
+    event_type_rel = db_event.event_type_rel
+    event_data_rel = db_event.event_data_rel
+    return {
+        "origin_idx": db_event.origin_idx,
+        "time_fired_ts": db_event.time_fired_ts,
+        "context_id_bin": db_event.context_id_bin,
+        "context_user_id_bin": db_event.context_user_id_bin,
+        "context_parent_id_bin": db_event.context_parent_id_bin,
+        "event_type_id": (
+            db_event.event_type_id
+            if event_type_rel is None
+            else event_type_rel.event_type_id
+        ),
+        "data_id": (
+            db_event.data_id if event_data_rel is None else event_data_rel.data_id
+        ),
+    }
+
+
+def _states_params(db_state: States) -> dict[str, Any]:
+    """Return the insert parameters for a States row.
+
+    The ids of the related rows, including the old state,
+    must already be assigned.
+    """
+    old_state = db_state.old_state
+    state_attributes = db_state.state_attributes
+    states_meta_rel = db_state.states_meta_rel
+    return {
+        "entity_id": db_state.entity_id,
+        "state": db_state.state,
+        "attributes": db_state.attributes,
+        "last_updated_ts": db_state.last_updated_ts,
+        "last_changed_ts": db_state.last_changed_ts,
+        "last_reported_ts": db_state.last_reported_ts,
+        "old_state_id": (
+            db_state.old_state_id if old_state is None else old_state.state_id
+        ),
+        "attributes_id": (
+            db_state.attributes_id
+            if state_attributes is None
+            else state_attributes.attributes_id
+        ),
+        "origin_idx": db_state.origin_idx,
+        "context_id_bin": db_state.context_id_bin,
+        "context_user_id_bin": db_state.context_user_id_bin,
+        "context_parent_id_bin": db_state.context_parent_id_bin,
+        "metadata_id": (
+            db_state.metadata_id
+            if states_meta_rel is None
+            else states_meta_rel.metadata_id
+        ),
+    }
+
+
+def _insert_returning_ids[_RowT: _RowObject](
+    session: Session,
+    table: Table,
+    id_column: Column[int],
+    rows: list[_RowT],
+    params: Callable[[_RowT], dict[str, Any]],
+) -> None:
+    """Insert rows in executemany batches and assign the generated ids."""
+    id_name = id_column.name
+    result = session.execute(
+        insert(table).returning(id_column, sort_by_parameter_order=True),
+        [params(row) for row in rows],
+    )
+    for row, row_id in zip(rows, result.scalars(), strict=True):
+        setattr(row, id_name, row_id)
+
+
+def _states_by_generation(db_states: Iterable[States]) -> list[list[States]]:
+    """Split states into generations that only link to earlier generations.
+
+    A state can link its old_state to a state recorded earlier in the
+    same commit, which must be inserted first so its state_id is known.
+    """
+    generation_by_state: dict[int, int] = {}
+    generations: list[list[States]] = []
+
+    def _place(db_state: States) -> int:
+        if (generation := generation_by_state.get(id(db_state))) is not None:
+            return generation
+        old_state = db_state.old_state
+        # The old state may not have been added when its attributes could not
+        # be serialized, the ORM would cascade it in so we insert it as well.
+        generation = 0 if old_state is None else _place(old_state) + 1
+        generation_by_state[id(db_state)] = generation
+        if generation == len(generations):
+            generations.append([])
+        generations[generation].append(db_state)
+        return generation
+
+    for db_state in db_states:
+        _place(db_state)
+    return generations
+
+
+class BulkInsertWriter:
+    """Accumulate rows for the event session and insert them in batches.
+
+    Rows are kept out of the session so the ORM unit of work does not
+    have to track them. When the session is committed the rows are
+    inserted table by table with multi-row INSERT statements and the
+    generated ids are assigned back to the row objects so the table
+    managers can move them from pending to committed the same way as
+    when the rows are flushed by the ORM.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert writer."""
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._event_types: list[EventTypes] = []
+        self._event_data: list[EventData] = []
+        self._events: list[Events] = []
+        self._states: list[States] = []
+        self._rows_by_type: dict[type, list[Any]] = {
+            StatesMeta: self._states_meta,
+            StateAttributes: self._state_attributes,
+            EventTypes: self._event_types,
+            EventData: self._event_data,
+            Events: self._events,
+            States: self._states,
+        }
+
+    def add(self, obj: Any) -> bool:
+        """Add a row to be inserted at the next flush.
+
+        Returns False if the type of the row is not handled by the writer
+        and the row must be added to the session instead.
+        """
+        if (rows := self._rows_by_type.get(type(obj))) is None:
+            return False
+        rows.append(obj)
+        return True
+
+    def flush(self, session: Session) -> None:
+        """Insert all pending rows in the current transaction of the session.
+
+        If an insert fails the transaction is rolled back and the pending
+        rows are kept so the flush can be retried.
+        """
+        try:
+            self._flush(session)
+        except Exception:
+            session.rollback()
+            raise
+        self.reset()
+
+    def _flush(self, session: Session) -> None:
+        """Insert all pending rows."""
+        if self._states_meta:
+            _insert_returning_ids(
+                session,
+                _STATES_META_TABLE,
+                _STATES_META_TABLE.c.metadata_id,
+                self._states_meta,
+                _states_meta_params,
+            )
+        if self._state_attributes:
+            _insert_returning_ids(
+                session,
+                _STATE_ATTRIBUTES_TABLE,
+                _STATE_ATTRIBUTES_TABLE.c.attributes_id,
+                self._state_attributes,
+                _state_attributes_params,
+            )
+        if self._event_types:
+            _insert_returning_ids(
+                session,
+                _EVENT_TYPES_TABLE,
+                _EVENT_TYPES_TABLE.c.event_type_id,
+                self._event_types,
+                _event_types_params,
+            )
+        if self._event_data:
+            _insert_returning_ids(
+                session,
+                _EVENT_DATA_TABLE,
+                _EVENT_DATA_TABLE.c.data_id,
+                self._event_data,
+                _event_data_params,
+            )
+        if self._events:
+            # No one links to the event_id so we can skip RETURNING
+            session.execute(
+                insert(_EVENTS_TABLE),
+                [_events_params(db_event) for db_event in self._events],
+            )
+        for generation in _states_by_generation(self._states):
+            _insert_returning_ids(
+                session,
+                _STATES_TABLE,
+                _STATES_TABLE.c.state_id,
+                generation,
+                _states_params,
+            )
+
+    def reset(self) -> None:
+        """Discard all pending rows."""
+        for rows in self._rows_by_type.values():
+            rows.clear()
@@ -39,6 +39,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -50,6 +51,8 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .backpressure import LOW_PRIORITY_EVENT_TYPES, RecorderBackpressure
+from .bulk_insert import BulkInsertWriter
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -87,6 +90,7 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge_scheduler import PurgeScheduler
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -186,6 +190,8 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.backpressure = RecorderBackpressure(commit_interval)
+        self.purge_scheduler = PurgeScheduler(hass)
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -208,10 +214,17 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        # The event types the event listener does not queue, which also
+        # includes the low priority event types while the backlog is too large
+        self._skipped_event_types = set(exclude_event_types)
 
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Insert rows with multi-row INSERT statements instead of
+        # flushing them through the ORM when the database supports it
+        self.use_bulk_insert = True
+        self._bulk_insert_writer: BulkInsertWriter | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -236,6 +249,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._purge_slice_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -278,6 +292,26 @@ class Recorder(threading.Thread):
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_purge_slice(self, task: PurgeTask, delay: float) -> None:
+        """Add the next slice of a purge to the queue after a delay."""
+        self.hass.loop.call_soon_threadsafe(self._async_queue_purge_slice, task, delay)
+
+    @callback
+    def _async_queue_purge_slice(self, task: PurgeTask, delay: float) -> None:
+        """Add the next slice of a purge to the queue after a delay."""
+        if self.hass.is_stopping:
+            # The purge is resumed after the restart
+            return
+
+        @callback
+        def _async_queue_task(_: datetime) -> None:
+            self._purge_slice_listener = None
+            self.queue_task(task)
+
+        self._purge_slice_listener = async_call_later(
+            self.hass, delay, _async_queue_task
+        )
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -301,13 +335,13 @@ class Recorder(threading.Thread):
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
-        exclude_event_types = self.exclude_event_types
+        skipped_event_types = self._skipped_event_types
         queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
             """Listen for new events and put them in the process queue."""
-            if event.event_type in exclude_event_types:
+            if event.event_type in skipped_event_types:
                 return
 
             if entity_filter is None or not (
@@ -355,6 +389,7 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            and self.backpressure.should_commit_on_interval()
         ):
             self.queue_task(COMMIT_TASK)
 
@@ -373,6 +408,9 @@ class Recorder(threading.Thread):
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
         if not self._reached_max_backlog():
+            self._async_set_dropping_low_priority_events(
+                self.backpressure.should_drop_low_priority_events(self.backlog)
+            )
             return
         _LOGGER.error(
             (
@@ -385,6 +423,26 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_set_dropping_low_priority_events(self, drop: bool) -> None:
+        """Start or stop dropping low priority events to reduce the backlog."""
+        backpressure = self.backpressure
+        if drop is backpressure.dropping_low_priority_events:
+            return
+        backpressure.dropping_low_priority_events = drop
+        if drop:
+            _LOGGER.warning(
+                "The recorder backlog queue reached %s events; low priority events "
+                "will not be recorded until the recorder has caught up",
+                self.backlog,
+            )
+            self._skipped_event_types.update(LOW_PRIORITY_EVENT_TYPES)
+            return
+        _LOGGER.info("The recorder has caught up; recording all events again")
+        self._skipped_event_types.difference_update(
+            LOW_PRIORITY_EVENT_TYPES - self.exclude_event_types
+        )
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -427,6 +485,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._purge_slice_listener:
+            self._purge_slice_listener()
+            self._purge_slice_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -662,6 +723,17 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+        # Resume a purge which was interrupted by a restart
+        if (pending_purge := self.purge_scheduler.pending_purge) and (
+            purge_before := dt_util.parse_datetime(pending_purge["purge_before"])
+        ):
+            _LOGGER.debug("Resuming purge before %s", purge_before)
+            self.queue_task(
+                PurgeTask(
+                    purge_before, pending_purge["repack"], pending_purge["apply_filter"]
+                )
+            )
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -694,10 +766,11 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
+    def _add_to_session(self, session: Session, obj: Any) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_insert_writer is None or not self._bulk_insert_writer.add(obj):
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -1029,8 +1102,11 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+        backpressure = self.backpressure
+        backpressure.event_processed()
+        # Commit if the commit interval is zero, or a batch is complete
+        # while the commit interval is widened because of a backlog
+        if backpressure.should_commit(self._queue.empty()):
             self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
@@ -1207,6 +1283,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
+
+        if self._bulk_insert_writer is not None:
+            self._bulk_insert_writer.flush(session)
 
         if (
             pending_last_reported
@@ -1226,6 +1306,16 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        backpressure = self.backpressure
+        backpressure.commit_done(time.monotonic() - start, backlog := self.backlog)
+        if (
+            backpressure.should_drop_low_priority_events(backlog)
+            is not backpressure.dropping_low_priority_events
+        ):
+            self.hass.add_job(
+                self._async_set_dropping_low_priority_events,
+                not backpressure.dropping_low_priority_events,
+            )
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1263,6 +1353,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_insert_writer is not None:
+            self._bulk_insert_writer.reset()
 
         if not self.event_session:
             return
@@ -1426,6 +1518,11 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if (
+            self.use_bulk_insert
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            self._bulk_insert_writer = BulkInsertWriter()
         _LOGGER.debug("Connected to recorder database")
 
     def _close_connection(self) -> None:
@@ -1434,6 +1531,7 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        self._bulk_insert_writer = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import Any
+from math import ceil
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
+from ..core import MAX_DB_EXECUTOR_WORKERS
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .columnar import (
+    HistoryColumns,
+    compressed_states_to_columns,
+    history_columns_to_json,
+)
+from .const import (
+    MIN_ENTITIES_PER_QUERY_CHUNK,
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+)
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columns as _modern_get_significant_states_columns,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,10 +37,14 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "HistoryColumns",
+    "async_get_significant_states_columns",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columns",
     "get_significant_states_with_session",
+    "history_columns_to_json",
     "state_changes_during_period",
 ]
 
@@ -115,6 +132,103 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, HistoryColumns]:
+    """Return a dict of significant states during a time period as columns."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        return compressed_states_to_columns(
+            cast(
+                dict[str, list[dict[str, Any]]],
+                _legacy_get_significant_states(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    True,
+                ),
+            )
+        )
+    return _modern_get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
+async def async_get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, HistoryColumns]:
+    """Return significant states as columns by querying chunks of entities.
+
+    The history of an entity does not depend on the other entities so
+    large queries are split into chunks of entities which are queried
+    concurrently on the database executor. Each executor thread has its
+    own database connection, which are readers that do not block each
+    other with SQLite in WAL mode or separate pooled connections with
+    MySQL and PostgreSQL. The results are merged in the order of the
+    requested entities.
+    """
+    chunk_size = max(
+        ceil(len(entity_ids) / MAX_DB_EXECUTOR_WORKERS), MIN_ENTITIES_PER_QUERY_CHUNK
+    )
+    instance = get_instance(hass)
+    results = await asyncio.gather(
+        *(
+            instance.async_add_executor_job(
+                get_significant_states_columns,
+                hass,
+                start_time,
+                end_time,
+                entity_ids[idx : idx + chunk_size],
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+            for idx in range(0, len(entity_ids), chunk_size)
+        )
+    )
+    if len(results) == 1:
+        return results[0]
+    columns: dict[str, HistoryColumns] = {}
+    for result in results:
+        columns.update(result)
+    return {
+        entity_id: entity_columns
+        for entity_id in entity_ids
+        if (entity_columns := columns.get(entity_id)) is not None
+    }
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -0,0 +1,264 @@
+"""Columnar history results serialized straight to the compressed state format."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from sqlalchemy.engine.row import Row
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.helpers.json import json_bytes, json_fragment
+from homeassistant.util.json import json_loads_object
+
+from ..models.state_attributes import EMPTY_JSON_OBJECT
+
+_LOGGER = logging.getLogger(__name__)
+
+_EMPTY_ATTRIBUTES = json_fragment(EMPTY_JSON_OBJECT)
+
+
+@dataclass(slots=True)
+class HistoryColumns:
+    """The states of an entity stored as parallel columns.
+
+    The attributes column only covers the leading states since a minimal
+    response only has the attributes of the first state. The
+    last_changed_ts column is sparse and keyed by the index of the state
+    since it is only set when it differs from last_updated_ts.
+    """
+
+    state: list[str | None] = field(default_factory=list)
+    last_updated_ts: list[float] = field(default_factory=list)
+    attributes: list[json_fragment] = field(default_factory=list)
+    last_changed_ts: dict[int, float] = field(default_factory=dict)
+
+    def append(
+        self,
+        state: str | None,
+        last_updated_ts: float,
+        attributes: json_fragment | None = None,
+        last_changed_ts: float | None = None,
+    ) -> None:
+        """Append a state.
+
+        Attributes can only be added as long as all previous states have them.
+        """
+        if attributes is not None:
+            if len(self.attributes) != len(self.state):
+                raise ValueError("Attributes must be added to all leading states")
+            self.attributes.append(attributes)
+        if last_changed_ts is not None:
+            self.last_changed_ts[len(self.state)] = last_changed_ts
+        self.state.append(state)
+        self.last_updated_ts.append(last_updated_ts)
+
+    def as_compressed_states(self) -> list[dict[str, Any]]:
+        """Return the states in the compressed state format."""
+        states = self.state
+        last_updated = self.last_updated_ts
+        attributes = self.attributes
+        with_attributes = len(attributes)
+        compressed_states: list[dict[str, Any]] = [
+            {
+                COMPRESSED_STATE_STATE: state,
+                COMPRESSED_STATE_ATTRIBUTES: attrs,
+                COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+            }
+            for state, attrs, last_updated_ts in zip(
+                states, attributes, last_updated, strict=False
+            )
+        ]
+        if with_attributes < len(states):
+            compressed_states.extend(
+                [
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                    for state, last_updated_ts in zip(
+                        states[with_attributes:],
+                        last_updated[with_attributes:],
+                        strict=True,
+                    )
+                ]
+            )
+        for idx, last_changed_ts in self.last_changed_ts.items():
+            compressed_states[idx][COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+        return compressed_states
+
+
+def history_columns_to_json(
+    columns: dict[str, HistoryColumns],
+) -> dict[str, json_fragment]:
+    """Serialize the compressed states of each entity to json.
+
+    Each entity is serialized on its own so the compressed states of
+    only one entity are alive at a time, the fragments are embedded
+    in the response without being copied more than once.
+    """
+    return {
+        entity_id: json_fragment(json_bytes(entity_columns.as_compressed_states()))
+        for entity_id, entity_columns in columns.items()
+    }
+
+
+class HistoryColumnsBuilder:
+    """Read sorted history rows into columns per entity.
+
+    States are interned and the raw attributes json of the database is
+    embedded as a json fragment instead of being decoded to a dict and
+    encoded again.
+    """
+
+    __slots__ = ("_attributes_cache", "_states_cache")
+
+    def __init__(self) -> None:
+        """Initialize the builder."""
+        self._states_cache: dict[str | None, str | None] = {}
+        self._attributes_cache: dict[str, json_fragment] = {}
+
+    def _attributes(self, source: str | None) -> json_fragment:
+        """Return the attributes of a row as a json fragment."""
+        if not source or source == EMPTY_JSON_OBJECT:
+            return _EMPTY_ATTRIBUTES
+        if (attributes := self._attributes_cache.get(source)) is not None:
+            return attributes
+        try:
+            # Make sure the attributes are valid before embedding them
+            json_loads_object(source)
+        except ValueError:
+            _LOGGER.exception("Error converting row to state attributes: %s", source)
+            attributes = _EMPTY_ATTRIBUTES
+        else:
+            attributes = json_fragment(source)
+        self._attributes_cache[source] = attributes
+        return attributes
+
+    def _add_row(
+        self,
+        columns: HistoryColumns,
+        row: Row,
+        start_time_ts: float | None,
+        last_changed_idx: int | None,
+        attributes_idx: int | None,
+        missing_attributes: json_fragment | None,
+    ) -> None:
+        """Add a row with all its columns.
+
+        The state is at index 1 and last_updated_ts at index 2 of the row,
+        the start time state has a zero last_updated_ts and last_changed_ts.
+        """
+        last_updated_ts: float = row[2] or start_time_ts  # type: ignore[assignment]
+        last_changed_ts: float | None = None
+        if (
+            last_changed_idx is not None
+            and (row_last_changed_ts := row[last_changed_idx])
+            and row_last_changed_ts != last_updated_ts
+        ):
+            last_changed_ts = row_last_changed_ts
+        columns.append(
+            self._states_cache.setdefault(state := row[1], state),
+            last_updated_ts,
+            missing_attributes
+            if attributes_idx is None
+            else self._attributes(row[attributes_idx]),
+            last_changed_ts,
+        )
+
+    def add_rows(
+        self,
+        columns: HistoryColumns,
+        rows: Iterable[Row],
+        start_time_ts: float | None,
+        last_changed_idx: int | None,
+        attributes_idx: int | None,
+    ) -> None:
+        """Add all rows of an entity to the columns.
+
+        The attributes are always included and empty when not queried.
+        This is the same as calling _add_row for each row without the
+        overhead of the calls since there can be millions of rows.
+        """
+        states_cache = self._states_cache
+        attributes_cache = self._attributes_cache
+        get_attributes = self._attributes
+        column_states = columns.state
+        column_last_updated_ts = columns.last_updated_ts
+        column_attributes = columns.attributes
+        column_last_changed_ts = columns.last_changed_ts
+        for row in rows:
+            last_updated_ts: float = row[2] or start_time_ts  # type: ignore[assignment]
+            if (
+                last_changed_idx is not None
+                and (last_changed_ts := row[last_changed_idx])
+                and last_changed_ts != last_updated_ts
+            ):
+                column_last_changed_ts[len(column_states)] = last_changed_ts
+            column_states.append(states_cache.setdefault(state := row[1], state))
+            column_last_updated_ts.append(last_updated_ts)
+            if attributes_idx is None:
+                column_attributes.append(_EMPTY_ATTRIBUTES)
+            elif (
+                attributes := attributes_cache.get(source := row[attributes_idx])
+            ) is None:
+                column_attributes.append(get_attributes(source))
+            else:
+                column_attributes.append(attributes)
+
+    def add_minimal_rows(
+        self,
+        columns: HistoryColumns,
+        rows: Iterable[Row],
+        start_time_ts: float | None,
+        last_changed_idx: int | None,
+        attributes_idx: int | None,
+    ) -> None:
+        """Add the rows of an entity to the columns for a minimal response.
+
+        Only the first state is complete, the following states only
+        have the state and last_updated_ts and are only added when
+        the state changes.
+        """
+        rows = iter(rows)
+        if (first_row := next(rows, None)) is None:
+            return
+        self._add_row(
+            columns, first_row, start_time_ts, last_changed_idx, attributes_idx, None
+        )
+        prev_state = columns.state[-1]
+        changed_rows = [row for row in rows if prev_state != (prev_state := row[1])]
+        states_cache = self._states_cache
+        columns.state.extend(
+            [states_cache.setdefault(state := row[1], state) for row in changed_rows]
+        )
+        columns.last_updated_ts.extend([row[2] for row in changed_rows])
+
+
+def compressed_states_to_columns(
+    states: dict[str, list[dict[str, Any]]],
+) -> dict[str, HistoryColumns]:
+    """Convert compressed states to columns.
+
+    This is only used for databases that have not been migrated to the
+    states_meta table yet since they are queried by the legacy history.
+    """
+    result: dict[str, HistoryColumns] = {}
+    for entity_id, compressed_states in states.items():
+        result[entity_id] = columns = HistoryColumns()
+        for comp_state in compressed_states:
+            attributes = comp_state.get(COMPRESSED_STATE_ATTRIBUTES)
+            columns.append(
+                comp_state[COMPRESSED_STATE_STATE],
+                comp_state[COMPRESSED_STATE_LAST_UPDATED],
+                None if attributes is None else json_fragment(json_bytes(attributes)),
+                comp_state.get(COMPRESSED_STATE_LAST_CHANGED),
+            )
+    return result
@@ -19,3 +19,7 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Large history queries are split into chunks of at least this many
+# entities which are queried concurrently on the database executor
+MIN_ENTITIES_PER_QUERY_CHUNK = 4
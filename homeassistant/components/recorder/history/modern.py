@@ -38,6 +38,7 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .columnar import HistoryColumns, HistoryColumnsBuilder
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -229,6 +230,90 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        result := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, HistoryColumns]:
+    """Return significant states during UTC period start_time - end_time as columns.
+
+    The columns serialize to the same result as get_significant_states
+    with compressed_state_format without creating a state for each row.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            result := _execute_significant_states_stmt(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = result
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            significant_changes_only,
+            no_attributes,
+        )
+
+
+def _execute_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Query the significant states of the entities.
+
+    Returns the rows sorted by metadata_id and last_updated_ts, the
+    start time if the states at the start time are included and the
+    metadata_ids of the entities or None if none of them are recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +322,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +360,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -816,3 +897,57 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> dict[str, HistoryColumns]:
+    """Convert SQL results into columns per entity.
+
+    This is the columnar version of _sorted_states_to_dict with
+    compressed_state_format and the states must be sorted the same way.
+    """
+    # The row layout matches _stmt_and_join_attributes
+    last_changed_idx = None if significant_changes_only else 3
+    attributes_idx = None if no_attributes else 3 if significant_changes_only else 4
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterable[Row]]] = ((metadata_id, states),)
+    else:
+        states_iter = groupby(states, itemgetter(_FIELD_MAP["metadata_id"]))
+
+    builder = HistoryColumnsBuilder()
+    columns_by_entity_id: dict[str, HistoryColumns] = {}
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        columns = columns_by_entity_id[entity_id] = HistoryColumns()
+        if (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ):
+            builder.add_rows(
+                columns, group, start_time_ts, last_changed_idx, attributes_idx
+            )
+        else:
+            builder.add_minimal_rows(
+                columns, group, start_time_ts, last_changed_idx, attributes_idx
+            )
+
+    # Keep the order of the requested entity ids and
+    # filter out the entities which had 0 results.
+    return {
+        entity_id: entity_columns
+        for entity_id in entity_ids
+        if (entity_columns := columns_by_entity_id.get(entity_id))
+        and entity_columns.state
+    }
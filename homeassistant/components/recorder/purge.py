@@ -66,7 +66,32 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    The purge stops once the time budget of the slice is used and
+    returns False if it has not finished.
     """
+    purge_scheduler = instance.purge_scheduler
+    purge_scheduler.start_slice(purge_before, repack, apply_filter)
+    finished = _purge_old_data(
+        instance,
+        purge_before,
+        repack,
+        apply_filter,
+        events_batch_size,
+        states_batch_size,
+    )
+    purge_scheduler.end_slice(finished)
+    return finished
+
+
+def _purge_old_data(
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+) -> bool:
+    """Purge a slice of the events and states older than purge_before."""
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -192,15 +217,22 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    purge_scheduler = instance.purge_scheduler
     for _ in range(states_batch_size):
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, purge_scheduler.batch_size(max_bind_vars)
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        purge_scheduler.batch_done(
+            max_bind_vars, len(state_ids), time.monotonic() - start
+        )
+        if purge_scheduler.slice_budget_exceeded():
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -227,15 +259,23 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    purge_scheduler = instance.purge_scheduler
     for _ in range(events_batch_size):
+        if purge_scheduler.slice_budget_exceeded():
+            # The states used the time budget of the slice
+            break
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, purge_scheduler.batch_size(max_bind_vars)
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        purge_scheduler.batch_done(
+            max_bind_vars, len(event_ids), time.monotonic() - start
+        )
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
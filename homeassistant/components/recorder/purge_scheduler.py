@@ -0,0 +1,138 @@
+"""Run purges in small time budgeted slices."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import time
+from typing import Any, TypedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+PURGE_STORAGE_KEY = f"{DOMAIN}.purge"
+PURGE_STORAGE_VERSION = 1
+
+# Seconds a purge slice may use the database before the purge
+# yields to the events and tasks waiting in the queue
+PURGE_SLICE_TIME_BUDGET = 1.0
+
+# A slice which used its whole time budget is followed by a pause
+# of this factor of its duration before the next slice is queued
+PURGE_SLICE_PAUSE_FACTOR = 1.0
+
+# A batch which takes longer than the target duration halves the
+# batch size, a batch which takes less than a quarter doubles it
+PURGE_BATCH_TARGET_DURATION = 0.25
+MIN_PURGE_BATCH_SIZE = 100
+
+
+class PendingPurge(TypedDict):
+    """A purge which has not finished yet."""
+
+    purge_before: str
+    repack: bool
+    apply_filter: bool
+
+
+class PurgeScheduler:
+    """Track the progress of a purge and split it in slices.
+
+    The batch size adapts to how long the batches take to delete, so a
+    slow database deletes less rows per statement and locks the tables
+    for a shorter time. The purge which is in progress is stored so it
+    is resumed after a restart.
+
+    The methods are called from the recorder thread unless noted otherwise.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the purge scheduler."""
+        self.hass = hass
+        self.purge_before: datetime | None = None
+        self.pending_purge: PendingPurge | None = None
+        self.rows_purged = 0
+        self.slices = 0
+        self.last_batch_duration = 0.0
+        self.last_purge_finished: datetime | None = None
+        self.slice_pause = 0.0
+        self._batch_size: int | None = None
+        self._slice_start = 0.0
+        self._store: Store[PendingPurge] = Store(
+            hass, PURGE_STORAGE_VERSION, PURGE_STORAGE_KEY, private=True
+        )
+
+    async def async_load(self) -> None:
+        """Load the purge which was in progress before the restart."""
+        self.pending_purge = await self._store.async_load()
+
+    def batch_size(self, max_bind_vars: int) -> int:
+        """Return the number of rows to select per batch."""
+        if self._batch_size is None:
+            return max_bind_vars
+        return min(self._batch_size, max_bind_vars)
+
+    def start_slice(
+        self, purge_before: datetime, repack: bool, apply_filter: bool
+    ) -> None:
+        """Start a slice of a purge."""
+        self._slice_start = time.monotonic()
+        if purge_before != self.purge_before:
+            self.purge_before = purge_before
+            self.rows_purged = 0
+            self.slices = 0
+            self._async_save(
+                {
+                    "purge_before": purge_before.isoformat(),
+                    "repack": repack,
+                    "apply_filter": apply_filter,
+                }
+            )
+        self.slices += 1
+
+    def slice_budget_exceeded(self) -> bool:
+        """Return if the slice has used its time budget."""
+        return time.monotonic() - self._slice_start >= PURGE_SLICE_TIME_BUDGET
+
+    def batch_done(self, max_bind_vars: int, rows: int, duration: float) -> None:
+        """Record a purged batch and adapt the batch size."""
+        self.rows_purged += rows
+        self.last_batch_duration = duration
+        batch_size = self.batch_size(max_bind_vars)
+        if duration > PURGE_BATCH_TARGET_DURATION:
+            self._batch_size = max(batch_size // 2, MIN_PURGE_BATCH_SIZE)
+        elif duration * 4 < PURGE_BATCH_TARGET_DURATION and rows >= batch_size:
+            self._batch_size = min(batch_size * 2, max_bind_vars)
+
+    def end_slice(self, finished: bool) -> None:
+        """End a slice of a purge."""
+        slice_duration = time.monotonic() - self._slice_start
+        if finished:
+            self.purge_before = None
+            self.last_purge_finished = dt_util.utcnow()
+            self.slice_pause = 0.0
+            self._async_save(None)
+        elif slice_duration >= PURGE_SLICE_TIME_BUDGET:
+            self.slice_pause = slice_duration * PURGE_SLICE_PAUSE_FACTOR
+        else:
+            self.slice_pause = 0.0
+
+    def _async_save(self, pending_purge: PendingPurge | None) -> None:
+        """Store the purge which is in progress."""
+        self.hass.loop.call_soon_threadsafe(self._async_store, pending_purge)
+
+    @callback
+    def _async_store(self, pending_purge: PendingPurge | None) -> None:
+        """Store the purge which is in progress.
+
+        This is called from the event loop.
+        """
+        self.pending_purge = pending_purge
+        self._store.async_delay_save(self._data_to_save, 0)
+
+    @callback
+    def _data_to_save(self) -> Any:
+        """Return the data to store."""
+        return self.pending_purge
@@ -55,6 +55,41 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_backpressure_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about the recorder load."""
+    backpressure = instance.backpressure
+    backpressure_info: dict[str, Any] = {
+        "queue_backlog": instance.backlog,
+        "events_per_second": round(backpressure.events_per_second, 1),
+        "commit_interval": backpressure.commit_interval,
+    }
+    for percentile in (50, 95):
+        if (
+            duration := backpressure.commit_duration_percentile(percentile)
+        ) is not None:
+            backpressure_info[f"commit_duration_p{percentile}"] = round(duration * 1000)
+    if backpressure.dropping_low_priority_events:
+        backpressure_info["dropping_low_priority_events"] = True
+    return backpressure_info
+
+
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about the progress of the purge."""
+    purge_scheduler = instance.purge_scheduler
+    purge_info: dict[str, Any] = {}
+    if purge_scheduler.purge_before:
+        purge_info["purge_rows_purged"] = purge_scheduler.rows_purged
+        purge_info["purge_slices"] = purge_scheduler.slices
+        purge_info["purge_batch_size"] = purge_scheduler.batch_size(
+            instance.max_bind_vars
+        )
+    if purge_scheduler.last_purge_finished:
+        purge_info["last_purge_finished"] = purge_scheduler.last_purge_finished
+    return purge_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +107,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_backpressure_info(instance)
+        | _async_get_purge_info(instance)
+    )
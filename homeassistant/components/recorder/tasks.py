@@ -128,9 +128,13 @@ class PurgeTask(RecorderTask):
             periodic_db_cleanups(instance)
             return
         # Schedule a new purge task if this one didn't finish
-        instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
-        )
+        task = PurgeTask(self.purge_before, self.repack, self.apply_filter)
+        if slice_pause := instance.purge_scheduler.slice_pause:
+            # Give the database a break after a slice which used its
+            # whole time budget
+            instance.queue_purge_slice(task, slice_pause)
+            return
+        instance.queue_task(task)
 
 
 @dataclass(slots=True)
@@ -375,24 +375,28 @@ async def _async_process_config(
     ) -> tuple[set[int], set[int]]:
         """Find matches between a list of script entities and a list of configurations.
 
-        A script or configuration is only allowed to match at most once to handle
-        the case of multiple scripts with identical configuration.
+        The key of a script is unique, so a script can only match the
+        configuration with the same key.
 
         Returns a tuple of sets of indices: ({script_matches}, {config_matches})
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key = {
+            script_config.key: (config_idx, script_config)
+            for config_idx, script_config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, script_config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            if (
+                script.unique_id is None
+                or (match := script_configs_by_key.pop(script.unique_id, None)) is None
+            ):
+                continue
+            config_idx, script_config = match
+            if script_matches_config(script, script_config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
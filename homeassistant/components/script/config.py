@@ -30,9 +30,14 @@ from homeassistant.const import (
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     async_validate_actions_config,
@@ -40,6 +45,7 @@ from homeassistant.helpers.script import (
 )
 from homeassistant.helpers.selector import validate_selector
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -55,6 +61,11 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "dict"
 
+# The validated scripts by their object id and the content of their configuration
+DATA_VALIDATED_CONFIGS: HassKey[dict[bytes, ScriptConfig]] = HassKey(
+    f"{DOMAIN}_validated_configs"
+)
+
 _MINIMAL_SCRIPT_ENTITY_SCHEMA = vol.Schema(
     {
         CONF_ALIAS: cv.string,
@@ -293,17 +304,94 @@ async def async_validate_config_item(
     return await _async_validate_config_item(hass, object_id, config, True, False)
 
 
+def _config_key(object_id: str, config: Any) -> bytes | None:
+    """Return the key of a script configuration for the validation cache.
+
+    Returns None if the validated configuration can't be reused since
+    blueprint scripts depend on the blueprint.
+    """
+    if not isinstance(config, dict) or is_blueprint_instance_config(config):
+        return None
+    try:
+        return json_bytes([object_id, config])
+    except TypeError:
+        return None
+
+
+@callback
+def _async_registry_changed(
+    event_data: er.EventEntityRegistryUpdatedData | dr.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Filter registry changes which can change the validated configs."""
+    return event_data["action"] != "create"
+
+
+@callback
+def _async_get_validated_configs(hass: HomeAssistant) -> dict[bytes, ScriptConfig]:
+    """Return the validated configs of the previous validation.
+
+    The validation resolves entity registry ids and validates device
+    actions against the registries, so the validated configs are dropped
+    when a registry entry is changed or removed.
+    """
+    if (validated_configs := hass.data.get(DATA_VALIDATED_CONFIGS)) is not None:
+        return validated_configs
+
+    @callback
+    def _async_clear_validated_configs(_event: Event[Any]) -> None:
+        """Drop the validated configs."""
+        hass.data[DATA_VALIDATED_CONFIGS] = {}
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_clear_validated_configs,
+        event_filter=_async_registry_changed,
+    )
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_clear_validated_configs,
+        event_filter=_async_registry_changed,
+    )
+    validated_configs = hass.data[DATA_VALIDATED_CONFIGS] = {}
+    return validated_configs
+
+
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
-    scripts = {}
+    """Validate config.
+
+    Scripts which are configured exactly as they were when the
+    configuration was validated last time are not validated again.
+    """
+    previous_validated_configs = _async_get_validated_configs(hass)
+    validated_configs: dict[bytes, ScriptConfig] = {}
+    scripts: dict[str, ScriptConfig] = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
-            if cfg is not None:
-                scripts[object_id] = cfg
+            # The key is created before validating since the validation
+            # changes the configuration
+            if (key := _config_key(object_id, cfg)) is None:
+                script_config = await _try_async_validate_config_item(
+                    hass, object_id, cfg
+                )
+            elif (script_config := previous_validated_configs.get(key)) is None:
+                script_config = await _try_async_validate_config_item(
+                    hass, object_id, cfg
+                )
+                if (
+                    script_config is not None
+                    and script_config.validation_status == ValidationStatus.OK
+                ):
+                    validated_configs[key] = script_config
+            else:
+                validated_configs[key] = script_config
+            if script_config is not None:
+                scripts[object_id] = script_config
+    if hass.data[DATA_VALIDATED_CONFIGS] is previous_validated_configs:
+        # The registries were not changed while validating
+        hass.data[DATA_VALIDATED_CONFIGS] = validated_configs
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
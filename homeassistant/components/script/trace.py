@@ -6,11 +6,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
-    ActionTrace,
-    async_store_trace,
-)
+from homeassistant.components.trace import ActionTrace, async_trace_action
 from homeassistant.core import Context, HomeAssistant
 
 from .const import DOMAIN
@@ -33,14 +29,13 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
-
-    try:
-        yield trace
-    except Exception as ex:
-        if item_id:
-            trace.set_error(ex)
-        raise
-    finally:
-        if item_id:
-            trace.finished()
+    with async_trace_action(hass, trace, trace_config):
+        try:
+            yield trace
+        except Exception as ex:
+            if item_id:
+                trace.set_error(ex)
+            raise
+        finally:
+            if item_id:
+                trace.finished()
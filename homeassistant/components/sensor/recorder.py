@@ -49,6 +49,7 @@ from .const import (
     SensorStateClass,
     UnitOfVolumeFlowRate,
 )
+from .statistics_aggregator import PeriodStatistics, get_period_statistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -188,6 +189,32 @@ def _is_numeric(state: State) -> bool:
     return False
 
 
+def _warn_unsupported_unit(
+    hass: HomeAssistant,
+    entity_id: str,
+    state_unit: str | None,
+    statistics_unit: str | None,
+) -> None:
+    """Log a warning once if the unit of a state can't be converted."""
+    if WARN_UNSUPPORTED_UNIT not in hass.data:
+        hass.data[WARN_UNSUPPORTED_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
+        hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
+        _LOGGER.warning(
+            (
+                "The unit of %s (%s) cannot be converted to the unit of"
+                " previously compiled statistics (%s). Generation of long term"
+                " statistics will be suppressed unless the unit changes back to"
+                " %s or a compatible unit. Go to %s to fix this"
+            ),
+            entity_id,
+            state_unit,
+            statistics_unit,
+            statistics_unit,
+            LINK_DEV_STATISTICS,
+        )
+
+
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
@@ -247,23 +274,7 @@ def _normalize_states(
         state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude states with unsupported unit from statistics
         if state_unit not in valid_units:
-            if WARN_UNSUPPORTED_UNIT not in hass.data:
-                hass.data[WARN_UNSUPPORTED_UNIT] = set()
-            if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
-                hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
-                _LOGGER.warning(
-                    (
-                        "The unit of %s (%s) cannot be converted to the unit of"
-                        " previously compiled statistics (%s). Generation of long term"
-                        " statistics will be suppressed unless the unit changes back to"
-                        " %s or a compatible unit. Go to %s to fix this"
-                    ),
-                    entity_id,
-                    state_unit,
-                    statistics_unit,
-                    statistics_unit,
-                    LINK_DEV_STATISTICS,
-                )
+            _warn_unsupported_unit(hass, entity_id, state_unit, statistics_unit)
             continue
 
         if state_unit != last_unit:
@@ -402,6 +413,51 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_aggregated_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+) -> dict[str, PeriodStatistics]:
+    """Return the statistics which were aggregated while the states changed.
+
+    Only the mean, min and max of sensors with a stable unit which does
+    not have to be converted are aggregated, all other statistics are
+    compiled from the recorded states.
+    """
+    if not (
+        aggregated := get_period_statistics(
+            hass,
+            start.timestamp(),
+            end.timestamp(),
+            [
+                state.entity_id
+                for state in sensor_states
+                if "sum" not in wanted_statistics[state.entity_id]
+            ],
+        )
+    ):
+        return {}
+    old_metadatas = statistics.get_metadata_with_session(
+        get_instance(hass), session, statistic_ids=set(aggregated)
+    )
+    for entity_id, (_, old_metadata) in old_metadatas.items():
+        statistics_unit = old_metadata["unit_of_measurement"]
+        if (
+            statistics_unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+            and aggregated[entity_id].unit != statistics_unit
+        ):
+            del aggregated[entity_id]
+    for entity_id, aggregate in aggregated.items():
+        if aggregate.unsupported_unit is not None:
+            _warn_unsupported_unit(
+                hass, entity_id, aggregate.unsupported_unit, aggregate.unit
+            )
+    return aggregated
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,6 +469,9 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    aggregated = _get_aggregated_statistics(
+        hass, session, start, end, sensor_states, wanted_statistics
+    )
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -430,7 +489,7 @@ def compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in aggregated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -445,6 +504,8 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in aggregated:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -458,12 +519,19 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states) | set(aggregated),
     )
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if aggregate := aggregated.get(entity_id):
+            to_process.append(
+                (entity_id, aggregate.unit, _state.attributes[ATTR_STATE_CLASS], [])
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -525,6 +593,13 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if aggregate := aggregated.get(entity_id):
+            stat["max"] = aggregate.max
+            stat["min"] = aggregate.min
+            stat["mean"] = aggregate.mean
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
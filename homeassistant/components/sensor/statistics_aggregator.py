@@ -0,0 +1,324 @@
+"""Running aggregates of sensor states for the short term statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import threading
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.statistics import (
+    STATISTIC_UNIT_TO_UNIT_CONVERTER,
+)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import ATTR_STATE_CLASS, DOMAIN, SensorStateClass
+
+DATA_STATISTICS_AGGREGATOR: HassKey[StatisticsAggregator] = HassKey(
+    f"{DOMAIN}_statistics_aggregator"
+)
+
+# The length in seconds of a short term statistics period
+PERIOD_SECONDS = 300
+
+# Periods which have not been compiled after this many newer periods
+# are dropped and compiled from the database instead
+MAX_PENDING_PERIODS = 12
+
+_ENTITY_ID_PREFIX = f"{DOMAIN}."
+
+
+@dataclass(slots=True)
+class PeriodStatistics:
+    """The statistics of a sensor during a period."""
+
+    mean: float
+    min: float
+    max: float
+    unit: str | None
+    # The last unit of the states which were dropped since it
+    # can't be converted to the unit of the period
+    unsupported_unit: str | None = None
+
+
+def _period_start(timestamp: float) -> float:
+    """Return the start of the period containing the timestamp."""
+    return timestamp - timestamp % PERIOD_SECONDS
+
+
+def _float_state(state: State) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _value_and_unit(state: State | None) -> tuple[float | None, str | None]:
+    """Return the value and unit of a state."""
+    if state is None:
+        return (None, None)
+    return (_float_state(state), state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+
+
+class _PeriodAggregate:
+    """Running time weighted aggregate of a sensor during one period.
+
+    Non numeric states are ignored, the previous numeric state is
+    weighted until the next numeric state, which is the same as
+    the statistics compiled from the recorded states. The units are
+    handled like the recorded states are normalized, states with a unit
+    which can be converted to the unit of the period are converted and
+    states with a unit which can't be converted are dropped.
+    """
+
+    __slots__ = (
+        "first_ts",
+        "integral",
+        "max",
+        "min",
+        "mixed_units",
+        "seed_unit",
+        "seed_value",
+        "unit",
+        "unsupported_unit",
+        "value",
+        "value_ts",
+    )
+
+    def __init__(
+        self, start_ts: float, seed_value: float | None, seed_unit: str | None
+    ) -> None:
+        """Initialize the aggregate with the state at the start of the period."""
+        self.seed_value = seed_value
+        self.seed_unit = seed_unit
+        self.integral = 0.0
+        self.mixed_units = False
+        self.unsupported_unit: str | None = None
+        self.value = seed_value
+        self.unit = seed_unit
+        self.value_ts = self.first_ts = start_ts
+        self.min = self.max = seed_value
+
+    def add(self, timestamp: float, value: float, unit: str | None) -> None:
+        """Add a numeric state."""
+        if self.value is None:
+            self.first_ts = timestamp
+            self.min = self.max = value
+            self.unit = unit
+            self.value = value
+            self.value_ts = timestamp
+            return
+        if unit != self.unit:
+            if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(self.unit)) is None:
+                # The units must be equivalent, which is checked
+                # when the period is compiled from the recorded states
+                self.mixed_units = True
+            elif unit not in converter.VALID_UNITS:
+                self.unsupported_unit = unit
+                return
+            else:
+                value = converter.converter_factory(unit, self.unit)(value)
+        self.integral += self.value * (timestamp - self.value_ts)
+        if value < self.min:  # type: ignore[operator]
+            self.min = value
+        elif value > self.max:  # type: ignore[operator]
+            self.max = value
+        self.value = value
+        self.value_ts = timestamp
+
+    def statistics(self, end_ts: float) -> PeriodStatistics | None:
+        """Return the statistics of the period.
+
+        Returns None if there were no numeric states or the unit changed.
+        """
+        if (value := self.value) is None or self.mixed_units:
+            return None
+        if period_seconds := end_ts - self.first_ts:
+            mean = (self.integral + value * (end_ts - self.value_ts)) / period_seconds
+        else:
+            mean = 0.0
+        return PeriodStatistics(
+            mean,
+            self.min,  # type: ignore[arg-type]
+            self.max,  # type: ignore[arg-type]
+            self.unit,
+            self.unsupported_unit,
+        )
+
+
+class StatisticsAggregator:
+    """Aggregate measurement sensor states as they change.
+
+    The listener runs in the event loop while the statistics are read
+    from the recorder thread, the periods and their aggregates are only
+    changed and copied while holding the lock. A period is only read once
+    it has ended and the aggregates of a period are not changed by the
+    states of later periods, so the copied aggregates are not changed
+    while they are read.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the aggregator."""
+        self.hass = hass
+        # Periods starting before this timestamp are not fully covered
+        self.covered_from: float | None = None
+        # The periods starting before this timestamp were read and dropped
+        self._dropped_before = 0.0
+        self._max_ts = 0.0
+        self._lock = threading.Lock()
+        self._last: dict[str, tuple[float | None, str | None]] = {}
+        self._periods: dict[float, dict[str, _PeriodAggregate]] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start aggregating the states of measurement sensors."""
+        for state in self.hass.states.async_all(DOMAIN):
+            if state.attributes.get(ATTR_STATE_CLASS) == SensorStateClass.MEASUREMENT:
+                self._last[state.entity_id] = _value_and_unit(state)
+                self._max_ts = max(self._max_ts, state.last_updated_timestamp)
+        self._async_set_gap(max(self._max_ts, dt_util.utcnow().timestamp()))
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_filter_state_changed,
+        )
+
+    @callback
+    def _async_set_gap(self, timestamp: float) -> None:
+        """Only cover periods after the period containing the timestamp."""
+        covered_from = _period_start(timestamp) + PERIOD_SECONDS
+        if self.covered_from is None or covered_from > self.covered_from:
+            self.covered_from = covered_from
+
+    @callback
+    def _async_filter_state_changed(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes of measurement sensors."""
+        return (
+            (new_state := event_data["new_state"]) is not None
+            and new_state.entity_id.startswith(_ENTITY_ID_PREFIX)
+            and (
+                new_state.attributes.get(ATTR_STATE_CLASS)
+                == SensorStateClass.MEASUREMENT
+            )
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state to the aggregate of its period."""
+        new_state = event.data["new_state"]
+        if TYPE_CHECKING:
+            assert new_state is not None
+        entity_id = new_state.entity_id
+        timestamp = new_state.last_updated_timestamp
+        if timestamp < self._max_ts:
+            # The clock went backwards, the aggregates can't be trusted
+            self._async_set_gap(self._max_ts)
+        self._max_ts = timestamp
+        value, unit = _value_and_unit(new_state)
+        with self._lock:
+            if new_state.last_changed_timestamp == timestamp:
+                # Only state changes count during the period, this is the
+                # same as the significant states which are recorded
+                period_start = _period_start(timestamp)
+                if (aggregates := self._periods.get(period_start)) is None:
+                    aggregates = self._periods[period_start] = {}
+                    self._async_drop_pending_periods(period_start)
+                if (aggregate := aggregates.get(entity_id)) is None:
+                    if (seed := self._last.get(entity_id)) is None:
+                        seed = _value_and_unit(event.data["old_state"])
+                    seed_value, seed_unit = seed
+                    aggregate = aggregates[entity_id] = _PeriodAggregate(
+                        period_start, seed_value, seed_unit
+                    )
+                if value is not None:
+                    aggregate.add(timestamp, value, unit)
+            self._last[entity_id] = (value, unit)
+
+    @callback
+    def _async_drop_pending_periods(self, period_start: float) -> None:
+        """Drop the periods which were never compiled.
+
+        Must be called while holding the lock.
+        """
+        oldest = period_start - MAX_PENDING_PERIODS * PERIOD_SECONDS
+        for pending_start in [start for start in self._periods if start < oldest]:
+            self._periods.pop(pending_start, None)
+            self._async_set_gap(pending_start)
+
+    def get_period(
+        self, start_ts: float, end_ts: float, entity_ids: list[str]
+    ) -> dict[str, PeriodStatistics] | None:
+        """Return the statistics of a period.
+
+        Returns None if the period is not covered. Entities for which
+        there are no statistics must be compiled from the database.
+        The aggregates of a period are kept until a later period is read,
+        so the period can be read again if storing its statistics failed.
+        This is called from the recorder thread.
+        """
+        if (
+            self.covered_from is None
+            or start_ts < self.covered_from
+            or start_ts < self._dropped_before
+            or end_ts - start_ts != PERIOD_SECONDS
+            or end_ts > dt_util.utcnow().timestamp()
+        ):
+            return None
+        with self._lock:
+            for earlier_start in [start for start in self._periods if start < start_ts]:
+                self._periods.pop(earlier_start, None)
+            self._dropped_before = start_ts
+            last = self._last.copy()
+            aggregates = self._periods.get(start_ts, {}).copy()
+            later_periods = [
+                self._periods[start].copy()
+                for start in sorted(self._periods)
+                if start > start_ts
+            ]
+        if start_ts < self.covered_from:
+            # A gap was detected while the period was read
+            return None
+        result: dict[str, PeriodStatistics] = {}
+        for entity_id in entity_ids:
+            if (aggregate := aggregates.get(entity_id)) is None:
+                # There were no state changes during the period, the
+                # state at the start of a later period or the last state
+                # was the state during the whole period
+                seed = last.get(entity_id)
+                for later_aggregates in later_periods:
+                    if later := later_aggregates.get(entity_id):
+                        seed = (later.seed_value, later.seed_unit)
+                        break
+                if seed is None:
+                    continue
+                aggregate = _PeriodAggregate(start_ts, *seed)
+            if (statistics := aggregate.statistics(end_ts)) is not None:
+                result[entity_id] = statistics
+        return result
+
+
+def get_period_statistics(
+    hass: HomeAssistant, start_ts: float, end_ts: float, entity_ids: list[str]
+) -> dict[str, PeriodStatistics] | None:
+    """Return the aggregated statistics of measurement sensors for a period.
+
+    The aggregator is started the first time statistics are compiled, the
+    periods before it was started are compiled from the database. This
+    is called from the recorder thread.
+    """
+    if (aggregator := hass.data.get(DATA_STATISTICS_AGGREGATOR)) is None:
+        aggregator = hass.data[DATA_STATISTICS_AGGREGATOR] = StatisticsAggregator(hass)
+        hass.loop.call_soon_threadsafe(aggregator.async_start)
+        return None
+    return aggregator.get_period(start_ts, end_ts, entity_ids)
@@ -16,13 +16,18 @@ from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_PERCENTAGE,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
     DATA_TRACE_STORE,
+    DEFAULT_SAMPLE_PERCENTAGE,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_FULL,
+    TRACE_MODES,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import async_store_trace, async_trace_action
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +37,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_PERCENTAGE, default=DEFAULT_SAMPLE_PERCENTAGE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=100)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -42,6 +51,7 @@ __all__ = [
     "TRACE_CONFIG_SCHEMA",
     "ActionTrace",
     "async_store_trace",
+    "async_trace_action",
 ]
 
 
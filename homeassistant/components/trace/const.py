@@ -12,8 +12,26 @@ if TYPE_CHECKING:
     from .models import TraceData
 
 
+CONF_SAMPLE_PERCENTAGE = "sample_percentage"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_MODE = "mode"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+DEFAULT_SAMPLE_PERCENTAGE = 10
+
+# Trace every run
+TRACE_MODE_FULL = "full"
+# Trace a percentage of the runs
+TRACE_MODE_SAMPLED = "sampled"
+# Trace every run but only keep the runs which failed
+TRACE_MODE_ERRORS_ONLY = "errors_only"
+# Do not trace
+TRACE_MODE_OFF = "off"
+TRACE_MODES = [
+    TRACE_MODE_FULL,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODE_ERRORS_ONLY,
+    TRACE_MODE_OFF,
+]
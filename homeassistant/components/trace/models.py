@@ -89,6 +89,17 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run or one of its steps failed."""
+        if self._error is not None or self._script_execution == "error":
+            return True
+        return self._trace is not None and any(
+            element.error is not None
+            for elements in self._trace.values()
+            for element in elements
+        )
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
         if self._dict:
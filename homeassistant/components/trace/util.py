@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
 import logging
+import random
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.script import breakpoint_is_set
+from homeassistant.helpers.trace import trace_enabled_cv
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    CONF_SAMPLE_PERCENTAGE,
+    CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
+    DATA_TRACE,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_PERCENTAGE,
+    TRACE_MODE_ERRORS_ONLY,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -132,3 +148,37 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
                 _LOGGER.exception("Failed to restore trace")
                 continue
             _async_store_restored_trace(hass, trace)
+
+
+@contextmanager
+def async_trace_action(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: dict[str, Any]
+) -> Generator[None]:
+    """Trace a run of a script or automation according to the trace mode.
+
+    The steps of runs which are not traced are not recorded. In errors only
+    mode every run is recorded but only stored once it has failed, as it is
+    not known if a run fails before it has finished. Breakpoints are only
+    checked when a step is traced, so runs are traced in full while a
+    breakpoint is set.
+    """
+    mode = trace_config.get(CONF_TRACE_MODE, TRACE_MODE_FULL)
+    if mode != TRACE_MODE_FULL and breakpoint_is_set(hass, trace.key):
+        mode = TRACE_MODE_FULL
+    if mode == TRACE_MODE_SAMPLED:
+        traced = random.random() * 100 < trace_config.get(
+            CONF_SAMPLE_PERCENTAGE, DEFAULT_SAMPLE_PERCENTAGE
+        )
+    else:
+        traced = mode != TRACE_MODE_OFF
+    stored_traces = trace_config[CONF_STORED_TRACES]
+    if traced and mode != TRACE_MODE_ERRORS_ONLY:
+        async_store_trace(hass, trace, stored_traces)
+
+    token = trace_enabled_cv.set(traced)
+    try:
+        yield
+    finally:
+        trace_enabled_cv.reset(token)
+        if traced and mode == TRACE_MODE_ERRORS_ONLY and trace.failed:
+            async_store_trace(hass, trace, stored_traces)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache, partial
 import json
 import logging
@@ -65,6 +65,11 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .state_subscriptions import (
+    CoalescedStateSubscription,
+    StateSubscription,
+    async_get_state_subscription_hub,
+)
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -324,6 +329,28 @@ def _async_get_allowed_states(
     ]
 
 
+def _async_get_allowed_changes(
+    hass: HomeAssistant, connection: ActiveConnection, entity_ids: set[str]
+) -> tuple[list[State], list[str]]:
+    """Return the current states and the removed entities of the entity_ids."""
+    user = connection.user
+    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+        allowed_entity_ids: Iterable[str] = entity_ids
+    else:
+        entity_perm = user.permissions.check_entity
+        allowed_entity_ids = [
+            entity_id for entity_id in entity_ids if entity_perm(entity_id, POLICY_READ)
+        ]
+    states: list[State] = []
+    removed: list[str] = []
+    for entity_id in allowed_entity_ids:
+        if (state := hass.states.get(entity_id)) is None:
+            removed.append(entity_id)
+        else:
+            states.append(state)
+    return states, removed
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_states"})
 def handle_get_states(
@@ -368,37 +395,16 @@ def _send_handle_get_states_response(
 
 
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_interval"): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=60)
+        ),
+        vol.Optional("versioned", default=False): bool,
+        vol.Optional("since"): str,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -409,23 +415,55 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    hub = async_get_state_subscription_hub(hass)
+    versioned = msg["versioned"] or "since" in msg
+    # A client which resyncs with the version it has seen last is
+    # only sent the states of the entities which changed since
+    changed_entity_ids = (
+        hub.async_changed_since(msg["since"]) if "since" in msg else None
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    removed: list[str] | None = None
+    if changed_entity_ids is None:
+        states = _async_get_allowed_states(hass, connection)
+    else:
+        states, removed = _async_get_allowed_changes(
+            hass, connection, changed_entity_ids
+        )
+        if entity_ids or entity_filter:
+            removed = [
+                entity_id
+                for entity_id in removed
+                if (not entity_ids or entity_id in entity_ids)
+                and (not entity_filter or entity_filter(entity_id))
+            ]
+    version = hub.version if versioned else None
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    subscription: StateSubscription
+    if coalesce_interval := msg.get("coalesce_interval"):
+        subscription = CoalescedStateSubscription(
             connection.send_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
-    )
+            hass.loop,
+            coalesce_interval,
+            versioned,
+        )
+    else:
+        subscription = StateSubscription(
+            connection.send_message,
+            entity_ids,
+            entity_filter,
+            connection.user,
+            message_id_as_bytes,
+            versioned,
+        )
+    connection.subscriptions[msg_id] = hub.async_subscribe(subscription)
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -446,7 +484,7 @@ def handle_subscribe_entities(
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, serialized_states, removed, version
         )
         return
 
@@ -463,7 +501,7 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, serialized_states, removed, version
     )
 
 
@@ -471,8 +509,27 @@ def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
     serialized_states: list[bytes],
+    removed: list[str] | None = None,
+    version: str | None = None,
 ) -> None:
-    """Send handle entities init response."""
+    """Send handle entities init response.
+
+    The removed entities are only set when the client is resynced with
+    the changes since its last version instead of all states.
+    """
+    if removed is None and version is None:
+        connection.send_message(
+            b"".join(
+                (
+                    b'{"id":',
+                    message_id_as_bytes,
+                    b',"type":"event","event":{"a":{',
+                    b",".join(serialized_states),
+                    b"}}}",
+                )
+            )
+        )
+        return
     connection.send_message(
         b"".join(
             (
@@ -480,7 +537,12 @@ def _send_handle_entities_init_response(
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
-                b"}}}",
+                b"}",
+                b"" if removed is None else b',"r":' + json_bytes(removed),
+                b"}",
+                b"" if version is None else b',"v":' + json_bytes(version),
+                b"" if removed is None else b',"delta":true',
+                b"}",
             )
         )
     )
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -162,6 +162,26 @@ def cached_state_diff_message(
     )
 
 
+def cached_state_diff_message_prefix(
+    event: Event[EventStateChangedData], version: str | None = None
+) -> bytes:
+    """Return an event message up to the value of the id.
+
+    The message of a subscription is the prefix followed by
+    the id of the subscription and the closing brace.
+    """
+    if version is None:
+        return _partial_cached_state_diff_message(event)[:-1] + b',"id":'
+    return b"".join(
+        (
+            _partial_cached_state_diff_message(event)[:-1],
+            b',"v":',
+            json_bytes(version),
+            b',"id":',
+        )
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -199,6 +219,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +262,53 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: dict[str, tuple[State | None, State | None]],
+    version: str | None = None,
+) -> bytes | None:
+    """Return an event message with the changes of multiple entities.
+
+    The changes map each entity_id to its state before the first change
+    and its latest state, entities which were added and removed again
+    are left out. Returns None if there is nothing to send.
+    """
+    added: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        else:
+            changed[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    message: dict[str, Any] = {"type": "event", "event": event}
+    if version is not None:
+        message["v"] = version
+    return b"".join(
+        (
+            (_message_to_json_bytes_or_none(message) or INVALID_JSON_PARTIAL_MESSAGE)[
+                :-1
+            ],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -0,0 +1,289 @@
+"""Fan out state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
+
+from . import messages
+from .const import DOMAIN
+
+DATA_STATE_SUBSCRIPTION_HUB: HassKey[StateSubscriptionHub] = HassKey(
+    f"{DOMAIN}_state_subscription_hub"
+)
+
+# The number of state changes which are kept to resync clients
+STATE_CHANGES_BUFFER_SIZE = 10000
+
+
+class StateSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "entity_filter",
+        "entity_ids",
+        "id_suffix",
+        "message_id_as_bytes",
+        "send_message",
+        "user",
+        "versioned",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        versioned: bool = False,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+        self.id_suffix = message_id_as_bytes + b"}"
+        self.versioned = versioned
+
+    @callback
+    def async_send_state_diff(self, message_prefix: bytes) -> None:
+        """Send a state diff message."""
+        self.send_message(message_prefix + self.id_suffix)
+
+    @callback
+    def async_close(self) -> None:
+        """Release the resources of the subscription."""
+
+
+class CoalescedStateSubscription(StateSubscription):
+    """A subscribe_entities subscription which coalesces the state changes.
+
+    The state changes are collected during the interval and sent as one
+    event with a single diff per entity, intermediate states of entities
+    which change more often than the interval are never sent.
+    """
+
+    __slots__ = ("_flush_handle", "_loop", "_pending", "_version", "interval")
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        loop: asyncio.AbstractEventLoop,
+        interval: float,
+        versioned: bool = False,
+    ) -> None:
+        """Initialize the subscription."""
+        super().__init__(
+            send_message,
+            entity_ids,
+            entity_filter,
+            user,
+            message_id_as_bytes,
+            versioned,
+        )
+        self._loop = loop
+        self.interval = interval
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._version: str | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_queue_state_changed(
+        self, event: Event[EventStateChangedData], version: str | None
+    ) -> None:
+        """Queue a state change to be sent with the next flush."""
+        self._version = version
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.interval, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the state changes which were queued during the interval."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        if message := messages.coalesced_state_diff_message(
+            self.message_id_as_bytes, pending, self._version
+        ):
+            self.send_message(message)
+
+    @callback
+    def async_close(self) -> None:
+        """Cancel the pending flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+
+class StateSubscriptionHub:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener is shared by all connections, the
+    subscriptions for specific entities are indexed by entity_id. Each
+    state diff is serialized once and the permissions are checked once
+    per user for each state change.
+
+    Every state change increases the version of the hub and the entity_ids
+    of the recent state changes are kept in a ring buffer, a client which
+    reconnects with the last version it has seen is only sent the states
+    of the entities which changed since. The version is counted here and
+    not when the state is written since the events of a batch are only
+    fired once all the states of the batch are written. The listener is
+    kept once the first subscription is added so the changes are tracked
+    while the clients are disconnected.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._subscriptions: dict[StateSubscription, None] = {}
+        self._entity_subscriptions: dict[str, dict[StateSubscription, None]] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        # The version is only valid for this instance of the hub
+        self._stream_id = ulid_now()
+        self._version = 0
+        self._changes: deque[str] = deque(maxlen=STATE_CHANGES_BUFFER_SIZE)
+
+    @property
+    def version(self) -> str:
+        """Return the version of the states sent to the subscriptions."""
+        return f"{self._stream_id}:{self._version}"
+
+    @callback
+    def async_changed_since(self, version: str) -> set[str] | None:
+        """Return the entity_ids which changed since the version.
+
+        Returns None if the version is unknown or the state changes since
+        the version are no longer in the ring buffer, the client needs all
+        states in that case.
+        """
+        stream_id, _, version_number = version.rpartition(":")
+        if stream_id != self._stream_id:
+            return None
+        try:
+            missed = self._version - int(version_number)
+        except ValueError:
+            return None
+        if missed < 0 or missed > len(self._changes):
+            return None
+        return set(islice(reversed(self._changes), missed))
+
+    @callback
+    def async_subscribe(self, subscription: StateSubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if entity_ids := subscription.entity_ids:
+            for entity_id in entity_ids:
+                self._entity_subscriptions.setdefault(entity_id, {})[subscription] = (
+                    None
+                )
+        else:
+            self._subscriptions[subscription] = None
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_state_changed
+            )
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: StateSubscription) -> None:
+        """Remove a subscription."""
+        if entity_ids := subscription.entity_ids:
+            for entity_id in entity_ids:
+                entity_subscriptions = self._entity_subscriptions[entity_id]
+                del entity_subscriptions[subscription]
+                if not entity_subscriptions:
+                    del self._entity_subscriptions[entity_id]
+        else:
+            del self._subscriptions[subscription]
+        subscription.async_close()
+
+    @callback
+    def _async_forward_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the matching subscriptions."""
+        entity_id = event.data["entity_id"]
+        self._version += 1
+        self._changes.append(entity_id)
+        # Copy the subscriptions since sending a message can close the
+        # connection which removes its subscriptions
+        if entity_subscriptions := self._entity_subscriptions.get(entity_id):
+            subscriptions = [*self._subscriptions, *entity_subscriptions]
+        else:
+            subscriptions = list(self._subscriptions)
+        message_prefix: bytes | None = None
+        versioned_message_prefix: bytes | None = None
+        version: str | None = None
+        # We have to lookup the permissions for every state change because
+        # the user might have changed since the subscription was created.
+        can_read_by_user_id: dict[str, bool] = {}
+        for subscription in subscriptions:
+            if (entity_filter := subscription.entity_filter) and not entity_filter(
+                entity_id
+            ):
+                continue
+            user = subscription.user
+            if (can_read := can_read_by_user_id.get(user.id)) is None:
+                permissions = user.permissions
+                can_read = can_read_by_user_id[user.id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            if not can_read:
+                continue
+            if subscription.versioned and version is None:
+                version = self.version
+            # Subscriptions which coalesce the state changes are sent the
+            # events instead of the serialized state diffs
+            if isinstance(subscription, CoalescedStateSubscription):
+                subscription.async_queue_state_changed(
+                    event, version if subscription.versioned else None
+                )
+            elif subscription.versioned:
+                if versioned_message_prefix is None:
+                    versioned_message_prefix = (
+                        messages.cached_state_diff_message_prefix(event, version)
+                    )
+                subscription.async_send_state_diff(versioned_message_prefix)
+            else:
+                if message_prefix is None:
+                    message_prefix = messages.cached_state_diff_message_prefix(event)
+                subscription.async_send_state_diff(message_prefix)
+
+
+@callback
+def async_get_state_subscription_hub(hass: HomeAssistant) -> StateSubscriptionHub:
+    """Return the state subscription hub."""
+    if (hub := hass.data.get(DATA_STATE_SUBSCRIPTION_HUB)) is None:
+        hub = hass.data[DATA_STATE_SUBSCRIPTION_HUB] = StateSubscriptionHub(hass)
+    return hub
@@ -73,7 +73,7 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import SECRET_YAML, Secrets, YamlCache, YamlTypeError, load_yaml_dict
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +84,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
+DATA_YAML_CACHE: HassKey[YamlCache] = HassKey("hass_yaml_cache")
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -448,6 +449,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    # The parsed files are kept to only parse the changed files on reload
+    if (yaml_cache := hass.data.get(DATA_YAML_CACHE)) is None:
+        yaml_cache = hass.data[DATA_YAML_CACHE] = YamlCache()
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -456,6 +460,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            yaml_cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -499,7 +504,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -508,7 +513,7 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
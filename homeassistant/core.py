@@ -12,13 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -1446,6 +1447,27 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+class _KeyedListeners:
+    """Listeners for an event type indexed by entity_id and domain."""
+
+    __slots__ = ("domains", "entity_ids")
+
+    def __init__(self) -> None:
+        """Initialize the keyed listeners."""
+        self.entity_ids: defaultdict[str, list[_FilterableJobType[Any]]] = defaultdict(
+            list
+        )
+        self.domains: defaultdict[str, list[_FilterableJobType[Any]]] = defaultdict(
+            list
+        )
+
+    def __len__(self) -> int:
+        """Return the number of registered listener entries."""
+        return sum(map(len, self.entity_ids.values())) + sum(
+            map(len, self.domains.values())
+        )
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1460,7 +1482,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1496,7 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedListeners] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1484,7 +1513,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, keyed_listeners in self._keyed_listeners.items():
+            counts[key] = counts.get(key, 0) + len(keyed_listeners)
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1555,6 +1587,21 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        # Keyed listeners are looked up by the entity_id of the event
+        # so only the listeners that care about the entity are run
+        # instead of calling an event filter for every listener.
+        if (
+            event_data is not None
+            and (keyed := self._keyed_listeners.get(event_type)) is not None
+            and type(entity_id := event_data.get("entity_id")) is str
+        ):
+            if entity_id_listeners := keyed.entity_ids.get(entity_id):
+                listeners = listeners + entity_id_listeners
+            if keyed.domains and (
+                domain_listeners := keyed.domains.get(entity_id.partition(".")[0])
+            ):
+                listeners = listeners + domain_listeners
+
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1654,6 +1701,98 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        *,
+        entity_ids: str | Iterable[str] | None = None,
+        domains: str | Iterable[str] | None = None,
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type keyed by entity_id or domain.
+
+        The event data must contain an ``entity_id`` key. Instead of
+        running an event filter for every fired event, listeners are
+        indexed by entity_id or domain so firing an event only looks
+        up the listeners for the entity_id of the event.
+
+        Exactly one of entity_ids or domains must be passed. An
+        optional event_filter can be passed to further filter events.
+
+        This method must be run in the event loop.
+        """
+        if (entity_ids is None) == (domains is None):
+            raise HomeAssistantError(
+                "Exactly one of entity_ids or domains must be passed"
+            )
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(f"Keyed listeners can not listen to {MATCH_ALL}")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+
+        if (keyed := self._keyed_listeners.get(event_type)) is None:
+            keyed = self._keyed_listeners[event_type] = _KeyedListeners()
+        if entity_ids is not None:
+            index = keyed.entity_ids
+            keys = (
+                (entity_ids,)
+                if isinstance(entity_ids, str)
+                else tuple(dict.fromkeys(entity_ids))
+            )
+        else:
+            assert domains is not None
+            index = keyed.domains
+            keys = (
+                (domains,)
+                if isinstance(domains, str)
+                else tuple(dict.fromkeys(domains))
+            )
+
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen keyed {event_type} {keys}"),
+            event_filter,
+        )
+        for key in keys:
+            index[key].append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, index, keys, filterable_job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        index: defaultdict[str, list[_FilterableJobType[Any]]],
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        The listener is only removed if it is registered for all its keys
+        so the index is never left half updated.
+
+        This method must be run in the event loop.
+        """
+        key_listeners_by_key = [(key, index.get(key, EMPTY_LIST)) for key in keys]
+        if any(
+            filterable_job not in key_listeners
+            for _, key_listeners in key_listeners_by_key
+        ):
+            _LOGGER.error(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+        for key, key_listeners in key_listeners_by_key:
+            key_listeners.remove(filterable_job)
+            if not key_listeners:
+                del index[key]
+
+        keyed = self._keyed_listeners.get(event_type)
+        if keyed is not None and not keyed.entity_ids and not keyed.domains:
+            del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2067,7 +2206,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batch_context",
+        "_pending_events",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2225,12 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # While a batch is active, state writes share _batch_context and the
+        # events they would fire are held in _pending_events until the batch ends
+        self._batch_context: Context | None = None
+        self._pending_events: (
+            list[tuple[EventType[Any], Mapping[str, Any], Context, float]] | None
+        ) = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2195,6 +2348,16 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
+        if self._pending_events is not None:
+            self._pending_events.append(
+                (
+                    EVENT_STATE_CHANGED,
+                    state_changed_data,
+                    context or self._batch_context or Context(),
+                    time.time(),
+                )
+            )
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2283,6 +2446,76 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @contextmanager
+    def async_batch(
+        self, context: Context | None = None, *, shared_context: bool = True
+    ) -> Generator[None]:
+        """Batch state writes made in the context.
+
+        All states written in the batch share the same context unless
+        a context is passed explicitly when writing the state or
+        shared_context is False, in which case each write gets its own
+        context as if it was not batched. The state_changed and
+        state_reported events are held back until the batch ends so
+        listeners see the states of the whole batch as written at once.
+
+        Nested batches are merged into the outermost batch.
+
+        This method must be run in the event loop.
+        """
+        if self._pending_events is not None:
+            yield
+            return
+
+        if shared_context:
+            self._batch_context = context or Context()
+        pending_events: list[
+            tuple[EventType[Any], Mapping[str, Any], Context, float]
+        ] = []
+        self._pending_events = pending_events
+        try:
+            yield
+        finally:
+            self._batch_context = None
+            self._pending_events = None
+            fire_internal = self._bus.async_fire_internal
+            for event_type, event_data, event_context, timestamp in pending_events:
+                fire_internal(
+                    event_type, event_data, context=event_context, time_fired=timestamp
+                )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        states is an iterable of (entity_id, state, attributes) tuples.
+
+        All states are written with the same context and timestamp
+        before any state_changed event is fired.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        with self.async_batch(context):
+            for entity_id, new_state, attributes in states:
+                self.async_set_internal(
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+
     @callback
     def async_set_internal(
         self,
@@ -2334,7 +2567,7 @@ class StateMachine:
         now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
-            context = Context(id=ulid_at_time(timestamp))
+            context = self._batch_context or Context(id=ulid_at_time(timestamp))
 
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
@@ -2342,13 +2575,19 @@ class StateMachine:
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
+            state_reported_data = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            if self._pending_events is not None:
+                self._pending_events.append(
+                    (EVENT_STATE_REPORTED, state_reported_data, context, timestamp)
+                )
+                return
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
+                state_reported_data,
                 context=context,
                 time_fired=timestamp,
             )
@@ -2381,6 +2620,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
+        if self._pending_events is not None:
+            self._pending_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, timestamp)
+            )
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -40,7 +40,7 @@ from .deprecation import (
 )
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import BaseAppendLogRegistry, BaseRegistryItems, RegistryIndexType
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -639,7 +639,7 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         ]
 
 
-class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistry(BaseAppendLogRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
 
     devices: ActiveDeviceRegistryItems
@@ -655,6 +655,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            append_log=True,
         )
 
     @callback
@@ -1236,6 +1237,19 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             ],
         }
 
+    @callback
+    def _items_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return items of device registry to store keyed by collection and id."""
+        return {
+            "devices": {
+                entry.id: entry.as_storage_fragment for entry in self.devices.values()
+            },
+            "deleted_devices": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_devices.values()
+            },
+        }
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
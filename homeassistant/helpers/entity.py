@@ -519,6 +519,11 @@ class Entity(
     # and removes the need for constant None checks or asserts.
     _state_info: StateInfo = None  # type: ignore[assignment]
 
+    # The attributes of the state which only change with the properties of
+    # the entity and the properties they were calculated from
+    __static_attributes: dict[str, Any]
+    __static_attributes_key: tuple[Any, ...] | None = None
+
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
@@ -1060,8 +1065,6 @@ class Entity(
         This method is called when writing the state to avoid the overhead of creating
         a dataclass object.
         """
-        entry = self.registry_entry
-
         capability_attr = self.capability_attributes
         attr = capability_attr.copy() if capability_attr else {}
 
@@ -1073,36 +1076,80 @@ class Entity(
             if extra_state_attributes := self.extra_state_attributes:
                 attr.update(extra_state_attributes)
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        original_device_class = self.device_class
+        supported_features = self.supported_features
+        static_attributes_key = (
+            self.registry_entry,
+            self.device_entry,
+            self.name,
+            self.has_entity_name,
+            self.unit_of_measurement,
+            self.assumed_state,
+            self.attribution,
+            original_device_class,
+            self.entity_picture,
+            self.icon,
+            supported_features,
+        )
+        if static_attributes_key != self.__static_attributes_key:
+            self.__static_attributes = self.__async_calculate_static_attributes(
+                *static_attributes_key
+            )
+            self.__static_attributes_key = static_attributes_key
+        attr.update(self.__static_attributes)
+
+        return (state, attr, capability_attr, original_device_class, supported_features)
+
+    def __async_calculate_static_attributes(
+        self,
+        entry: er.RegistryEntry | None,
+        device_entry: dr.DeviceEntry | None,
+        name: str | UndefinedType | None,
+        has_entity_name: bool,
+        unit_of_measurement: str | None,
+        assumed_state: bool,
+        attribution: str | None,
+        original_device_class: str | None,
+        entity_picture: str | None,
+        icon: str | None,
+        supported_features: int | None,
+    ) -> dict[str, Any]:
+        """Calculate the attributes which do not change with the state.
+
+        The attributes only depend on the arguments, they are only calculated
+        again when one of the arguments changed since the last state write.
+        """
+        attr: dict[str, Any] = {}
+
+        if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if attribution is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
-        original_device_class = self.device_class
         if (
             device_class := (entry and entry.device_class) or original_device_class
         ) is not None:
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if entity_picture is not None:
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if (icon := (entry and entry.icon) or icon) is not None:
             attr[ATTR_ICON] = icon
 
         if (
-            name := (entry and entry.name) or self._friendly_name_internal()
+            friendly_name := (entry and entry.name) or self._friendly_name_internal()
         ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
+            attr[ATTR_FRIENDLY_NAME] = friendly_name
 
-        if (supported_features := self.supported_features) is not None:
+        if supported_features is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        return attr
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -59,7 +59,7 @@ from .device_registry import (
     EventDeviceRegistryUpdatedData,
 )
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import BaseAppendLogRegistry, BaseRegistryItems, RegistryIndexType
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -697,7 +697,7 @@ def _validate_item(
         )
 
 
-class EntityRegistry(BaseRegistry):
+class EntityRegistry(BaseAppendLogRegistry):
     """Class to hold a registry of entities."""
 
     deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
@@ -713,6 +713,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            append_log=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1367,6 +1368,19 @@ class EntityRegistry(BaseRegistry):
             ],
         }
 
+    @callback
+    def _items_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return items of entity registry to store keyed by collection and id."""
+        return {
+            "entities": {
+                entry.id: entry.as_storage_fragment for entry in self.entities.values()
+            },
+            "deleted_entities": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_entities.values()
+            },
+        }
+
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
@@ -55,6 +55,7 @@ from .entity_registry import (
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
+from .timer_wheel import DATA_MONOTONIC_TIMER_WHEEL, DATA_TIMER_WHEEL, TimerWheelHandle
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -115,6 +116,10 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         bool,
     ]
+    # The keys are entity_ids which the event bus indexes, the bus only runs
+    # the listener of the entity_id of an event instead of the filter for
+    # every event
+    keyed_by_entity_id: bool = False
 
 
 @dataclass(slots=True, frozen=True)
@@ -123,6 +128,8 @@ class _KeyedEventData(Generic[_TypedDictT]):
 
     listener: CALLBACK_TYPE
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    # The listeners of the keys if the event bus indexes the keys
+    key_listeners: dict[str, CALLBACK_TYPE] | None = None
 
 
 @dataclass(slots=True)
@@ -373,6 +380,7 @@ _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
     filter_callable=_async_state_filter,
+    keyed_by_entity_id=True,
 )
 
 
@@ -421,12 +429,15 @@ def _remove_listener(
     keys: Iterable[str],
     job: HassJob[[Event[_TypedDictT]], Any],
     callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+    key_listeners: dict[str, CALLBACK_TYPE] | None,
 ) -> None:
     """Remove listener."""
     for key in keys:
         callbacks[key].remove(job)
         if not callbacks[key]:
             del callbacks[key]
+            if key_listeners is not None:
+                key_listeners.pop(key)()
 
     if not callbacks:
         hass.data.pop(tracker.key).listener()
@@ -453,6 +464,10 @@ def _async_track_event(
     if tracker_key in hass_data:
         event_data = hass_data[tracker_key]
         callbacks = event_data.callbacks
+    elif tracker.keyed_by_entity_id:
+        callbacks = defaultdict(list)
+        event_data = _KeyedEventData(_remove_empty_listener, callbacks, {})
+        hass_data[tracker_key] = event_data
     else:
         callbacks = defaultdict(list)
         listener = hass.bus.async_listen(
@@ -477,7 +492,16 @@ def _async_track_event(
         for key in keys:
             callbacks[key].append(job)
 
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
+    if (key_listeners := event_data.key_listeners) is not None:
+        for key in keys:
+            if key not in key_listeners:
+                key_listeners[key] = hass.bus.async_listen_keyed(
+                    tracker.event_type,
+                    partial(tracker.dispatcher_callable, hass, callbacks),
+                    entity_ids=key,
+                )
+
+    return partial(_remove_listener, hass, tracker, keys, job, callbacks, key_listeners)
 
 
 @callback
@@ -1487,10 +1511,15 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
+        if (timer_wheel := self.hass.data.get(DATA_TIMER_WHEEL)) is not None:
+            self._cancel_callback = timer_wheel.async_call_at(
+                self.expected_fire_timestamp, self
+            )
+            return
         loop = self.hass.loop
         self._cancel_callback = loop.call_at(
             loop.time() + self.expected_fire_timestamp - time.time(), self
@@ -1601,6 +1630,10 @@ def async_call_later(
         else HassJob(action, f"call_later {delay}")
     )
     loop = hass.loop
+    if (timer_wheel := hass.data.get(DATA_MONOTONIC_TIMER_WHEEL)) is not None:
+        return timer_wheel.async_call_at(
+            loop.time() + delay, partial(_run_async_call_action, hass, job)
+        ).cancel
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
@@ -1618,7 +1651,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: asyncio.TimerHandle | TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1641,6 +1674,12 @@ class _TrackTimeInterval:
             assert self._track_job is not None
         hass = self.hass
         loop = hass.loop
+        if (timer_wheel := hass.data.get(DATA_MONOTONIC_TIMER_WHEEL)) is not None:
+            self._timer_handle = timer_wheel.async_call_at(
+                loop.time() + self.seconds,
+                partial(self._interval_listener, self._track_job),
+            )
+            return
         self._timer_handle = loop.call_at(
             loop.time() + self.seconds, self._interval_listener, self._track_job
         )
@@ -1810,9 +1849,16 @@ class _TrackUTCTimeChange:
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
+        if (timer_wheel := self.hass.data.get(DATA_TIMER_WHEEL)) is not None:
+            # The trackers of the same pattern share the calculation
+            next_time = timer_wheel.async_find_next_time_expression_time(
+                localized_now, *self.time_match_expression
+            )
+        else:
+            next_time = dt_util.find_next_time_expression_time(
+                localized_now, *self.time_match_expression
+            )
+        return next_time.replace(microsecond=self.microsecond)
 
     @callback
     def _pattern_time_change_listener(self, _: datetime) -> None:
@@ -75,9 +75,33 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
+        self._async_delay_save(delay)
+
+    @callback
+    def _async_delay_save(self, delay: float) -> None:
+        """Save the registry after a delay."""
         self._store.async_delay_save(self._data_to_save, delay)
 
     @callback
     @abstractmethod
     def _data_to_save(self) -> _StoreDataT:
         """Return data of registry to store in a file."""
+
+
+class BaseAppendLogRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](
+    BaseRegistry[_StoreDataT]
+):
+    """Class to implement a registry stored with an append log.
+
+    The store of the registry must be created with append_log set.
+    """
+
+    @callback
+    def _async_delay_save(self, delay: float) -> None:
+        """Save the changed items of the registry after a delay."""
+        self._store.async_delay_save_items(self._items_to_save, delay)
+
+    @callback
+    @abstractmethod
+    def _items_to_save(self) -> Mapping[str, Mapping[str, Any]]:
+        """Return items of registry to store keyed by collection and id."""
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -18,7 +20,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -27,7 +29,17 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+# Version 2 stores the states as collections of the append log. Releases
+# which only know version 1 fail to load it, so downgrading requires
+# removing the restore state file, which loses the states to restore.
+STORAGE_VERSION = 2
+
+# The collections of the stored items, the dump collection has a single
+# item with the time of the last dump which is the time the entities
+# without a last_seen of their own were last seen
+COLLECTION_STATES = "states"
+COLLECTION_DUMP = "dump"
+LAST_DUMP_ID = "last"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -96,6 +108,37 @@ class StoredState:
         )
 
 
+@dataclass(slots=True)
+class _StoredItem:
+    """The stored item of an entity and what it was created from."""
+
+    state: State
+    extra_data: bytes
+    last_seen: datetime | None
+    item: json_fragment
+
+
+class RestoreStateStore(Store[dict[str, list[dict[str, Any]]]]):
+    """Store the states to restore."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: list[dict[str, Any]],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Migrate to the new version."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError
+        # Version 2 stores the states as items of the append log
+        return {
+            COLLECTION_STATES: [
+                {"id": item["state"]["entity_id"], **item} for item in old_data
+            ],
+            COLLECTION_DUMP: [],
+        }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -134,11 +177,12 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, append_log=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._stored_items: dict[str, _StoredItem] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -163,10 +207,17 @@ class RestoreStateData:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            last_dump: str | datetime = dt_util.utcnow()
+            for dump in stored_states[COLLECTION_DUMP]:
+                last_dump = dump["last_seen"]
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
+                item["id"]: StoredState.from_dict(
+                    item
+                    if item["last_seen"] is not None
+                    else {**item, "last_seen": last_dump}
+                )
+                for item in stored_states[COLLECTION_STATES]
+                if valid_entity_id(item["id"])
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
@@ -178,7 +229,16 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
-        now = dt_util.utcnow()
+        current_states, previous_states = self._async_get_stored_states(
+            dt_util.utcnow()
+        )
+        return [*current_states, *previous_states]
+
+    @callback
+    def _async_get_stored_states(
+        self, now: datetime
+    ) -> tuple[list[StoredState], list[StoredState]]:
+        """Get the states of the registered entities and the previous states."""
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_states_by_entity_id = {
@@ -188,7 +248,7 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
+        current_states = [
             StoredState(
                 current_states_by_entity_id[entity_id],
                 entity.extra_restore_state_data,
@@ -198,6 +258,7 @@ class RestoreStateData:
             if entity_id in current_states_by_entity_id
         ]
         expiration_time = now - STATE_EXPIRATION
+        previous_states: list[StoredState] = []
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -210,20 +271,79 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            previous_states.append(stored_state)
 
-        return stored_states
+        return current_states, previous_states
+
+    @callback
+    def _async_get_items(self) -> dict[str, Mapping[str, Any]]:
+        """Get the items to store.
+
+        The item of an entity is only serialized again if its state, extra
+        data or last_seen changed since the last dump, the store only
+        writes the items which are not the same object as last time.
+        The registered entities are stored without a last_seen, the time of
+        the dump is stored once instead of changing all their items.
+        """
+        now = dt_util.utcnow()
+        current_states, previous_states = self._async_get_stored_states(now)
+        previous_items = self._stored_items
+        stored_items: dict[str, _StoredItem] = {}
+        for stored_states, current in (
+            (current_states, True),
+            (previous_states, False),
+        ):
+            for stored_state in stored_states:
+                state = stored_state.state
+                entity_id = state.entity_id
+                last_seen = None if current else stored_state.last_seen
+                try:
+                    extra_data = json_bytes(
+                        stored_state.extra_data.as_dict()
+                        if stored_state.extra_data
+                        else None
+                    )
+                except TypeError as err:
+                    _LOGGER.error(
+                        "Error serializing the extra data of %s: %s", entity_id, err
+                    )
+                    continue
+                if (
+                    (stored_item := previous_items.get(entity_id)) is None
+                    or stored_item.state is not state
+                    or stored_item.extra_data != extra_data
+                    or stored_item.last_seen != last_seen
+                ):
+                    stored_item = _StoredItem(
+                        state,
+                        extra_data,
+                        last_seen,
+                        json_fragment(
+                            json_bytes(
+                                {
+                                    "id": entity_id,
+                                    "state": state.json_fragment,
+                                    "extra_data": json_fragment(extra_data),
+                                    "last_seen": last_seen,
+                                }
+                            )
+                        ),
+                    )
+                stored_items[entity_id] = stored_item
+        self._stored_items = stored_items
+        return {
+            COLLECTION_STATES: {
+                entity_id: stored_item.item
+                for entity_id, stored_item in stored_items.items()
+            },
+            COLLECTION_DUMP: {LAST_DUMP_ID: {"id": LAST_DUMP_ID, "last_seen": now}},
+        }
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save_items(self._async_get_items())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
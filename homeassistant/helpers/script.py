@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -42,6 +42,7 @@ from homeassistant.const import (
     CONF_DOMAIN,
     CONF_ELSE,
     CONF_ENABLED,
+    CONF_ENTITY_ID,
     CONF_ERROR,
     CONF_EVENT,
     CONF_EVENT_DATA,
@@ -67,6 +68,8 @@ from homeassistant.const import (
     CONF_WAIT_FOR_TRIGGER,
     CONF_WAIT_TEMPLATE,
     CONF_WHILE,
+    ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_ON,
 )
@@ -79,6 +82,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -97,6 +101,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -406,6 +411,7 @@ class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _script_step: _ScriptStep
 
     def __init__(
         self,
@@ -491,45 +497,53 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        if not trace_enabled():
+            # The run is not traced, skip creating the trace elements
+            await self._async_run_step(log_exceptions, None)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
-                if self._stop.done():
-                    return
-
-                action = cv.determine_script_action(self._action)
-
-                if CONF_ENABLED in self._action:
-                    enabled = self._action[CONF_ENABLED]
-                    if isinstance(enabled, Template):
-                        try:
-                            enabled = enabled.async_render(limited=True)
-                        except exceptions.TemplateError as ex:
-                            self._handle_exception(
-                                ex,
-                                continue_on_error,
-                                self._log_exceptions or log_exceptions,
-                            )
-                    if not enabled:
-                        self._log(
-                            "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
-                        )
-                        trace_set_result(enabled=False)
-                        return
+                await self._async_run_step(log_exceptions, trace_element)
+
+    async def _async_run_step(
+        self, log_exceptions: bool, trace_element: TraceElement | None
+    ) -> None:
+        self._script_step = script_step = self._script._get_step(self._step)  # noqa: SLF001
+        continue_on_error = script_step.continue_on_error
+
+        if self._stop.done():
+            return
 
-                handler = f"_async_{action}_step"
+        if (enabled := script_step.enabled) is not True:
+            if isinstance(enabled, Template):
                 try:
-                    await getattr(self, handler)()
-                except Exception as ex:  # noqa: BLE001
+                    enabled = enabled.async_render(limited=True)
+                except exceptions.TemplateError as ex:
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
-                finally:
-                    trace_element.update_variables(self._variables)
+            if not enabled:
+                self._log(
+                    "Skipped disabled step %s",
+                    self._action.get(CONF_ALIAS, script_step.action),
+                )
+                trace_set_result(enabled=False)
+                return
+
+        try:
+            await script_step.handler(self)
+        except Exception as ex:  # noqa: BLE001
+            self._handle_exception(
+                ex, continue_on_error, self._log_exceptions or log_exceptions
+            )
+        finally:
+            if trace_element is not None:
+                trace_element.update_variables(self._variables)
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
@@ -732,9 +746,13 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        if (static_params := self._script_step.service_params) is not None:
+            # Copy the parameters as the service call updates the service data
+            params = cast(service.ServiceParams, _copy_static(static_params))
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -797,7 +815,19 @@ class _ScriptRun:
     async def _async_event_step(self) -> None:
         """Fire an event."""
         self._step_log(self._action.get(CONF_ALIAS, self._action[CONF_EVENT]))
-        event_data = {}
+        event_data: dict[str, Any] = {}
+        if (static_event_data := self._script_step.event_data) is not None:
+            event_data = _copy_static(static_event_data)
+        else:
+            self._render_event_data(event_data)
+
+        trace_set_result(event=self._action[CONF_EVENT], event_data=event_data)
+        self._hass.bus.async_fire_internal(
+            self._action[CONF_EVENT], event_data, context=self._context
+        )
+
+    def _render_event_data(self, event_data: dict[str, Any]) -> None:
+        """Render the event data of an event step."""
         for conf in (CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE):
             if conf not in self._action:
                 continue
@@ -811,17 +841,15 @@ class _ScriptRun:
                     "Error rendering event data template: %s", ex, level=logging.ERROR
                 )
 
-        trace_set_result(event=self._action[CONF_EVENT], event_data=event_data)
-        self._hass.bus.async_fire_internal(
-            self._action[CONF_EVENT], event_data, context=self._context
-        )
-
     async def _async_condition_step(self) -> None:
         """Test if condition is matching."""
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        if (cond := self._script_step.condition) is None:
+            cond = self._script_step.condition = await self._async_get_condition(
+                self._action
+            )
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1382,6 +1410,105 @@ class _IfData(TypedDict):
     if_else: Script | None
 
 
+def _is_static(value: Any) -> bool:
+    """Test if a data structure has no templates or only static templates."""
+    if isinstance(value, Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static(val) for val in value)
+    if isinstance(value, Mapping):
+        return all(_is_static(val) for val in value) and all(
+            _is_static(val) for val in value.values()
+        )
+    return True
+
+
+def _copy_static(value: Any) -> Any:
+    """Copy the lists and dicts of a rendered static data structure."""
+    if isinstance(value, list):
+        return [_copy_static(val) for val in value]
+    if isinstance(value, dict):
+        return {key: _copy_static(val) for key, val in value.items()}
+    return value
+
+
+class _ScriptStep:
+    """A step of a script prepared for running it repeatedly.
+
+    The handler of the step is looked up once and the parts of the step which
+    do not depend on the variables of a run are rendered once.
+    """
+
+    __slots__ = (
+        "action",
+        "condition",
+        "continue_on_error",
+        "enabled",
+        "event_data",
+        "handler",
+        "service_params",
+    )
+
+    def __init__(self, hass: HomeAssistant, config: ConfigType) -> None:
+        """Prepare the step."""
+        self.action = action = cv.determine_script_action(config)
+        self.handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]] = getattr(
+            _ScriptRun, f"_async_{action}_step"
+        )
+        self.continue_on_error: bool = config.get(CONF_CONTINUE_ON_ERROR, False)
+        self.enabled: Any = config.get(CONF_ENABLED, True)
+        if isinstance(self.enabled, Template) and self.enabled.is_static:
+            self.enabled = self.enabled.async_render(limited=True)
+        # The condition of a condition step, created when it is first run
+        self.condition: ConditionCheckerType | None = None
+        self.event_data: dict[str, Any] | None = None
+        self.service_params: service.ServiceParams | None = None
+        if action == cv.SCRIPT_ACTION_FIRE_EVENT:
+            self.event_data = self._render_static_event_data(config)
+        elif action == cv.SCRIPT_ACTION_CALL_SERVICE:
+            self.service_params = self._prepare_static_service_call(hass, config)
+
+    @staticmethod
+    def _render_static_event_data(config: ConfigType) -> dict[str, Any] | None:
+        """Render the event data if it has no dynamic templates."""
+        event_data: dict[str, Any] = {}
+        for conf in (CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE):
+            if conf not in config:
+                continue
+            if not _is_static(config[conf]):
+                return None
+            event_data.update(template.render_complex(config[conf]))
+        return event_data
+
+    @staticmethod
+    def _prepare_static_service_call(
+        hass: HomeAssistant, config: ConfigType
+    ) -> service.ServiceParams | None:
+        """Prepare the service call if it has no dynamic templates.
+
+        The service, data and target are rendered once, the targets are not
+        resolved. Device, area, floor and label targets are resolved by the
+        service on each call. Service calls targeting entities by their
+        registry id are prepared on each run since the entity id can change.
+        """
+        if not _is_static(config):
+            return None
+        try:
+            params = service.async_prepare_call_from_config(hass, config)
+        except exceptions.HomeAssistantError:
+            # Raise the error when the step is run
+            return None
+        if CONF_TARGET in config and CONF_ENTITY_ID in (
+            target := template.render_complex(config[CONF_TARGET])
+        ):
+            entity_ids = cv.comp_entity_ids_or_uuids(target[CONF_ENTITY_ID])
+            if entity_ids not in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE) and not all(
+                valid_entity_id(entity_id) for entity_id in entity_ids
+            ):
+                return None
+        return params
+
+
 @dataclass
 class ScriptRunResult:
     """Container with the result of a script run."""
@@ -1456,6 +1583,7 @@ class Script:
         self._if_data: dict[int, _IfData] = {}
         self._parallel_scripts: dict[int, list[Script]] = {}
         self._sequence_scripts: dict[int, Script] = {}
+        self._steps: dict[int, _ScriptStep] = {}
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
         self._copy_variables_on_run = copy_variables
@@ -1827,6 +1955,13 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    def _get_step(self, step: int) -> _ScriptStep:
+        if not (script_step := self._steps.get(step)):
+            script_step = self._steps[step] = _ScriptStep(
+                self._hass, self.sequence[step]
+            )
+        return script_step
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
@@ -2059,6 +2194,13 @@ def breakpoint_set(
     breakpoints[key][run_id].add(node)
 
 
+@callback
+def breakpoint_is_set(hass: HomeAssistant, key: str) -> bool:
+    """Return if a breakpoint is set for a script or automation."""
+    breakpoints = hass.data.get(DATA_SCRIPT_BREAKPOINTS, {})
+    return any(breakpoints.get(key, {}).values())
+
+
 @callback
 def breakpoint_list(hass: HomeAssistant) -> list[dict[str, Any]]:
     """List breakpoints."""
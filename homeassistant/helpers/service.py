@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -80,6 +81,16 @@ ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
 
+# The device, area, floor and label ids of a target
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+# The entities, devices and areas which the device, area, floor and label
+# ids of a target resolve to, cleared when one of the registries changes
+RESOLVED_TARGETS_CACHE: HassKey[dict[_TargetKey, SelectedEntities]] = HassKey(
+    "resolved_targets_cache"
+)
+MAX_RESOLVED_TARGETS = 256
+
 
 @cache
 def _base_components() -> dict[str, ModuleType]:
@@ -502,7 +513,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,27 +537,85 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    key: _TargetKey = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    resolved_targets = _async_get_resolved_targets_cache(hass)
+    if (resolved := resolved_targets.get(key)) is None:
+        resolved = resolved_targets[key] = _async_resolve_registry_targets(hass, *key)
+        if len(resolved_targets) > MAX_RESOLVED_TARGETS:
+            del resolved_targets[next(iter(resolved_targets))]
+
+    # Copy the resolved targets since the caller may change them
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_get_resolved_targets_cache(
+    hass: HomeAssistant,
+) -> dict[_TargetKey, SelectedEntities]:
+    """Return the cache of the resolved targets."""
+    if (resolved_targets := hass.data.get(RESOLVED_TARGETS_CACHE)) is not None:
+        return resolved_targets
+    resolved_targets = hass.data[RESOLVED_TARGETS_CACHE] = {}
+
+    @callback
+    def _async_clear_resolved_targets(_event: Event[Any]) -> None:
+        """Clear the resolved targets when a registry changed."""
+        resolved_targets.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+        label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, _async_clear_resolved_targets)
+    return resolved_targets
+
+
+@callback
+def _async_resolve_registry_targets(  # noqa: C901
+    hass: HomeAssistant,
+    device_ids: frozenset[str],
+    area_ids: frozenset[str],
+    floor_ids: frozenset[str],
+    label_ids: frozenset[str],
+) -> SelectedEntities:
+    """Resolve device, area, floor and label ids with the registries."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
-    if selector.floor_ids:
+    if floor_ids:
         floor_reg = floor_registry.async_get(hass)
-        for floor_id in selector.floor_ids:
+        for floor_id in floor_ids:
             if floor_id not in floor_reg.floors:
                 selected.missing_floors.add(floor_id)
 
-    for area_id in selector.area_ids:
+    for area_id in area_ids:
         if area_id not in area_reg.areas:
             selected.missing_areas.add(area_id)
 
-    for device_id in selector.device_ids:
+    for device_id in device_ids:
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
-    if selector.label_ids:
+    if label_ids:
         label_reg = label_registry.async_get(hass)
-        for label_id in selector.label_ids:
+        for label_id in label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
@@ -564,17 +633,17 @@ def async_extract_referenced_entity_ids(  # noqa: C901
                 selected.referenced_areas.add(area_entry.id)
 
     # Find areas for targeted floors
-    if selector.floor_ids:
+    if floor_ids:
         selected.referenced_areas.update(
             area_entry.id
-            for floor_id in selector.floor_ids
+            for floor_id in floor_ids
             for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
         )
 
     # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
+    selected.referenced_devices.update(device_ids)
 
-    selected.referenced_areas.update(selector.area_ids)
+    selected.referenced_areas.update(area_ids)
     if selected.referenced_areas:
         for area_id in selected.referenced_areas:
             selected.referenced_devices.update(
@@ -611,7 +680,7 @@ def async_extract_referenced_entity_ids(  # noqa: C901
                 # has no explicitly set area
                 not entry.area_id
                 # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+                or device_id in device_ids
             )
         )
     )
@@ -0,0 +1,335 @@
+"""Trace where the time is spent while Home Assistant starts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Executor, Future
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import partial
+import logging
+from operator import attrgetter
+import os
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+from .json import json_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TRACER: HassKey[StartupTracer] = HassKey("startup_tracer")
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+# The whole set up of an integration, named after its domain
+CATEGORY_SETUP = "setup"
+# Waiting for the dependencies of an integration to be set up
+CATEGORY_DEPENDENCIES = "dependencies"
+# Waiting for the import of an integration including the executor queue
+CATEGORY_COMPONENT_IMPORT = "component_import"
+# A phase of the set up, see homeassistant.setup.SetupPhases
+CATEGORY_SETUP_PHASE = "setup_phase"
+# A set up waiting for another operation, see homeassistant.setup.SetupPhases
+CATEGORY_SETUP_WAIT = "setup_wait"
+# Importing a module including the modules it imports
+CATEGORY_IMPORT = "import"
+# Running a job in an executor
+CATEGORY_EXECUTOR = "executor"
+
+# A dependency is only on the critical path if the integration
+# waited at least this many seconds for its dependencies
+MIN_DEPENDENCY_WAIT = 0.001
+
+REPORT_TOP_COUNT = 10
+
+
+@dataclass(slots=True)
+class TraceSpan:
+    """A span of time spent on something during the startup."""
+
+    name: str
+    category: str
+    lane: str
+    start: float
+    end: float
+    args: dict[str, Any] | None = None
+
+    @property
+    def duration(self) -> float:
+        """Return the duration of the span."""
+        return self.end - self.start
+
+
+def _job_name(target: Callable[..., Any]) -> str:
+    """Return the name of an executor job."""
+    while isinstance(target, partial):
+        target = target.func
+    return getattr(target, "__qualname__", None) or repr(target)
+
+
+class StartupTracer:
+    """Record the imports, setups and executor jobs of the startup.
+
+    Spans are added from the event loop and the executor threads, adding
+    a span is an append to a list which is thread-safe. When Home Assistant
+    has started the critical path of the startup is logged and all spans are
+    written in the Chrome trace event format which can be opened with
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracer."""
+        self.hass = hass
+        self.start = time.monotonic()
+        self.spans: list[TraceSpan] = []
+        self._unwrap_executors: list[Callable[[], None]] = []
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        lane: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span."""
+        self.spans.append(TraceSpan(name, category, lane, start, end, args))
+
+    @contextmanager
+    def trace(
+        self,
+        name: str,
+        category: str,
+        lane: str | None = None,
+        args: dict[str, Any] | None = None,
+    ) -> Generator[None]:
+        """Trace the time spent in the context.
+
+        The lane defaults to the name of the current thread.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_span(
+                name,
+                category,
+                lane or threading.current_thread().name,
+                start,
+                time.monotonic(),
+                args,
+            )
+
+    def _wrap_executor(self, executor: Executor) -> None:
+        """Trace the jobs of an executor and the time they were queued."""
+        submit = executor.submit
+
+        def _traced_submit(
+            fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+        ) -> Future[Any]:
+            """Submit a traced job."""
+            queued = time.monotonic()
+
+            def _run_traced() -> Any:
+                """Run the job."""
+                start = time.monotonic()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.add_span(
+                        _job_name(fn),
+                        CATEGORY_EXECUTOR,
+                        threading.current_thread().name,
+                        start,
+                        time.monotonic(),
+                        {"queue_wait": start - queued},
+                    )
+
+            return submit(_run_traced)
+
+        executor.submit = _traced_submit  # type: ignore[method-assign]
+        self._unwrap_executors.append(partial(delattr, executor, "submit"))
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracing the executors and write the trace once started."""
+        if default_executor := getattr(self.hass.loop, "_default_executor", None):
+            self._wrap_executor(default_executor)
+        self._wrap_executor(self.hass.import_executor)
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_write_trace
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracing."""
+        if self.hass.data.get(DATA_STARTUP_TRACER) is self:
+            del self.hass.data[DATA_STARTUP_TRACER]
+        while self._unwrap_executors:
+            self._unwrap_executors.pop()()
+
+    async def _async_write_trace(self, _event: Event) -> None:
+        """Log the critical path and write the trace."""
+        self.async_stop()
+        _LOGGER.info("Startup report:\n%s", self.report())
+        path = self.hass.config.path(STARTUP_TRACE_FILE)
+        await self.hass.async_add_executor_job(
+            write_utf8_file, path, json_bytes(self.chrome_trace())
+        )
+        _LOGGER.info("Startup trace written to %s", path)
+
+    def _spans_by_name(self, category: str) -> dict[str, TraceSpan]:
+        """Return the spans of a category by their name."""
+        return {span.name: span for span in self.spans if span.category == category}
+
+    def critical_path(self) -> list[TraceSpan]:
+        """Return the setups on the critical path of the startup.
+
+        The path ends with the setup which finished last and goes back
+        through the dependency which finished last while the setup was
+        waiting for its dependencies.
+        """
+        setups = self._spans_by_name(CATEGORY_SETUP)
+        if not setups:
+            return []
+        dependency_waits = self._spans_by_name(CATEGORY_DEPENDENCIES)
+        current = max(setups.values(), key=attrgetter("end"))
+        path = [current]
+        while (
+            wait := dependency_waits.get(current.name)
+        ) is not None and wait.duration >= MIN_DEPENDENCY_WAIT:
+            blocking = [
+                setup
+                for dependency in (wait.args or {}).get("dependencies", ())
+                if (setup := setups.get(dependency)) is not None
+                and setup not in path
+                and setup.end <= wait.end + MIN_DEPENDENCY_WAIT
+            ]
+            if not blocking:
+                break
+            current = max(blocking, key=attrgetter("end"))
+            path.append(current)
+        path.reverse()
+        return path
+
+    def report(self) -> str:
+        """Return a report of the critical path, imports and executor waits."""
+        path = self.critical_path()
+        dependency_waits = self._spans_by_name(CATEGORY_DEPENDENCIES)
+        component_imports = self._spans_by_name(CATEGORY_COMPONENT_IMPORT)
+        lines = ["Critical path:"]
+        for setup in path:
+            wait = dependency_waits.get(setup.name)
+            component_import = component_imports.get(setup.name)
+            lines.append(
+                f"  {setup.start - self.start:8.3f}s {setup.name}:"
+                f" dependencies {wait.duration if wait else 0:.3f}s,"
+                " import"
+                f" {component_import.duration if component_import else 0:.3f}s,"
+                f" total {setup.duration:.3f}s"
+            )
+        if path:
+            lines.append(f"  finished at {path[-1].end - self.start:.3f}s")
+
+        lines.append("Slowest imports:")
+        lines.extend(
+            f"  {span.duration:8.3f}s {span.name}"
+            for span in _slowest(
+                span for span in self.spans if span.category == CATEGORY_IMPORT
+            )
+        )
+
+        executor_jobs = [
+            span for span in self.spans if span.category == CATEGORY_EXECUTOR
+        ]
+        queue_waits = [span.args["queue_wait"] for span in executor_jobs if span.args]
+        lines.append(
+            f"Executor jobs: {len(executor_jobs)},"
+            f" queue wait total {sum(queue_waits):.3f}s,"
+            f" max {max(queue_waits, default=0):.3f}s"
+        )
+        lines.append("Longest executor queue waits:")
+        lines.extend(
+            f"  {span.args['queue_wait']:8.3f}s {span.name} ({span.lane})"
+            for span in sorted(
+                executor_jobs,
+                key=lambda span: span.args["queue_wait"] if span.args else 0,
+                reverse=True,
+            )[:REPORT_TOP_COUNT]
+            if span.args
+        )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format."""
+        pid = os.getpid()
+        lane_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in self.spans:
+            if (lane_id := lane_ids.get(span.lane)) is None:
+                lane_id = lane_ids[span.lane] = len(lane_ids) + 1
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - self.start) * 1_000_000),
+                "dur": round(span.duration * 1_000_000),
+                "pid": pid,
+                "tid": lane_id,
+            }
+            if span.args:
+                event["args"] = span.args
+            events.append(event)
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane_id,
+                "args": {"name": lane},
+            }
+            for lane, lane_id in lane_ids.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _slowest(spans: Iterable[TraceSpan]) -> list[TraceSpan]:
+    """Return the slowest spans."""
+    return sorted(spans, key=attrgetter("duration"), reverse=True)[:REPORT_TOP_COUNT]
+
+
+@callback
+def async_enable_startup_trace(hass: HomeAssistant) -> StartupTracer:
+    """Enable tracing the startup."""
+    tracer = hass.data[DATA_STARTUP_TRACER] = StartupTracer(hass)
+    tracer.async_start()
+    return tracer
+
+
+def trace_startup(
+    hass: HomeAssistant,
+    name: str,
+    category: str,
+    lane: str | None = None,
+    args: dict[str, Any] | None = None,
+) -> AbstractContextManager[None]:
+    """Trace the time spent in the context if the startup is traced.
+
+    This method is thread-safe.
+    """
+    if (tracer := hass.data.get(DATA_STARTUP_TRACER)) is None:
+        return nullcontext()
+    return tracer.trace(name, category, lane, args)
+
+
+@callback
+def async_get_startup_tracer(hass: HomeAssistant) -> StartupTracer | None:
+    """Return the startup tracer if the startup is traced."""
+    return hass.data.get(DATA_STARTUP_TRACER)
@@ -34,6 +34,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -49,6 +50,9 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# Number of records after which the append log is compacted into the snapshot
+APPEND_LOG_MAX_RECORDS = 1000
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -90,6 +94,36 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+def _items_to_data(
+    items: Mapping[str, Mapping[str, Any]],
+) -> dict[str, list[Any]]:
+    """Convert items keyed by collection and id to a list per collection."""
+    return {
+        collection: list(collection_items.values())
+        for collection, collection_items in items.items()
+    }
+
+
+def _apply_log_records(
+    data: Mapping[str, list[dict[str, Any]]], records: Iterable[dict[str, Any]]
+) -> dict[str, list[Any]]:
+    """Apply append log records to the data of a snapshot.
+
+    Changed items keep their position, added items are appended.
+    """
+    collections = {
+        collection: {item["id"]: item for item in items}
+        for collection, items in data.items()
+    }
+    for record in records:
+        items = collections.setdefault(record["collection"], {})
+        if record.get("removed"):
+            items.pop(record["id"], None)
+        else:
+            items[record["id"]] = record["item"]
+    return _items_to_data(collections)
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -242,8 +276,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        append_log: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If append_log is set, changes saved with async_delay_save_items are
+        appended to a log next to the snapshot file instead of rewriting it,
+        the log is compacted into the snapshot once it grows too large and
+        on the final write when Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +300,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self.append_log = append_log
+        # Items of the last write which are compared by identity
+        # to find the changed items to append to the log
+        self._written_items: Mapping[str, Mapping[str, Any]] | None = None
+        self._log_id: str | None = None
+        self._log_records = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def log_path(self) -> str:
+        """Return the path of the append log."""
+        return f"{self.path}.log"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -318,6 +370,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            elif "items_func" in data:
+                data["data"] = _items_to_data(data.pop("items_func")())
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
@@ -388,6 +442,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self.append_log and self._data is None:
+            data = await self.hass.async_add_executor_job(self._load_log, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -436,6 +493,24 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         await self._async_handle_write_data()
 
+    async def async_save_items(self, items: Mapping[str, Mapping[str, Any]]) -> None:
+        """Save items keyed by collection and id.
+
+        See async_delay_save_items for the format of the items.
+        """
+        self._data = {
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "key": self.key,
+            "items_func": lambda: items,
+        }
+
+        if self.hass.state is CoreState.stopping:
+            self._async_ensure_final_write_listener()
+            return
+
+        await self._async_handle_write_data()
+
     @callback
     def async_delay_save(
         self,
@@ -443,12 +518,45 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         delay: float = 0,
     ) -> None:
         """Save data with an optional delay."""
-        self._data = {
-            "version": self.version,
-            "minor_version": self.minor_version,
-            "key": self.key,
-            "data_func": data_func,
-        }
+        self._async_delay_save(
+            {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "key": self.key,
+                "data_func": data_func,
+            },
+            delay,
+        )
+
+    @callback
+    def async_delay_save_items(
+        self,
+        items_func: Callable[[], Mapping[str, Mapping[str, Any]]],
+        delay: float = 0,
+    ) -> None:
+        """Save items keyed by collection and id with an optional delay.
+
+        The data of the store is a dict with the list of items of each
+        collection, the id of an item is stored in its "id" key.
+
+        Stores with an append log only append the items which were added,
+        changed or removed since the last write. Items are compared by
+        identity so they should be immutable, like cached json fragments.
+        """
+        self._async_delay_save(
+            {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "key": self.key,
+                "items_func": items_func,
+            },
+            delay,
+        )
+
+    @callback
+    def _async_delay_save(self, data: dict[str, Any], delay: float) -> None:
+        """Schedule writing data with a delay."""
+        self._data = data
 
         next_when = self.hass.loop.time() + delay
         if self._delay_handle and self._delay_handle.when() < next_when:
@@ -518,30 +626,54 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(compact_log=self.append_log)
+
+    async def _async_handle_write_data(
+        self, *_args: Any, compact_log: bool = False
+    ) -> None:
+        """Handle writing the config.
 
-    async def _async_handle_write_data(self, *_args):
-        """Handle writing the config."""
+        If compact_log is set, the snapshot is written and the append log is
+        removed, even if there is no new data to write.
+        """
         async with self._write_lock:
             self._manager.async_invalidate(self.key)
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
-            if self._data is None:
+            if self._data is not None:
+                data = self._data
+                self._data = None
+            elif (
+                compact_log
+                and self._log_records
+                and (written_items := self._written_items) is not None
+            ):
+                data = {
+                    "version": self.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "items_func": lambda: written_items,
+                }
+            else:
                 # Another write already consumed the data
                 return
 
-            data = self._data
-            self._data = None
-
             if self._read_only:
                 return
 
+            if compact_log:
+                data["compact_log"] = True
+
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._log_records:
+                # Compact the log into the snapshot when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -549,8 +681,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        items: Mapping[str, Mapping[str, Any]] | None = None
+        compact_log = data.pop("compact_log", False)
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
+        elif "items_func" in data:
+            items = items_to_write = data.pop("items_func")()
+            if self.append_log and not compact_log and self._append_log(items_to_write):
+                return
+            data["data"] = _items_to_data(items_to_write)
+
+        if self.append_log:
+            # The log id links the log to the snapshot so a log that
+            # was not removed after writing the snapshot is not replayed
+            data["log_id"] = ulid_now()
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
@@ -561,6 +705,113 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self.append_log:
+            self._written_items = items
+            self._log_id = data["log_id"]
+            self._log_records = 0
+            with suppress(FileNotFoundError):
+                os.unlink(self.log_path)
+                self._fsync_dir()
+
+    def _append_log(self, items: Mapping[str, Mapping[str, Any]]) -> bool:
+        """Append the changed items to the log.
+
+        Returns False if the snapshot must be written instead.
+        """
+        if (written_items := self._written_items) is None or (
+            written_items.keys() != items.keys()
+        ):
+            return False
+
+        records: list[dict[str, Any]] = []
+        for collection, collection_items in items.items():
+            written_collection_items = written_items[collection]
+            records.extend(
+                {"collection": collection, "id": item_id, "item": item}
+                for item_id, item in collection_items.items()
+                if written_collection_items.get(item_id) is not item
+            )
+            records.extend(
+                {"collection": collection, "id": item_id, "removed": True}
+                for item_id in written_collection_items
+                if item_id not in collection_items
+            )
+
+        if self._log_records + len(records) > APPEND_LOG_MAX_RECORDS:
+            return False
+
+        if records:
+            lines = [json_helper.json_bytes(record) for record in records]
+            flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+            if not self._log_records:
+                # Replace a log left behind by an interrupted compaction
+                flags |= os.O_TRUNC
+                lines.insert(0, json_helper.json_bytes({"log_id": self._log_id}))
+            _LOGGER.debug(
+                "Appending %s records for %s to %s",
+                len(records),
+                self.key,
+                self.log_path,
+            )
+            try:
+                fd = os.open(self.log_path, flags, 0o600 if self._private else 0o644)
+                with os.fdopen(fd, "wb") as fdesc:
+                    fdesc.write(b"\n".join(lines) + b"\n")
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+                if not self._log_records:
+                    self._fsync_dir()
+            except OSError as err:
+                raise WriteError(err) from err
+            self._log_records += len(records)
+
+        self._written_items = items
+        return True
+
+    def _fsync_dir(self) -> None:
+        """Flush the creation or removal of the append log to the disk."""
+        fd = os.open(os.path.dirname(self.log_path), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _load_log(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Replay the append log on top of the data of the snapshot."""
+        try:
+            with open(self.log_path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        records: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                records.append(json_util.json_loads_object(line))
+            except ValueError:
+                # A write of the log was interrupted, the
+                # records after it cannot have been written
+                _LOGGER.warning(
+                    "Ignoring truncated record in %s for %s", self.log_path, self.key
+                )
+                break
+
+        if (
+            not records
+            or (log_id := records[0].get("log_id")) is None
+            or log_id != data.get("log_id")
+        ):
+            _LOGGER.debug("Ignoring stale log %s for %s", self.log_path, self.key)
+            return data
+
+        _LOGGER.debug(
+            "Replaying %s records from %s for %s",
+            len(records) - 1,
+            self.log_path,
+            self.key,
+        )
+        return {**data, "data": _apply_log_records(data["data"], records[1:])}
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +824,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self.append_log:
+            self._written_items = None
+            self._log_records = 0
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.log_path)
@@ -12,16 +12,21 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -44,14 +49,17 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -69,6 +77,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -85,6 +94,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +112,13 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_TEMPLATE_CODE_CACHE: HassKey[TemplateCodeCache] = HassKey("template.code_cache")
+
+TEMPLATE_CODE_CACHE_FILE = "core.template_code"
+TEMPLATE_CODE_CACHE_SIZE = 4096
+TEMPLATE_CODE_CACHE_SAVE_DELAY = 60
+_CODE_CACHE_FLAVORS = ("default", "limited", "strict")
+_SOURCE_HASH_LENGTH = hashlib.sha256().digest_size * 2
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -2808,6 +2825,147 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_template_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates from the previous run.
+
+    Templates compiled before the cache is loaded are compiled as usual.
+    """
+    code_cache = TemplateCodeCache(hass)
+    await code_cache.async_load()
+    hass.data[_TEMPLATE_CODE_CACHE] = code_cache
+
+
+def _source_hash(source: str) -> str:
+    """Return the hash of a template source."""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+class TemplateCodeCache:
+    """A persistent LRU cache of compiled template code.
+
+    Jinja compiles a template into Python code, which can be marshalled
+    to disk so unchanged templates do not have to be parsed and compiled
+    again on the next start. The cache is discarded when the Python,
+    Jinja or Home Assistant version changes as the code depends on them,
+    and each entry is bound to the flavor and the hash of the template
+    source it was compiled from.
+
+    The cached code is executed when a template is rendered and marshal
+    offers no protection against malicious data, so the cache file is
+    trusted like the rest of the configuration directory. Anyone who can
+    write to it can already change the configuration; it must not be
+    restored from untrusted sources.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the template code cache."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, TEMPLATE_CODE_CACHE_FILE)
+        self._codes: LRU[tuple[str, str], CodeType] = LRU(TEMPLATE_CODE_CACHE_SIZE)
+        self._version = (MAGIC_NUMBER, sys.version, jinja2.__version__, __version__)
+        # Only accessed from the event loop
+        self._save_scheduled = False
+        self._save_timer: asyncio.TimerHandle | None = None
+
+    def get(self, flavor: str, source: str) -> CodeType | None:
+        """Return the code compiled from a template source."""
+        return self._codes.get((flavor, _source_hash(source)))
+
+    def set(self, flavor: str, source: str, code: CodeType) -> None:
+        """Store the code compiled from a template source and schedule a save.
+
+        Templates may be compiled outside of the event loop.
+        """
+        self._codes[(flavor, _source_hash(source))] = code
+        if self.hass.loop_thread_id == threading.get_ident():
+            self._async_schedule_save()
+        else:
+            self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        for flavor, source_hash, code in await self.hass.async_add_executor_job(
+            self._load
+        ):
+            self._codes[(flavor, source_hash)] = code
+
+        @callback
+        def _async_final_write(_: Event) -> None:
+            if self._save_scheduled:
+                self.hass.async_create_task(self.async_save(), eager_start=True)
+
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_write
+        )
+
+    def _load(self) -> list[tuple[str, str, CodeType]]:
+        """Load the cached code, least recently used first."""
+        try:
+            with open(self.path, "rb") as file:
+                version, codes = marshal.load(file)
+        except FileNotFoundError:
+            return []
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding template code cache %s: %s", self.path, err)
+            return []
+        if version != self._version:
+            _LOGGER.debug("Discarding template code cache from %s", version)
+            return []
+        if type(codes) is not list or not all(
+            type(entry) is tuple
+            and len(entry) == 3
+            and entry[0] in _CODE_CACHE_FLAVORS
+            and type(entry[1]) is str
+            and len(entry[1]) == _SOURCE_HASH_LENGTH
+            and type(entry[2]) is CodeType
+            for entry in codes
+        ):
+            _LOGGER.debug("Discarding malformed template code cache %s", self.path)
+            return []
+        return codes
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the cache once the templates compiled together are done."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._save_timer = self.hass.loop.call_later(
+            TEMPLATE_CODE_CACHE_SAVE_DELAY, self._async_create_save_task
+        )
+
+    @callback
+    def _async_create_save_task(self) -> None:
+        """Create a task to save the cache."""
+        self._save_timer = None
+        self.hass.async_create_task(self.async_save(), eager_start=True)
+
+    async def async_save(self) -> None:
+        """Save the cache to disk."""
+        if self._save_timer:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if not self._save_scheduled:
+            return
+        self._save_scheduled = False
+        # The LRU returns the most recently used items first
+        codes = [
+            (flavor, source_hash, code)
+            for (flavor, source_hash), code in reversed(self._codes.items())
+        ]
+        await self.hass.async_add_executor_job(
+            self._save, marshal.dumps((self._version, codes))
+        )
+
+    def _save(self, data: bytes) -> None:
+        """Write the cache to disk."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_utf8_file(self.path, data, True, "wb")
+        except WriteError as err:
+            _LOGGER.error("Error writing template code cache: %s", err)
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2854,6 +3012,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Environments with a custom log function are not shared
+        # so their templates are not worth caching across restarts
+        self._code_cache_flavor: str | None = None
+        if hass is not None and log_fn is None:
+            self._code_cache_flavor = (
+                "limited" if limited else "strict" if strict else "default"
+            )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3209,7 +3374,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            (flavor := self._code_cache_flavor) is not None
+            and self.hass is not None
+            and type(source) is str
+            and (code_cache := self.hass.data.get(_TEMPLATE_CODE_CACHE)) is not None
+        ):
+            if (compiled := code_cache.get(flavor, source)) is None:
+                compiled = super().compile(source)
+                code_cache.set(flavor, source, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -0,0 +1,289 @@
+"""Batch the timers of the time trackers on a single event loop timer."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, tzinfo
+from heapq import heappop, heappush
+import logging
+import math
+import time
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("timer_wheel")
+DATA_MONOTONIC_TIMER_WHEEL: HassKey[TimerWheel] = HassKey("monotonic_timer_wheel")
+
+# The timers due within the same slot of this many seconds are run together
+TIMER_WHEEL_RESOLUTION = 0.05
+# The number of slots of a rotation, timers due in a later rotation are
+# kept per rotation until the rotation starts (about 51 seconds)
+TIMER_WHEEL_SLOTS = 1024
+
+type _PatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], tzinfo]
+
+
+def _wall_clock() -> float:
+    """Return the time of the wall clock."""
+    return time.time()
+
+
+class TimerWheelHandle:
+    """A timer of the timer wheel which can be cancelled."""
+
+    __slots__ = ("_bucket", "_buckets", "_callback", "_key", "_slot", "_wheel")
+
+    # The slot or rotation the timer is in, set when it is added to the wheel
+    _buckets: dict[int, dict[TimerWheelHandle, None]]
+    _key: int
+
+    def __init__(
+        self, wheel: TimerWheel, callback_: Callable[[], None], slot: int
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._callback = callback_
+        self._slot = slot
+        # The bucket the timer is in until it runs or is cancelled
+        self._bucket: dict[TimerWheelHandle, None] | None = None
+
+    def __repr__(self) -> str:
+        """Return the representation of the handle."""
+        return f"<TimerWheelHandle {self._callback!r}>"
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled or has run."""
+        return self._bucket is None
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if (bucket := self._bucket) is None:
+            return
+        self._bucket = None
+        del bucket[self]
+        self._wheel.timers -= 1
+        if not bucket and self._buckets.get(self._key) is bucket:
+            del self._buckets[self._key]
+
+
+class TimerWheel:
+    """Run the timers of the time trackers from a single event loop timer.
+
+    The timers are put in slots of TIMER_WHEEL_RESOLUTION seconds and only
+    the earliest slot is scheduled on the event loop, all timers of a slot
+    are run together once the slot has passed. Timers are never run early
+    but can run up to TIMER_WHEEL_RESOLUTION seconds late. Timers which are
+    due in a later rotation of the wheel are kept per rotation and moved to
+    their slot when the rotation starts, so far away timers such as daily
+    time patterns do not grow the heap of slots.
+
+    The timers are due at a time of the clock of the wheel, the wall clock
+    for points in time and the monotonic clock of the event loop for delays
+    which should not change when the wall clock is adjusted.
+
+    The next time of a time pattern only depends on the second it is
+    calculated for, it is calculated once per second for all the trackers
+    of the same pattern.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        resolution: float = TIMER_WHEEL_RESOLUTION,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize the timer wheel.
+
+        The clock defaults to the wall clock.
+        """
+        self._loop = hass.loop
+        self._resolution = resolution
+        self._clock = clock or _wall_clock
+        self._slots: dict[int, dict[TimerWheelHandle, None]] = {}
+        self._slot_heap: list[int] = []
+        self._rotations: dict[int, dict[TimerWheelHandle, None]] = {}
+        self._rotation_heap: list[int] = []
+        self._timer_handle: asyncio.TimerHandle | None = None
+        self._armed_slot: int | None = None
+        self._next_pattern_times: dict[_PatternKey, tuple[datetime, datetime]] = {}
+        self.timers = 0
+        self.fired = 0
+        self.wakeups = 0
+        self.pattern_hits = 0
+        self.pattern_misses = 0
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_stop)
+
+    @callback
+    def async_call_at(
+        self, timestamp: float, callback_: Callable[[], None]
+    ) -> TimerWheelHandle:
+        """Run the callback at or after the timestamp of the clock of the wheel."""
+        slot = math.ceil(timestamp / self._resolution)
+        handle = TimerWheelHandle(self, callback_, slot)
+        if slot - self._clock() / self._resolution < TIMER_WHEEL_SLOTS:
+            self._add(handle, self._slots, self._slot_heap, slot)
+            wakeup_slot = slot
+        else:
+            rotation = slot // TIMER_WHEEL_SLOTS
+            self._add(handle, self._rotations, self._rotation_heap, rotation)
+            wakeup_slot = rotation * TIMER_WHEEL_SLOTS
+        self.timers += 1
+        if self._armed_slot is None or wakeup_slot < self._armed_slot:
+            self._arm(wakeup_slot)
+        return handle
+
+    @staticmethod
+    def _add(
+        handle: TimerWheelHandle,
+        buckets: dict[int, dict[TimerWheelHandle, None]],
+        heap: list[int],
+        key: int,
+    ) -> None:
+        """Add a timer to the bucket of a slot or rotation."""
+        if (bucket := buckets.get(key)) is None:
+            bucket = buckets[key] = {}
+            heappush(heap, key)
+        bucket[handle] = None
+        handle._buckets = buckets  # noqa: SLF001
+        handle._key = key  # noqa: SLF001
+        handle._bucket = bucket  # noqa: SLF001
+
+    def _arm(self, slot: int) -> None:
+        """Schedule the event loop timer for the slot."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+        self._armed_slot = slot
+        loop = self._loop
+        self._timer_handle = loop.call_at(
+            loop.time() + slot * self._resolution - self._clock(), self._async_run_due
+        )
+
+    def _arm_next(self) -> None:
+        """Schedule the event loop timer for the next slot or rotation."""
+        slots, slot_heap = self._slots, self._slot_heap
+        rotations, rotation_heap = self._rotations, self._rotation_heap
+        # Skip the slots and rotations of which all timers were cancelled
+        while slot_heap and slot_heap[0] not in slots:
+            heappop(slot_heap)
+        while rotation_heap and rotation_heap[0] not in rotations:
+            heappop(rotation_heap)
+        next_slot: int | None = slot_heap[0] if slot_heap else None
+        if rotation_heap:
+            rotation_slot = rotation_heap[0] * TIMER_WHEEL_SLOTS
+            if next_slot is None or rotation_slot < next_slot:
+                next_slot = rotation_slot
+        if next_slot is None:
+            self._armed_slot = None
+            return
+        self._arm(next_slot)
+
+    @callback
+    def _async_run_due(self) -> None:
+        """Run the timers of the slots which have passed."""
+        self._timer_handle = None
+        self.wakeups += 1
+        now_slot = math.floor(self._clock() / self._resolution)
+        slots, slot_heap = self._slots, self._slot_heap
+        rotations, rotation_heap = self._rotations, self._rotation_heap
+        while rotation_heap and rotation_heap[0] * TIMER_WHEEL_SLOTS <= now_slot:
+            if rotation := rotations.pop(heappop(rotation_heap), None):
+                for handle in rotation:
+                    self._add(handle, slots, slot_heap, handle._slot)  # noqa: SLF001
+        # Collect the due slots before running any timer so the timers
+        # scheduled by the callbacks are run with the next wakeup
+        due: list[dict[TimerWheelHandle, None]] = []
+        while slot_heap and slot_heap[0] <= now_slot:
+            if bucket := slots.pop(heappop(slot_heap), None):
+                due.append(bucket)
+        for bucket in due:
+            for handle in list(bucket):
+                # The timer may have been cancelled by a previous callback
+                if handle._bucket is not bucket:  # noqa: SLF001
+                    continue
+                handle._bucket = None  # noqa: SLF001
+                self.timers -= 1
+                self.fired += 1
+                try:
+                    handle._callback()  # noqa: SLF001
+                except Exception:
+                    _LOGGER.exception("Error running timer %s", handle)
+        self._arm_next()
+
+    @callback
+    def async_find_next_time_expression_time(
+        self, now: datetime, seconds: list[int], minutes: list[int], hours: list[int]
+    ) -> datetime:
+        """Find the next time a time pattern matches.
+
+        The time is calculated once per second for each time pattern.
+        """
+        assert now.tzinfo is not None
+        key = (tuple(seconds), tuple(minutes), tuple(hours), now.tzinfo)
+        now = now.replace(microsecond=0)
+        if (cached := self._next_pattern_times.get(key)) is not None and cached[
+            0
+        ] == now:
+            self.pattern_hits += 1
+            return cached[1]
+        self.pattern_misses += 1
+        next_time = dt_util.find_next_time_expression_time(now, seconds, minutes, hours)
+        self._next_pattern_times[key] = (now, next_time)
+        return next_time
+
+    @callback
+    def async_stats(self) -> dict[str, int]:
+        """Return the statistics of the timer wheel."""
+        return {
+            "timers": self.timers,
+            "slots": len(self._slots),
+            "rotations": len(self._rotations),
+            "time_patterns": len(self._next_pattern_times),
+            "fired": self.fired,
+            "wakeups": self.wakeups,
+            "time_pattern_hits": self.pattern_hits,
+            "time_pattern_misses": self.pattern_misses,
+        }
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        """Stop the event loop timer when Home Assistant is closed."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+        self._armed_slot = None
+
+
+@callback
+def async_enable_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Run the timers of the time trackers on timer wheels.
+
+    Returns the wheel of the wall clock, the delays are run on a second
+    wheel of the monotonic clock of the event loop.
+    """
+    wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+    hass.data[DATA_MONOTONIC_TIMER_WHEEL] = TimerWheel(hass, clock=hass.loop.time)
+    return wheel
+
+
+@callback
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel | None:
+    """Return the timer wheel of the wall clock if it is enabled."""
+    return hass.data.get(DATA_TIMER_WHEEL)
+
+
+@callback
+def async_get_timer_wheel_stats(hass: HomeAssistant) -> dict[str, int] | None:
+    """Return the statistics of both timer wheels if they are enabled."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        return None
+    stats = wheel.async_stats()
+    for key, value in hass.data[DATA_MONOTONIC_TIMER_WHEEL].async_stats().items():
+        stats[key] += value
+    return stats
@@ -52,6 +52,11 @@ class TraceElement:
         self._child_key = child_key
         self._child_run_id = child_run_id
 
+    @property
+    def error(self) -> BaseException | None:
+        """Return the error of the step."""
+        return self._error
+
     def set_error(self, ex: BaseException | None) -> None:
         """Set error."""
         self._error = ex
@@ -120,6 +125,13 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# Whether the steps of the current script or automation run are traced
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
+
+
+def trace_enabled() -> bool:
+    """Return if the current run is traced."""
+    return trace_enabled_cv.get()
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -158,6 +170,8 @@ def trace_stack_top[_T](trace_stack_var: ContextVar[list[_T] | None]) -> _T | No
 
 def trace_path_push(suffix: str | list[str]) -> int:
     """Go deeper in the config tree."""
+    if not trace_enabled_cv.get():
+        return 0
     if isinstance(suffix, str):
         suffix = [suffix]
     for node in suffix:
@@ -77,6 +77,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        batch_state_writes: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -94,6 +95,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        self.batch_state_writes = batch_state_writes
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -172,8 +174,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        if not self.batch_state_writes:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+
+        # Fire the state_changed events after the states of all listeners
+        # are written, each state keeps its own context so the logbook
+        # does not attribute the changes to the first written state
+        with self.hass.states.async_batch(shared_context=False):
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -29,7 +29,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -40,6 +40,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import CATEGORY_IMPORT, trace_startup
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -132,6 +133,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -357,6 +362,135 @@ async def async_get_config_flows(
     return flows
 
 
+class CachedManifest(TypedDict):
+    """A manifest and the top level files of an integration."""
+
+    manifest: Manifest
+    manifest_mtime: int
+    dir_mtime: int
+    top_level_files: list[str] | None
+
+
+class ManifestCacheData(TypedDict):
+    """The stored manifest cache."""
+
+    ha_version: str
+    integrations: dict[str, CachedManifest]
+    resolved_domains: list[str]
+
+
+class ManifestCache:
+    """Cache of the manifests and top level files of the integrations.
+
+    The entries are keyed by the path of the manifest and are validated
+    by the modification times of the manifest and of the directory of the
+    integration, an integration is resolved with two stat calls instead
+    of reading and parsing the manifest and listing the directory. The
+    domains which were resolved during the last start are kept as well so
+    they can be resolved at once early in the start.
+
+    The get and set methods are called from the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # Circular dependency prevents us from importing the store at top level
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store[ManifestCacheData](
+            hass,
+            MANIFEST_CACHE_STORAGE_VERSION,
+            MANIFEST_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._entries: dict[str, CachedManifest] = {}
+        self._changed = False
+        self.resolved_domains: list[str] = []
+
+    async def async_load(self) -> None:
+        """Load the cache stored during the last start."""
+        if (data := await self._store.async_load()) is None or data[
+            "ha_version"
+        ] != __version__:
+            return
+        self._entries = data["integrations"]
+        self.resolved_domains = data["resolved_domains"]
+
+    def get(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an integration.
+
+        Returns None if the integration is not cached or has changed.
+        """
+        if (entry := self._entries.get(str(manifest_path))) is None:
+            return None
+        try:
+            manifest_mtime = os.stat(manifest_path).st_mtime_ns
+            dir_mtime = os.stat(manifest_path.parent).st_mtime_ns
+        except OSError:
+            return None
+        if manifest_mtime != entry["manifest_mtime"] or dir_mtime != entry["dir_mtime"]:
+            return None
+        top_level_files = entry["top_level_files"]
+        # The integration adds keys to the manifest
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if top_level_files is None else set(top_level_files),
+        )
+
+    def set(
+        self,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Cache the manifest and top level files of an integration."""
+        try:
+            manifest_mtime = os.stat(manifest_path).st_mtime_ns
+            dir_mtime = os.stat(manifest_path.parent).st_mtime_ns
+        except OSError:
+            return
+        self._entries[str(manifest_path)] = {
+            "manifest": cast(Manifest, dict(manifest)),
+            "manifest_mtime": manifest_mtime,
+            "dir_mtime": dir_mtime,
+            "top_level_files": None
+            if top_level_files is None
+            else sorted(top_level_files),
+        }
+        self._changed = True
+
+    @callback
+    def async_save(self, resolved_domains: Iterable[str]) -> None:
+        """Save the cache with the domains which were resolved during the start."""
+        resolved = sorted(resolved_domains)
+        if not self._changed and resolved == self.resolved_domains:
+            return
+        self._changed = False
+        self.resolved_domains = resolved
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> ManifestCacheData:
+        """Return the data to store."""
+        return {
+            "ha_version": __version__,
+            "integrations": self._entries.copy(),
+            "resolved_domains": self.resolved_domains,
+        }
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> ManifestCache:
+    """Load the manifest cache which is used to resolve integrations."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        manifest_cache = ManifestCache(hass)
+        await manifest_cache.async_load()
+        hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+    return manifest_cache
+
+
 class ComponentProtocol(Protocol):
     """Define the format of an integration."""
 
@@ -652,30 +786,42 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
-                continue
+            if manifest_cache is not None and (
+                cached := manifest_cache.get(manifest_path)
+            ):
+                manifest, top_level_files = cached
+            else:
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None:
+                    manifest_cache.set(manifest_path, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1067,9 +1213,10 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            with trace_startup(self.hass, self.pkg_path, CATEGORY_IMPORT):
+                cache[domain] = cast(
+                    ComponentProtocol, importlib.import_module(self.pkg_path)
+                )
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1297,7 +1444,9 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        path = f"{self.pkg_path}.{platform_name}"
+        with trace_startup(self.hass, path, CATEGORY_IMPORT):
+            return importlib.import_module(path)
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -57,6 +57,10 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    trace_startup: bool = False
+
+    timer_wheel: bool = False
+
 
 def can_use_pidfd() -> bool:
     """Check if pidfd_open is available.
@@ -6,17 +6,49 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import pathlib
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import components, core, loader
+from homeassistant.auth.models import User
+from homeassistant.components.homeassistant.triggers import state as state_trigger
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.tasks import CommitTask
+from homeassistant.components.script.trace import trace_script
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.components.trace import (
+    CONF_SAMPLE_PERCENTAGE,
+    CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
+    DATA_TRACE,
+)
+from homeassistant.components.websocket_api.state_subscriptions import (
+    StateSubscription,
+    async_get_state_subscription_hub,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfTemperature
+from homeassistant.helpers import config_validation as cv, recorder as recorder_helper
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.recorder import DATA_INSTANCE
+from homeassistant.helpers.script import Script
+from homeassistant.helpers.timer_wheel import async_enable_timer_wheel
+from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -223,6 +255,394 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Run 100k state changes through the event bus with 1000 keyed listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, listener, entity_ids=f"{entity_id}{idx}"
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set(f"{entity_id}{idx % 2000}", str(idx))
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire // 2
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_subscribe_entities_fan_out(hass):
+    """Fan out 10k state changes to 50 subscribe_entities subscriptions."""
+    connections = 50
+    events_to_fire = 10**4
+    count = 0
+
+    def send_message(message):
+        """Handle a message."""
+        nonlocal count
+        count += 1
+
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True)
+    hub = async_get_state_subscription_hub(hass)
+    for idx in range(connections):
+        hub.async_subscribe(
+            StateSubscription(send_message, None, None, user, str(idx).encode())
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set(f"sensor.power_{idx % 100}", str(idx))
+
+    await hass.async_block_till_done()
+
+    assert count == connections * events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write the state of a temperature sensor 100k times."""
+    writes = 10**5
+
+    class BenchmarkSensor(SensorEntity):
+        """A typical temperature sensor."""
+
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_name = "Living room temperature"
+        _attr_should_poll = False
+
+        def async_set_value(self, value: float) -> None:
+            """Set the value and write the state."""
+            self._attr_native_value = value
+            self.async_write_ha_state()
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entity = BenchmarkSensor()
+    entity.add_to_platform_start(hass, platform, None)
+    entity.entity_id = "sensor.living_room_temperature"
+    await entity.async_internal_added_to_hass()
+
+    start = timer()
+
+    for idx in range(writes):
+        entity.async_set_value(idx / 10)
+
+    runtime = timer() - start
+    print(f"{writes / runtime:.0f} writes/s")
+    return runtime
+
+
+async def _record_state_changes(hass, use_bulk_insert):
+    """Record 100k state changes of 1000 entities in a SQLite database."""
+    tmp_dir = await hass.async_add_executor_job(TemporaryDirectory)
+    recorder_helper.async_initialize_recorder(hass)
+    instance = hass.data[DATA_INSTANCE] = Recorder(
+        hass=hass,
+        auto_purge=False,
+        auto_repack=False,
+        keep_days=10,
+        commit_interval=1,
+        uri=f"sqlite:///{tmp_dir.name}/benchmark.db",
+        db_max_retries=10,
+        db_retry_wait=3,
+        entity_filter=None,
+        exclude_event_types=set(),
+    )
+    instance.use_bulk_insert = use_bulk_insert
+    hass.set_state(core.CoreState.running)
+    instance.async_initialize()
+    instance.async_register()
+    instance.start()
+    await instance.async_db_ready
+    rows_to_record = 10**5
+
+    start = timer()
+
+    for idx in range(rows_to_record):
+        hass.states.async_set(f"sensor.power_{idx % 1000}", str(idx), {"unit": "W"})
+    await hass.async_block_till_done()
+    instance.queue_task(CommitTask())
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    runtime = timer() - start
+    print(f"Recorded {rows_to_record / runtime:.0f} rows/s")
+    await hass.async_stop()
+    await hass.async_add_executor_job(tmp_dir.cleanup)
+    return runtime
+
+
+@benchmark
+async def recorder_state_changes_bulk_insert(hass):
+    """Record 100k state changes using multi-row INSERT statements."""
+    return await _record_state_changes(hass, True)
+
+
+@benchmark
+async def recorder_state_changes_orm(hass):
+    """Record 100k state changes by flushing them through the ORM."""
+    return await _record_state_changes(hass, False)
+
+
+@benchmark
+async def state_triggers_800_automations(hass):
+    """Run 10k state changes through 800 state triggers on 20 entities."""
+    entity_ids = [f"binary_sensor.motion_{idx}" for idx in range(20)]
+    conditions = ({"to": "on"}, {"from": "on", "to": "off"}, {"not_to": "off"}, {})
+    count = 0
+
+    @core.callback
+    def action(run_variables, context=None):
+        """Handle the trigger."""
+        nonlocal count
+        count += 1
+
+    for idx in range(800):
+        config = await state_trigger.async_validate_trigger_config(
+            hass,
+            {
+                "platform": "state",
+                "entity_id": [entity_ids[(idx + offset) % 20] for offset in range(3)],
+                **conditions[idx % len(conditions)],
+            },
+        )
+        await state_trigger.async_attach_trigger(
+            hass,
+            config,
+            action,
+            {
+                "domain": "automation",
+                "name": f"automation {idx}",
+                "home_assistant_start": False,
+                "variables": {},
+                "trigger_data": {"id": "0", "idx": "0", "alias": None},
+            },
+        )
+
+    start = timer()
+
+    for idx in range(10**4):
+        hass.states.async_set(entity_ids[idx % 20], "on" if idx % 40 < 20 else "off")
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    print(f"Triggered {count} times")
+    return runtime
+
+
+async def _schedule_timers(hass, use_timer_wheel):
+    """Schedule and cancel 100k timers like debouncers and for delays do."""
+    if use_timer_wheel:
+        async_enable_timer_wheel(hass)
+    count = 10**5
+    fired = 0
+
+    @core.callback
+    def action(_now):
+        """Handle the timer."""
+        nonlocal fired
+        fired += 1
+
+    start = timer()
+
+    for idx in range(count):
+        cancel = async_call_later(hass, 0.001 * (idx % 1000), action)
+        # Most debounced timers are cancelled before they fire
+        if idx % 4:
+            cancel()
+        async_track_point_in_utc_time(
+            hass, action, dt_util.utcnow() + timedelta(minutes=idx % 60)
+        )
+    scheduled = timer()
+    # Leave the timers which are due within a second time to run
+    await asyncio.sleep(1.1)
+
+    runtime = timer() - start - 1.1
+    print(f"Scheduled in {scheduled - start}s, fired {fired} timers")
+    return runtime
+
+
+@benchmark
+async def schedule_timers(hass):
+    """Schedule and cancel 100k timers on the event loop."""
+    return await _schedule_timers(hass, False)
+
+
+@benchmark
+async def schedule_timers_timer_wheel(hass):
+    """Schedule and cancel 100k timers on the timer wheel."""
+    return await _schedule_timers(hass, True)
+
+
+async def _run_script_steps(hass, trace_mode):
+    """Run a script of 50 steps 2k times with a trace mode."""
+    hass.data[DATA_TRACE] = {}
+    hass.states.async_set("binary_sensor.benchmark", "on")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"step": idx}}
+            if idx % 2
+            else {
+                "condition": "state",
+                "entity_id": "binary_sensor.benchmark",
+                "state": "on",
+            }
+            for idx in range(50)
+        ]
+    )
+    logger = logging.getLogger(f"{__name__}.script")
+    # Do not log the steps
+    logger.setLevel(logging.WARNING)
+    script = Script(hass, sequence, "Benchmark", "script", logger=logger)
+    trace_config = {
+        CONF_STORED_TRACES: 5,
+        CONF_TRACE_MODE: trace_mode,
+        CONF_SAMPLE_PERCENTAGE: 10,
+    }
+    runs = 2000
+
+    start = timer()
+
+    for _ in range(runs):
+        context = core.Context()
+        with trace_script(
+            hass, "benchmark", None, None, context, trace_config
+        ) as script_trace:
+            script_trace.set_trace(trace_get())
+            with trace_path("sequence"):
+                await script.async_run(context=context)
+
+    runtime = timer() - start
+    print(f"{runs * len(sequence) / runtime:.0f} steps/s")
+    return runtime
+
+
+@benchmark
+async def script_steps_trace_full(hass):
+    """Run script steps which are all traced."""
+    return await _run_script_steps(hass, "full")
+
+
+@benchmark
+async def script_steps_trace_sampled(hass):
+    """Run script steps of which 10% of the runs are traced."""
+    return await _run_script_steps(hass, "sampled")
+
+
+@benchmark
+async def script_steps_trace_errors_only(hass):
+    """Run script steps which are traced but never fail."""
+    return await _run_script_steps(hass, "errors_only")
+
+
+@benchmark
+async def script_steps_trace_off(hass):
+    """Run script steps which are not traced."""
+    return await _run_script_steps(hass, "off")
+
+
+@benchmark
+async def script_steps_static_actions(hass):
+    """Run a script of 50 service call, event and condition steps 2k times."""
+    hass.states.async_set("binary_sensor.benchmark", "on")
+    hass.services.async_register("benchmark", "noop", core.callback(lambda call: None))
+    steps = (
+        {
+            "action": "benchmark.noop",
+            "target": {"entity_id": ["light.kitchen", "light.living_room"]},
+            "data": {"brightness": 128, "transition": "2"},
+        },
+        {"event": "benchmark_event", "event_data": {"source": "benchmark"}},
+        {
+            "condition": "state",
+            "entity_id": "binary_sensor.benchmark",
+            "state": "on",
+        },
+    )
+    sequence = cv.SCRIPT_SCHEMA([steps[idx % len(steps)] for idx in range(50)])
+    logger = logging.getLogger(f"{__name__}.script")
+    # Do not log the steps
+    logger.setLevel(logging.WARNING)
+    script = Script(hass, sequence, "Benchmark", "script", logger=logger)
+    runs = 2000
+
+    start = timer()
+
+    for _ in range(runs):
+        await script.async_run(context=core.Context())
+
+    runtime = timer() - start
+    print(f"{runs * len(sequence) / runtime:.0f} steps/s")
+    return runtime
+
+
+async def _resolve_integrations(hass, use_manifest_cache):
+    """Resolve the manifests of all built-in integrations."""
+    loader.async_setup(hass)
+    domains = await hass.async_add_executor_job(
+        lambda: [
+            path.name
+            for path in pathlib.Path(components.__file__).parent.iterdir()
+            if (path / "manifest.json").is_file()
+        ]
+    )
+    if use_manifest_cache:
+        hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(hass)
+        # Fill the cache like the previous start did
+        await loader.async_get_integrations(hass, domains)
+        hass.data[loader.DATA_INTEGRATIONS] = {}
+
+    start = timer()
+
+    integrations = await loader.async_get_integrations(hass, domains)
+
+    runtime = timer() - start
+    assert all(
+        isinstance(integration, loader.Integration)
+        for integration in integrations.values()
+    )
+    print(f"Resolved {len(integrations)} integrations")
+    return runtime
+
+
+@benchmark
+async def resolve_integrations(hass):
+    """Resolve all built-in integrations by reading their manifests."""
+    return await _resolve_integrations(hass, False)
+
+
+@benchmark
+async def resolve_integrations_manifest_cache(hass):
+    """Resolve all built-in integrations with the manifest cache."""
+    return await _resolve_integrations(hass, True)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -181,9 +181,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable-next=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
+        # Parse all files without a cache to see all the files and secrets
         return MOCKS["load"][1](filename, secrets)
 
     # pylint: disable-next=possibly-unused-variable
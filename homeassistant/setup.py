@@ -31,6 +31,15 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    CATEGORY_COMPONENT_IMPORT,
+    CATEGORY_DEPENDENCIES,
+    CATEGORY_SETUP,
+    CATEGORY_SETUP_PHASE,
+    CATEGORY_SETUP_WAIT,
+    async_get_startup_tracer,
+    trace_startup,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -162,7 +171,8 @@ async def async_setup_component(
     setup_futures[domain] = setup_future
 
     try:
-        result = await _async_setup_component(hass, domain, config)
+        with trace_startup(hass, domain, CATEGORY_SETUP, domain):
+            result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -331,7 +341,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with trace_startup(hass, domain, CATEGORY_COMPONENT_IMPORT, domain):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -568,7 +579,15 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with trace_startup(
+        hass,
+        integration.domain,
+        CATEGORY_DEPENDENCIES,
+        integration.domain,
+        {"dependencies": [*integration.dependencies, *integration.after_dependencies]},
+    ):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
     async with hass.timeout.async_freeze(integration.domain):
@@ -713,6 +732,14 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        if tracer := async_get_startup_tracer(hass):
+            tracer.add_span(
+                phase,
+                CATEGORY_SETUP_WAIT,
+                integration if group is None else f"{integration} {group}",
+                started,
+                started + time_taken,
+            )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -776,6 +803,14 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        if tracer := async_get_startup_tracer(hass):
+            tracer.add_span(
+                phase,
+                CATEGORY_SETUP_PHASE,
+                integration if group is None else f"{integration} {group}",
+                started,
+                started + time_taken,
+            )
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
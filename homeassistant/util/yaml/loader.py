@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+import copy
+from dataclasses import dataclass
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, overload
+import threading
+import time
+from typing import Any, Literal, TextIO, overload
 
 import yaml
 
@@ -41,6 +46,97 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+# The number of parsed files kept by a YamlCache
+MAX_CACHED_YAML_FILES = 1000
+
+# Files which were modified less than 2 seconds ago are not cached since
+# they can be modified again without changing their modification time
+_RECENTLY_MODIFIED_NS = 2_000_000_000
+
+# The modification time and the size of a file
+type _FileSignature = tuple[int, int]
+
+# What the parsed data of a file depends on besides its content, the
+# kind is followed by the key and the value which was seen while parsing
+type _Dependency = (
+    tuple[Literal["file"], str, _FileSignature | None]
+    | tuple[Literal["dir"], str, tuple[str, ...]]
+    | tuple[Literal["env"], str, str | None]
+)
+
+
+@dataclass(slots=True)
+class _CachedYaml:
+    """The parsed data of a YAML file."""
+
+    signature: _FileSignature | None
+    data: JSON_TYPE | None
+    dependencies: list[_Dependency]
+
+
+@dataclass(slots=True, frozen=True)
+class _SecretReference:
+    """A secret in parsed data which is resolved when the data is loaded."""
+
+    requester_path: str
+    secret: str
+
+
+class YamlCache:
+    """Keep the parsed data of YAML files to load them again.
+
+    The cache is used by load_yaml for the file it is passed with and the files
+    this file includes. The files which were loaded last are kept. The secrets
+    are not kept, they are resolved again each time the data is loaded.
+    """
+
+    def __init__(self, max_files: int = MAX_CACHED_YAML_FILES) -> None:
+        """Initialize the cache."""
+        self._max_files = max_files
+        self._files: dict[str, _CachedYaml] = {}
+        # The configuration can be loaded by multiple executor jobs at once
+        self._lock = threading.Lock()
+
+    def get(self, fname: str) -> _CachedYaml | None:
+        """Return the parsed data of a file and mark it as used last."""
+        with self._lock:
+            if (cached := self._files.pop(fname, None)) is not None:
+                self._files[fname] = cached
+            return cached
+
+    def set(self, fname: str, cached: _CachedYaml) -> None:
+        """Keep the parsed data of a file and forget the least recently used."""
+        with self._lock:
+            files = self._files
+            files.pop(fname, None)
+            files[fname] = cached
+            while len(files) > self._max_files:
+                del files[next(iter(files))]
+
+    def clear(self) -> None:
+        """Forget the parsed files."""
+        with self._lock:
+            self._files.clear()
+
+
+@dataclass(slots=True)
+class _CachedLoad:
+    """A load of a file with a YamlCache."""
+
+    cache: YamlCache
+    # The dependencies which were already checked during the load
+    checked: dict[_Dependency, bool]
+
+
+# The cache used by the file which is being loaded and the files it includes
+_cached_load: ContextVar[_CachedLoad | None] = ContextVar("_cached_load", default=None)
+
+# The dependencies of the file which is being parsed
+_parse_dependencies: ContextVar[list[_Dependency] | None] = ContextVar(
+    "_parse_dependencies", default=None
+)
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -219,16 +315,27 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    If a cache is passed, it is used for the file and the files it includes.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
+    token = None
+    if cache is not None:
+        token = _cached_load.set(_CachedLoad(cache, {}))
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            cached_load = _cached_load.get()
+            # The secrets are never cached
+            if cached_load is None or os.path.basename(fname) == SECRET_YAML:
+                return parse_yaml(conf_file, secrets)
+            return _load_cached_yaml(cached_load, os.fspath(fname), conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -236,17 +343,134 @@ def load_yaml(
         raise
     except OSError as exc:
         raise HomeAssistantError(exc) from exc
+    finally:
+        if token is not None:
+            _cached_load.reset(token)
+
+
+def _file_signature(stat_result: os.stat_result) -> _FileSignature | None:
+    """Return the signature of a file or None if it was modified recently."""
+    if time.time_ns() - stat_result.st_mtime_ns < _RECENTLY_MODIFIED_NS:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _record_dependency(dependency: _Dependency) -> None:
+    """Record a dependency of the file which is being parsed."""
+    if (dependencies := _parse_dependencies.get()) is not None:
+        dependencies.append(dependency)
+
+
+def _dependency_valid(cached_load: _CachedLoad, dependency: _Dependency) -> bool:
+    """Return if a dependency of a cached file is unchanged.
+
+    Each dependency is only checked once during a load, the files are
+    compared by their modification time and size.
+    """
+    if (valid := cached_load.checked.get(dependency)) is not None:
+        return valid
+    if dependency[0] == "file":
+        try:
+            valid = dependency[2] is not None and (
+                _file_signature(os.stat(dependency[1])) == dependency[2]
+            )
+        except OSError:
+            valid = False
+    elif dependency[0] == "dir":
+        valid = tuple(_find_files(dependency[1], "*.yaml")) == dependency[2]
+    else:
+        valid = os.environ.get(dependency[1]) == dependency[2]
+    cached_load.checked[dependency] = valid
+    return valid
+
+
+def _copy_data(data: Any, memo: dict[int, Any], secrets: Secrets | None) -> Any:
+    """Copy the containers of parsed data and resolve its secrets.
+
+    Strings and the other scalars are immutable and shared with the
+    cached data, the same container is copied once to keep anchors.
+    The secret references are kept if no secrets are passed.
+    """
+    if not isinstance(data, (dict, list, set)):
+        if secrets is not None and type(data) is _SecretReference:
+            return secrets.get(data.requester_path, data.secret)
+        return data
+    if (copied := memo.get(id(data))) is not None:
+        return copied
+    if isinstance(data, dict):
+        copied = memo[id(data)] = data.__class__()
+        for key, value in data.items():
+            copied[_copy_data(key, memo, secrets)] = _copy_data(value, memo, secrets)
+    elif isinstance(data, list):
+        copied = memo[id(data)] = data.__class__()
+        copied.extend(_copy_data(value, memo, secrets) for value in data)
+    else:
+        return set(data)
+    if isinstance(copied, (NodeDictClass, NodeListClass)):
+        try:
+            copied.__config_file__ = data.__config_file__
+            copied.__line__ = data.__line__
+        except AttributeError:
+            pass
+    return copied
+
+
+def _load_cached_yaml(
+    cached_load: _CachedLoad, fname: str, conf_file: TextIO, secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Return the parsed data of a file from the cache or parse it.
+
+    The files included by the file, the files found in included directories
+    and the environment variables are recorded as dependencies of the file and
+    of the files including it. A cached file is only used if it has the same
+    modification time and size and all its dependencies are unchanged, so only
+    the files which changed and the files including them are parsed again.
+    A copy of the cached data is returned since the configuration is changed
+    while it is processed.
+    """
+    try:
+        signature = _file_signature(os.fstat(conf_file.fileno()))
+    except OSError:
+        # Streams without a file descriptor are not cached
+        signature = None
+    if (
+        signature is None
+        or (cached := cached_load.cache.get(fname)) is None
+        or cached.signature != signature
+        or not all(
+            _dependency_valid(cached_load, dependency)
+            for dependency in cached.dependencies
+        )
+    ):
+        dependencies: list[_Dependency] = []
+        token = _parse_dependencies.set(dependencies)
+        try:
+            data = parse_yaml(conf_file, secrets)
+        finally:
+            _parse_dependencies.reset(token)
+        cached = _CachedYaml(signature, data, dependencies)
+        if signature is not None:
+            cached_load.cache.set(fname, cached)
+    if (parent_dependencies := _parse_dependencies.get()) is not None:
+        parent_dependencies.append(("file", fname, signature))
+        parent_dependencies.extend(cached.dependencies)
+        # The data is copied and its secrets are resolved with the data of the
+        # including file, which only adds its file reference to the top node
+        return copy.copy(cached.data)
+    return _copy_data(cached.data, {}, secrets)
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -404,12 +628,19 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Return the YAML files in a directory and record them as a dependency."""
+    files = list(_find_files(directory, "*.yaml"))
+    _record_dependency(("dir", directory, tuple(files)))
+    return files
+
+
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -429,7 +660,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -446,7 +677,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -459,7 +690,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -529,6 +760,7 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
+    _record_dependency(("env", args[0], os.environ.get(args[0])))
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
@@ -538,12 +770,18 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(
+    loader: LoaderType, node: yaml.nodes.Node
+) -> JSON_TYPE | _SecretReference:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    secret = loader.secrets.get(loader.get_name, node.value)
+    if _parse_dependencies.get() is not None:
+        # The data is cached, keep the secret out of it
+        return _SecretReference(loader.get_name, node.value)
+    return secret
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
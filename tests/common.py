@@ -1411,8 +1411,14 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
 
+        data_to_write.pop("compact_log", None)
         if "data_func" in data_to_write:
             data_to_write["data"] = data_to_write.pop("data_func")()
+        elif "items_func" in data_to_write:
+            data_to_write["data"] = {
+                collection: list(items.values())
+                for collection, items in data_to_write.pop("items_func")().items()
+            }
 
         encoder = store._encoder
         if encoder and encoder is not JSONEncoder:
@@ -40,7 +40,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
@@ -1346,6 +1346,95 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_automations(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test only changed automations are validated again at reload."""
+
+    def automation_config(automation_id: str, event_type: str) -> dict[str, Any]:
+        return {
+            "id": automation_id,
+            "triggers": {"platform": "event", "event_type": event_type},
+            "actions": {"action": "test.automation"},
+        }
+
+    config = {
+        automation.DOMAIN: [
+            automation_config("one", "test_event"),
+            automation_config("two", "test_event"),
+        ]
+    }
+    with patch(
+        "homeassistant.components.automation.config._async_validate_config_item",
+        wraps=automation.config._async_validate_config_item,
+    ) as validate_mock:
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert validate_mock.call_count == 2
+        validate_mock.reset_mock()
+
+        config = {
+            automation.DOMAIN: [
+                automation_config("one", "test_event"),
+                automation_config("two", "other_event"),
+            ]
+        }
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+    assert [call.args[1]["id"] for call in validate_mock.mock_calls] == ["two"]
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("other_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_reload_validates_automations_after_registry_change(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test automations are validated again after the registries changed."""
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    config = {
+        automation.DOMAIN: {
+            "id": "one",
+            "triggers": {"platform": "event", "event_type": "test_event"},
+            "actions": {"action": "light.turn_on", "target": {"entity_id": entry.id}},
+        }
+    }
+    with (
+        patch(
+            "homeassistant.components.automation.config._async_validate_config_item",
+            wraps=automation.config._async_validate_config_item,
+        ) as validate_mock,
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+    ):
+        assert await async_setup_component(hass, automation.DOMAIN, config)
+        assert validate_mock.call_count == 1
+
+        # Creating an entry does not change the validated configs
+        entity_registry.async_get_or_create("light", "hue", "5678")
+        await hass.async_block_till_done()
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_mock.call_count == 1
+
+        # Renaming an entity changes the resolved entity id
+        entity_registry.async_update_entity(
+            entry.entity_id, new_entity_id="light.renamed"
+        )
+        await hass.async_block_till_done()
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_mock.call_count == 2
+
+
 @pytest.mark.parametrize("extra_config", [{}, {"id": "sun"}])
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls: list[ServiceCall], extra_config: dict[str, str]
@@ -0,0 +1,25 @@
+"""Test Home Assistant system health."""
+
+from homeassistant.components.homeassistant import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.timer_wheel import async_enable_timer_wheel
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_timer_wheel(hass: HomeAssistant) -> None:
+    """Test the statistics of the timer wheel are reported when it is enabled."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert "timer_wheel_timers" not in info
+
+    async_enable_timer_wheel(hass)
+    async_call_later(hass, 10, lambda now: None)
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["timer_wheel_timers"] == 1
+    assert info["timer_wheel_fired"] == 0
@@ -802,6 +802,65 @@ async def test_if_fires_on_entity_change_with_for(
     assert len(service_calls) == 1
 
 
+async def test_triggers_share_for_period(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test triggers matching the same state change share the for period."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "id": f"automation_{idx}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "world",
+                        "for": {"seconds": seconds},
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": idx},
+                    },
+                }
+                for idx, seconds in enumerate((5, 5, 5, 10))
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        state_trigger,
+        "async_track_same_state",
+        wraps=state_trigger.async_track_same_state,
+    ) as track_same_state_mock:
+        hass.states.async_set("test.entity", "world")
+        await hass.async_block_till_done()
+    assert track_same_state_mock.call_count == 2
+
+    # The shared period keeps running for the other automations
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "automation.automation_0"},
+        blocking=True,
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert [
+        service_call.data["id"]
+        for service_call in service_calls
+        if service_call.domain == "test"
+    ] == [1, 2]
+
+    hass.states.async_set("test.entity", "hello")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert len(service_calls) == 3
+
+
 async def test_if_fires_on_entity_change_with_for_without_to(
     hass: HomeAssistant, service_calls: list[ServiceCall]
 ) -> None:
@@ -1771,3 +1830,36 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_attach_trigger_with_single_entity_id(hass: HomeAssistant) -> None:
+    """Test attaching a trigger which was not validated with a single entity id."""
+    calls = []
+
+    async def action(run_variables, context=None):
+        calls.append(run_variables["trigger"])
+
+    unsub = await state_trigger.async_attach_trigger(
+        hass,
+        {"platform": "state", "entity_id": "Test.Entity", "to": "world"},
+        action,
+        {
+            "domain": "test",
+            "name": "test",
+            "home_assistant_start": False,
+            "variables": None,
+            "trigger_data": {"id": "0", "idx": "0", "alias": None},
+        },
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0]["entity_id"] == "test.entity"
+    assert calls[0]["to_state"].state == "world"
+
+    unsub()
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
@@ -0,0 +1,201 @@
+"""The tests for the recorder backpressure handling."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.backpressure import (
+    BACKLOG_HIGH_WATERMARK,
+    BACKLOG_LOW_WATERMARK,
+    DROP_LOW_PRIORITY_BACKLOG,
+    MAX_BATCH_SIZE,
+    MAX_COMMIT_INTERVAL,
+    MIN_BATCH_SIZE,
+    RecorderBackpressure,
+)
+from homeassistant.components.recorder.db_schema import Events, EventTypes
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+
+def test_commit_interval_widens_and_narrows() -> None:
+    """Test the commit interval and batch size follow the backlog."""
+    backpressure = RecorderBackpressure(1)
+
+    backpressure.commit_done(0.01, BACKLOG_HIGH_WATERMARK)
+    assert backpressure.commit_interval == 2
+    assert backpressure.batch_size == MIN_BATCH_SIZE * 2
+
+    for _ in range(10):
+        backpressure.commit_done(0.01, BACKLOG_HIGH_WATERMARK)
+    assert backpressure.commit_interval == MAX_COMMIT_INTERVAL
+    assert backpressure.batch_size == MAX_BATCH_SIZE
+
+    # Between the watermarks a fast commit keeps the current values
+    backpressure.commit_done(0.01, BACKLOG_LOW_WATERMARK + 1)
+    assert backpressure.commit_interval == MAX_COMMIT_INTERVAL
+
+    for _ in range(10):
+        backpressure.commit_done(0.01, 0)
+    assert backpressure.commit_interval == 1
+    assert backpressure.batch_size == MIN_BATCH_SIZE
+
+
+def test_slow_commits_widen_commit_interval() -> None:
+    """Test commits slower than half of the interval widen it while behind."""
+    backpressure = RecorderBackpressure(1)
+
+    backpressure.commit_done(0.6, BACKLOG_LOW_WATERMARK)
+    assert backpressure.commit_interval == 1
+
+    backpressure.commit_done(0.6, BACKLOG_LOW_WATERMARK + 1)
+    assert backpressure.commit_interval == 2
+
+
+def test_zero_commit_interval() -> None:
+    """Test events are batched with a zero commit interval only while behind."""
+    backpressure = RecorderBackpressure(0)
+    backpressure.event_processed()
+    assert backpressure.should_commit(False)
+
+    backpressure.commit_done(0.01, BACKLOG_HIGH_WATERMARK)
+    assert backpressure.commit_interval == 1
+    backpressure.event_processed()
+    assert not backpressure.should_commit(False)
+    # Commit as soon as the recorder caught up since there is no commit timer
+    assert backpressure.should_commit(True)
+
+    for _ in range(MIN_BATCH_SIZE * 2):
+        backpressure.event_processed()
+    assert backpressure.should_commit(False)
+
+    backpressure.commit_done(0.01, 0)
+    assert backpressure.commit_interval == 0
+    assert backpressure.should_commit(False)
+
+
+def test_batch_size_only_while_behind() -> None:
+    """Test full batches are only committed while the recorder is behind."""
+    backpressure = RecorderBackpressure(1)
+    for _ in range(MAX_BATCH_SIZE):
+        backpressure.event_processed()
+    assert not backpressure.should_commit(False)
+    assert not backpressure.should_commit(True)
+
+    backpressure.commit_done(0.01, BACKLOG_HIGH_WATERMARK)
+    for _ in range(MIN_BATCH_SIZE * 2 - 1):
+        backpressure.event_processed()
+    assert not backpressure.should_commit(False)
+    backpressure.event_processed()
+    assert backpressure.should_commit(False)
+
+
+def test_commit_on_interval() -> None:
+    """Test commits from the commit timer are skipped while widened."""
+    backpressure = RecorderBackpressure(1)
+    assert backpressure.should_commit_on_interval()
+
+    with patch(
+        "homeassistant.components.recorder.backpressure.time.monotonic",
+        return_value=1000,
+    ):
+        backpressure.commit_done(0.01, BACKLOG_HIGH_WATERMARK)
+    with patch(
+        "homeassistant.components.recorder.backpressure.time.monotonic",
+        return_value=1001,
+    ):
+        assert not backpressure.should_commit_on_interval()
+    with patch(
+        "homeassistant.components.recorder.backpressure.time.monotonic",
+        return_value=1002,
+    ):
+        assert backpressure.should_commit_on_interval()
+
+
+def test_commit_duration_percentile() -> None:
+    """Test the commit duration percentiles."""
+    backpressure = RecorderBackpressure(1)
+    assert backpressure.commit_duration_percentile(50) is None
+
+    for _ in range(9):
+        backpressure.commit_done(0.004, 0)
+    backpressure.commit_done(0.3, 0)
+    assert backpressure.last_commit_duration == 0.3
+    assert backpressure.commit_duration_percentile(50) == 0.005
+    assert backpressure.commit_duration_percentile(95) == 0.5
+
+    backpressure.commit_done(60, 0)
+    assert backpressure.commit_duration_percentile(100) is None
+
+
+def test_drop_low_priority_events_hysteresis() -> None:
+    """Test dropping low priority events only stops once caught up."""
+    backpressure = RecorderBackpressure(1)
+    assert not backpressure.should_drop_low_priority_events(
+        DROP_LOW_PRIORITY_BACKLOG - 1
+    )
+    assert backpressure.should_drop_low_priority_events(DROP_LOW_PRIORITY_BACKLOG)
+
+    backpressure.dropping_low_priority_events = True
+    assert backpressure.should_drop_low_priority_events(BACKLOG_LOW_WATERMARK + 1)
+    assert not backpressure.should_drop_low_priority_events(BACKLOG_LOW_WATERMARK)
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"event_types": ["component_loaded"]}}]
+)
+async def test_dropping_low_priority_events(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test low priority events are not recorded while the backlog is too large."""
+
+    def _count_events(event_type: str) -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == event_type)
+                .count()
+            )
+
+    recorder_mock._async_set_dropping_low_priority_events(True)
+    assert recorder_mock.backpressure.dropping_low_priority_events
+    hass.bus.async_fire(EVENT_CALL_SERVICE, {"domain": "light"})
+    hass.bus.async_fire("custom_event")
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(_count_events, "custom_event")
+    assert not await recorder_mock.async_add_executor_job(
+        _count_events, EVENT_CALL_SERVICE
+    )
+
+    recorder_mock._async_set_dropping_low_priority_events(False)
+    assert not recorder_mock.backpressure.dropping_low_priority_events
+    hass.bus.async_fire(EVENT_CALL_SERVICE, {"domain": "light"})
+    hass.bus.async_fire("component_loaded", {"component": "light"})
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(
+        _count_events, EVENT_CALL_SERVICE
+    )
+    # Excluded event types stay excluded
+    assert not await recorder_mock.async_add_executor_job(
+        _count_events, "component_loaded"
+    )
+
+
+async def test_commit_records_backpressure_stats(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test commits are recorded in the commit duration histogram."""
+    hass.states.async_set("test.one", "on")
+    await async_wait_recording_done(hass)
+
+    backpressure = recorder_mock.backpressure
+    assert sum(backpressure.commit_duration_histogram) > 0
+    assert backpressure.commit_duration_percentile(50) is not None
+    assert backpressure.commit_interval == 0
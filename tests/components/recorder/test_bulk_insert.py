@@ -0,0 +1,145 @@
+"""The tests for the recorder bulk insert pipeline."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bulk_insert import BulkInsertWriter
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+
+@pytest.mark.parametrize("recorder_config", [{"commit_interval": 30}])
+async def test_bulk_insert_links_states_in_same_commit(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test states written in the same commit are linked to their old state."""
+    assert recorder_mock._bulk_insert_writer is not None
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 1})
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("test.two", "s5", {"attr": 2})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+        assert (
+            states_by_state["s1"].attributes_id
+            == states_by_state["s2"].attributes_id
+            == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s3"].attributes_id == states_by_state["s5"].attributes_id
+        )
+        assert session.query(StateAttributes).count() == 2
+
+        events = list(
+            session.query(Events.event_type_id, Events.data_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "custom_event")
+        )
+        assert len(events) == 2
+        assert events[0] == events[1]
+        assert events[0].data_id is not None
+        assert (
+            session.query(EventData)
+            .filter(EventData.data_id == events[0].data_id)
+            .one()
+            .shared_data
+            == '{"some":"data"}'
+        )
+
+
+async def test_bulk_insert_disabled(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the ORM path is used when bulk insert is disabled."""
+    recorder_mock.use_bulk_insert = False
+    recorder_mock._bulk_insert_writer = None
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = {
+            state.state: state
+            for state in session.query(
+                States.state_id, States.old_state_id, States.state
+            )
+        }
+        assert states["s2"].old_state_id == states["s1"].state_id
+
+
+def test_bulk_insert_writer_keeps_rows_on_failure() -> None:
+    """Test rows are kept and the session rolled back when an insert fails."""
+    writer = BulkInsertWriter()
+    states_meta = StatesMeta(entity_id="test.one")
+    db_state = States(state="on", states_meta_rel=states_meta)
+    writer.add(states_meta)
+    writer.add(db_state)
+    session = MagicMock()
+    session.execute.side_effect = OperationalError("insert", {}, Exception())
+
+    with pytest.raises(OperationalError):
+        writer.flush(session)
+
+    session.rollback.assert_called_once()
+
+    states_meta_result = MagicMock()
+    states_meta_result.scalars.return_value = [5]
+    states_result = MagicMock()
+    states_result.scalars.return_value = [7]
+    session.execute.side_effect = [states_meta_result, states_result]
+    writer.flush(session)
+
+    assert states_meta.metadata_id == 5
+    assert db_state.state_id == 7
+    states_params = session.execute.call_args_list[-1][0][1]
+    assert len(states_params) == 1
+    assert states_params[0]["metadata_id"] == 5
+    assert states_params[0]["state"] == "on"
+
+    # The rows are discarded after a successful flush
+    session.execute.reset_mock()
+    writer.flush(session)
+    session.execute.assert_not_called()
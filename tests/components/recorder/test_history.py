@@ -5,7 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -21,8 +21,9 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
@@ -726,6 +727,80 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+async def test_get_significant_states_columns(
+    hass: HomeAssistant,
+    minimal_response: bool,
+    no_attributes: bool,
+    significant_changes_only: bool,
+    include_start_time_state: bool,
+) -> None:
+    """Test the columnar history serializes the same as the compressed states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    start_time = zero + timedelta(seconds=1.5)
+    for entity_ids in (list(states), ["thermostat.test"], ["media_player.test"]):
+        compressed_states = history.get_significant_states(
+            hass,
+            start_time,
+            four,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        columns = history.get_significant_states_columns(
+            hass,
+            start_time,
+            four,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        assert list(columns) == list(compressed_states)
+        assert json_loads(
+            json_bytes({"states": history.history_columns_to_json(columns)})
+        ) == json_loads(json_bytes({"states": compressed_states}))
+
+
+async def test_async_get_significant_states_columns_chunks(
+    hass: HomeAssistant,
+) -> None:
+    """Test large history requests are queried in chunks and merged in order."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = sorted(states, reverse=True)
+    columns = history.get_significant_states_columns(
+        hass, zero, four, entity_ids, True, True, False, False
+    )
+    with (
+        patch.object(history, "MIN_ENTITIES_PER_QUERY_CHUNK", 1),
+        patch.object(
+            history,
+            "get_significant_states_columns",
+            wraps=history.get_significant_states_columns,
+        ) as get_columns_mock,
+    ):
+        chunked_columns = await history.async_get_significant_states_columns(
+            hass, zero, four, entity_ids
+        )
+    assert get_columns_mock.call_count > 1
+    assert list(chunked_columns) == list(columns)
+    assert json_bytes(history.history_columns_to_json(chunked_columns)) == json_bytes(
+        history.history_columns_to_json(columns)
+    )
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
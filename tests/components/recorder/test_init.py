@@ -394,20 +394,31 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    instance = get_instance(hass)
+    bulk_insert_writer = instance._bulk_insert_writer
+    assert bulk_insert_writer is not None
+    bulk_insert_flush = bulk_insert_writer._flush
+
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        for obj in instance.event_session:
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    def _throw_if_state_pending(session):
+        if bulk_insert_writer._states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        bulk_insert_flush(session)
+
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
+            instance.event_session,
             "flush",
             side_effect=_throw_if_state_in_session,
         ),
+        patch.object(bulk_insert_writer, "_flush", side_effect=_throw_if_state_pending),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -437,20 +448,31 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    instance = get_instance(hass)
+    bulk_insert_writer = instance._bulk_insert_writer
+    assert bulk_insert_writer is not None
+    bulk_insert_flush = bulk_insert_writer._flush
+
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        for obj in instance.event_session:
             if isinstance(obj, States):
                 raise SQLAlchemyError(
                     "insert the state", "fake params", "forced to fail"
                 )
 
+    def _throw_if_state_pending(session):
+        if bulk_insert_writer._states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        bulk_insert_flush(session)
+
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
+            instance.event_session,
             "flush",
             side_effect=_throw_if_state_in_session,
         ),
+        patch.object(bulk_insert_writer, "_flush", side_effect=_throw_if_state_pending),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
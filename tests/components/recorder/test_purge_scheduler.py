@@ -0,0 +1,174 @@
+"""The tests for the recorder purge scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge_scheduler import (
+    MIN_PURGE_BATCH_SIZE,
+    PURGE_BATCH_TARGET_DURATION,
+    PURGE_SLICE_TIME_BUDGET,
+    PURGE_STORAGE_KEY,
+    PurgeScheduler,
+)
+from homeassistant.components.recorder.tasks import PurgeTask
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_batch_size_adapts_to_batch_duration(hass: HomeAssistant) -> None:
+    """Test the batch size follows the duration of the batches."""
+    purge_scheduler = PurgeScheduler(hass)
+    assert purge_scheduler.batch_size(4000) == 4000
+
+    purge_scheduler.batch_done(4000, 4000, PURGE_BATCH_TARGET_DURATION * 2)
+    assert purge_scheduler.batch_size(4000) == 2000
+    assert purge_scheduler.rows_purged == 4000
+
+    for _ in range(10):
+        purge_scheduler.batch_done(4000, 100, PURGE_BATCH_TARGET_DURATION * 2)
+    assert purge_scheduler.batch_size(4000) == MIN_PURGE_BATCH_SIZE
+
+    # Only full batches which are fast grow the batch size
+    purge_scheduler.batch_done(4000, 10, 0)
+    assert purge_scheduler.batch_size(4000) == MIN_PURGE_BATCH_SIZE
+    for _ in range(10):
+        purge_scheduler.batch_done(4000, 4000, 0)
+    assert purge_scheduler.batch_size(4000) == 4000
+    assert purge_scheduler.batch_size(1000) == 1000
+
+
+async def test_slice_pause(hass: HomeAssistant) -> None:
+    """Test a slice which used its time budget is followed by a pause."""
+    purge_scheduler = PurgeScheduler(hass)
+    purge_before = dt_util.utcnow()
+    with patch(
+        "homeassistant.components.recorder.purge_scheduler.time.monotonic",
+        return_value=1000,
+    ):
+        purge_scheduler.start_slice(purge_before, False, False)
+        assert not purge_scheduler.slice_budget_exceeded()
+    with patch(
+        "homeassistant.components.recorder.purge_scheduler.time.monotonic",
+        return_value=1000 + PURGE_SLICE_TIME_BUDGET * 2,
+    ):
+        assert purge_scheduler.slice_budget_exceeded()
+        purge_scheduler.end_slice(False)
+    assert purge_scheduler.slice_pause == PURGE_SLICE_TIME_BUDGET * 2
+    assert purge_scheduler.purge_before == purge_before
+
+    purge_scheduler.start_slice(purge_before, False, False)
+    assert purge_scheduler.slices == 2
+    purge_scheduler.end_slice(True)
+    assert purge_scheduler.slice_pause == 0
+    assert purge_scheduler.purge_before is None
+    assert purge_scheduler.last_purge_finished is not None
+
+
+async def test_purge_stops_when_slice_budget_is_used(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a purge slice stops once its time budget is used."""
+    for idx in range(5):
+        hass.states.async_set("test.purge", str(idx))
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() + timedelta(seconds=1)
+    purge_scheduler = recorder_mock.purge_scheduler
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch.object(purge_scheduler, "slice_budget_exceeded", return_value=True),
+    ):
+        finished = await recorder_mock.async_add_executor_job(
+            purge_old_data, recorder_mock, purge_before, False
+        )
+    assert not finished
+    assert purge_scheduler.rows_purged == 1
+    assert purge_scheduler.purge_before == purge_before
+
+    finished = await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, purge_before, False
+    )
+    assert finished
+    # Events recorded during the startup are purged as well
+    assert purge_scheduler.rows_purged >= 5
+    assert purge_scheduler.slices == 2
+    assert purge_scheduler.purge_before is None
+
+
+async def test_pending_purge_is_stored(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the purge in progress is stored until it finishes."""
+    purge_before = dt_util.utcnow()
+    purge_scheduler = recorder_mock.purge_scheduler
+    await recorder_mock.async_add_executor_job(
+        purge_scheduler.start_slice, purge_before, True, False
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[PURGE_STORAGE_KEY]["data"] == {
+        "purge_before": purge_before.isoformat(),
+        "repack": True,
+        "apply_filter": False,
+    }
+
+    await recorder_mock.async_add_executor_job(purge_scheduler.end_slice, True)
+    await hass.async_block_till_done()
+    assert hass_storage[PURGE_STORAGE_KEY]["data"] is None
+
+
+async def test_pending_purge_is_resumed(
+    async_test_recorder: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a purge which was interrupted by a restart is resumed."""
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    hass_storage[PURGE_STORAGE_KEY] = {
+        "version": 1,
+        "data": {
+            "purge_before": purge_before.isoformat(),
+            "repack": False,
+            "apply_filter": True,
+        },
+    }
+    with patch.object(PurgeTask, "run", autospec=True) as purge_task_run_mock:
+        async with async_test_recorder(hass):
+            await async_wait_recording_done(hass)
+    assert [call.args[0] for call in purge_task_run_mock.mock_calls] == [
+        PurgeTask(purge_before, False, True)
+    ]
+
+
+@pytest.mark.parametrize("slice_pause", [0.0, 5.0])
+async def test_purge_task_pauses_between_slices(
+    recorder_mock: Recorder, hass: HomeAssistant, slice_pause: float
+) -> None:
+    """Test the next slice of a purge is only delayed after a full slice."""
+    task = PurgeTask(dt_util.utcnow(), False, False)
+    recorder_mock.purge_scheduler.slice_pause = slice_pause
+    with (
+        patch(
+            "homeassistant.components.recorder.tasks.purge.purge_old_data",
+            return_value=False,
+        ),
+        patch.object(recorder_mock, "queue_task") as queue_task_mock,
+        patch.object(recorder_mock, "queue_purge_slice") as queue_purge_slice_mock,
+    ):
+        task.run(recorder_mock)
+    if slice_pause:
+        queue_task_mock.assert_not_called()
+        queue_purge_slice_mock.assert_called_once_with(task, slice_pause)
+    else:
+        queue_task_mock.assert_called_once_with(task)
+        queue_purge_slice_mock.assert_not_called()
@@ -35,6 +35,11 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "queue_backlog": 0,
+        "events_per_second": 0.0,
+        "commit_interval": 0,
+        "commit_duration_p50": ANY,
+        "commit_duration_p95": ANY,
     }
 
 
@@ -64,6 +69,11 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "events_per_second": ANY,
+        "commit_interval": ANY,
+        "commit_duration_p50": ANY,
+        "commit_duration_p95": ANY,
     }
 
 
@@ -99,6 +109,11 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "events_per_second": ANY,
+        "commit_interval": ANY,
+        "commit_duration_p50": ANY,
+        "commit_duration_p95": ANY,
     }
 
 
@@ -127,4 +142,9 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "queue_backlog": ANY,
+        "events_per_second": ANY,
+        "commit_interval": ANY,
+        "commit_duration_p50": ANY,
+        "commit_duration_p95": ANY,
     }
@@ -48,6 +48,7 @@ import homeassistant.util.dt as dt_util
 from tests.common import (
     MockConfigEntry,
     MockUser,
+    async_capture_events,
     async_fire_time_changed,
     async_mock_service,
     mock_restore_cache,
@@ -557,6 +558,84 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_scripts(hass: HomeAssistant) -> None:
+    """Test only changed scripts are validated again at reload."""
+    config = {
+        script.DOMAIN: {
+            "one": {"sequence": [{"event": "one"}]},
+            "two": {"sequence": [{"event": "two"}]},
+        }
+    }
+    with patch(
+        "homeassistant.components.script.config._async_validate_config_item",
+        wraps=script.config._async_validate_config_item,
+    ) as validate_mock:
+        assert await async_setup_component(hass, script.DOMAIN, config)
+        assert validate_mock.call_count == 2
+        validate_mock.reset_mock()
+
+        config = {
+            script.DOMAIN: {
+                "one": {"sequence": [{"event": "one"}]},
+                "two": {"sequence": [{"event": "changed"}]},
+            }
+        }
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+    assert [call.args[1] for call in validate_mock.mock_calls] == ["two"]
+
+    events = async_capture_events(hass, "changed")
+    await hass.services.async_call(DOMAIN, "two", blocking=True)
+    assert len(events) == 1
+
+
+async def test_reload_validates_scripts_after_registry_change(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test scripts are validated again after the registries changed."""
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    config = {
+        script.DOMAIN: {
+            "one": {
+                "sequence": [
+                    {"action": "light.turn_on", "target": {"entity_id": entry.id}}
+                ]
+            },
+        }
+    }
+    with (
+        patch(
+            "homeassistant.components.script.config._async_validate_config_item",
+            wraps=script.config._async_validate_config_item,
+        ) as validate_mock,
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+    ):
+        assert await async_setup_component(hass, script.DOMAIN, config)
+        assert validate_mock.call_count == 1
+
+        # Creating an entry does not change the validated configs
+        entity_registry.async_get_or_create("light", "hue", "5678")
+        await hass.async_block_till_done()
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_mock.call_count == 1
+
+        # Renaming an entity changes the resolved entity id
+        entity_registry.async_update_entity(
+            entry.entity_id, new_entity_id="light.renamed"
+        )
+        await hass.async_block_till_done()
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_mock.call_count == 2
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -35,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -723,6 +728,103 @@ async def test_compile_hourly_statistics_purged_state_changes(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_aggregated_states(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test measurement statistics are aggregated while the states change."""
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=5)
+    freezer.move_to(zero)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "5", TEMPERATURE_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test4", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics(start: datetime) -> dict[str, StatisticData]:
+        with session_scope(hass=hass, read_only=True) as session:
+            compiled = recorder.compile_statistics(
+                hass, session, start, start + timedelta(minutes=5)
+            )
+        return {
+            stat["meta"]["statistic_id"]: stat["stat"]
+            for stat in compiled.platform_stats
+        }
+
+    # The first compile starts the aggregator and reads the recorded states
+    instance = get_instance(hass)
+    await instance.async_add_executor_job(
+        _compile_statistics, zero - timedelta(minutes=5)
+    )
+    await hass.async_block_till_done()
+
+    period = zero + timedelta(minutes=5)
+    fahrenheit = {**TEMPERATURE_SENSOR_ATTRIBUTES, "unit_of_measurement": "°F"}
+    watt = {**TEMPERATURE_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"}
+    for offset, entity_id, state, attributes in (
+        (30, "sensor.test1", "20", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (60, "sensor.test3", "1", TEMPERATURE_SENSOR_ATTRIBUTES),
+        # The state in °F is converted and the state in W is dropped
+        (90, "sensor.test4", "50", fahrenheit),
+        (120, "sensor.test4", "1000", watt),
+        (150, "sensor.test1", STATE_UNAVAILABLE, TEMPERATURE_SENSOR_ATTRIBUTES),
+        (180, "sensor.test4", "20", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (200, "sensor.test1", "30", TEMPERATURE_SENSOR_ATTRIBUTES),
+    ):
+        freezer.move_to(period + timedelta(seconds=offset))
+        hass.states.async_set(entity_id, state, attributes)
+    freezer.move_to(period + timedelta(minutes=5, seconds=10))
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as history_mock:
+        do_adhoc_statistics(hass, start=period)
+        await async_wait_recording_done(hass)
+    assert history_mock.call_count == 0
+    assert "The unit of sensor.test4 (W) cannot be converted" in caplog.text
+
+    with patch(
+        "homeassistant.components.sensor.recorder.get_period_statistics",
+        return_value=None,
+    ):
+        recorded_stats = await instance.async_add_executor_job(
+            _compile_statistics, period
+        )
+
+    stats = statistics_during_period(hass, period, period="5minute")
+    assert {entity_id: stat[0]["mean"] for entity_id, stat in stats.items()} == {
+        "sensor.test1": pytest.approx((10 * 30 + 20 * 170 + 30 * 100) / 300),
+        "sensor.test2": pytest.approx(5),
+        "sensor.test3": pytest.approx(1),
+        "sensor.test4": pytest.approx((10 * 180 + 20 * 120) / 300),
+    }
+    assert stats["sensor.test4"][0]["max"] == pytest.approx(20)
+    for entity_id, stat in stats.items():
+        recorded_stat = recorded_stats[entity_id]
+        assert stat[0]["mean"] == pytest.approx(recorded_stat["mean"])
+        assert stat[0]["min"] == pytest.approx(recorded_stat["min"])
+        assert stat[0]["max"] == pytest.approx(recorded_stat["max"])
+
+    # The period is compiled again from the aggregates if storing failed
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as history_mock:
+        compiled_again = await instance.async_add_executor_job(
+            _compile_statistics, period
+        )
+    assert history_mock.call_count == 0
+    for entity_id, stat in stats.items():
+        assert compiled_again[entity_id]["mean"] == pytest.approx(stat[0]["mean"])
+
+
 @pytest.mark.parametrize("attributes", [TEMPERATURE_SENSOR_ATTRIBUTES])
 async def test_compile_hourly_statistics_wrong_unit(
     hass: HomeAssistant,
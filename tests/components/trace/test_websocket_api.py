@@ -2,6 +2,7 @@
 
 import asyncio
 from collections import defaultdict
+import contextlib
 import json
 from typing import Any
 from unittest.mock import patch
@@ -12,6 +13,7 @@ from pytest_unordered import unordered
 from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.setup import async_setup_component
 from homeassistant.util.uuid import random_uuid_hex
@@ -44,6 +46,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    trace_config: dict[str, Any] | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -67,6 +70,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = trace_config
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -788,6 +795,72 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+@pytest.mark.parametrize(
+    ("trace_config", "stored_sun_traces", "stored_moon_traces"),
+    [
+        ({"mode": "full"}, 1, 1),
+        ({"mode": "off"}, 0, 0),
+        ({"mode": "errors_only"}, 0, 1),
+        ({"mode": "sampled", "sample_percentage": 0}, 0, 0),
+        ({"mode": "sampled", "sample_percentage": 100}, 1, 1),
+    ],
+)
+async def test_trace_modes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    prefix: str,
+    trace_config: dict[str, Any],
+    stored_sun_traces: int,
+    stored_moon_traces: int,
+) -> None:
+    """Test the runs which are traced and stored depend on the trace mode."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"stop": "Moon has set", "error": True},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config=trace_config
+    )
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    with contextlib.suppress(HomeAssistantError):
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = response["result"]
+    assert len(_find_traces(traces, domain, "sun")) == stored_sun_traces
+    assert len(_find_traces(traces, domain, "moon")) == stored_moon_traces
+    if stored_moon_traces:
+        run_id = _find_run_id(traces, domain, "moon")
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "moon",
+                "run_id": run_id,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["script_execution"] == "aborted"
+        assert response["result"]["trace"][f"{prefix}/0"][0]["error"] == "Moon has set"
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -1284,6 +1357,76 @@ async def test_breakpoints_2(
     assert new_run_id != run_id
 
 
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+@pytest.mark.parametrize(
+    "trace_config",
+    [
+        {"mode": "off"},
+        {"mode": "errors_only"},
+        {"mode": "sampled", "sample_percentage": 0},
+    ],
+)
+async def test_breakpoints_untraced_mode(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    prefix: str,
+    trace_config: dict[str, Any],
+) -> None:
+    """Test breakpoints are hit when the trace mode does not trace every run."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [{"event": "event0"}, {"event": "event1"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config=trace_config
+    )
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "trace/debug/breakpoint/subscribe"})
+    response = await client.receive_json()
+    assert response["success"]
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/debug/breakpoint/set",
+            "domain": domain,
+            "item_id": "sun",
+            "node": f"{prefix}/1",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    response = await client.receive_json()
+    assert response["event"]["node"] == f"{prefix}/1"
+    run_id = response["event"]["run_id"]
+
+    await client.send_json({"id": 3, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    trace = _find_traces(response["result"], domain, "sun")[-1]
+    assert trace["run_id"] == run_id
+    assert trace["state"] == "running"
+
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "trace/debug/continue",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    await hass.async_block_till_done()
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
 )
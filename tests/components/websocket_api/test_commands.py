@@ -1,7 +1,9 @@
 """Tests for WebSocket API commands."""
 
 import asyncio
+from collections import deque
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -19,7 +21,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -27,6 +29,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +37,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1262,6 +1266,172 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shares_state_changed_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribe entities subscriptions share one state_changed listener."""
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    other_client = await hass_ws_client(hass)
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await other_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["event"] == {"a": {}}
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.other", "on")
+    for client, msg_id, entity_ids in (
+        (websocket_client, 7, ["light.permitted", "light.other"]),
+        (other_client, 8, ["light.permitted"]),
+    ):
+        for entity_id in entity_ids:
+            msg = await client.receive_json()
+            assert msg["id"] == msg_id
+            assert list(msg["event"]["a"]) == [entity_id]
+
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        await client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+    # The listener is kept to track the versions for resyncing clients
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+
+async def test_subscribe_entities_coalesced(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities coalesces the state changes of an interval."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_interval": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "off", {"color": "green"})
+    hass.states.async_set("light.permitted", "on", {"color": "green"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.transient", "on")
+    hass.states.async_remove("light.transient")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.permitted", "off")
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+    # The pending flush is cancelled by the unsubscribe
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["type"] == "pong"
+
+
+async def test_subscribe_entities_resync(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test a client resyncs with the states changed since its last version."""
+    hass.states.async_set("light.unchanged", "off")
+    hass.states.async_set("light.changed", "off")
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "versioned": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {
+        "light.unchanged",
+        "light.changed",
+        "light.removed",
+    }
+    assert "delta" not in msg
+    version = msg["v"]
+
+    hass.states.async_set("light.changed", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.changed"]["+"]["s"] == "on"
+    assert msg["v"] != version
+    version = msg["v"]
+    await websocket_client.close()
+
+    hass.states.async_set("light.changed", "off")
+    hass.states.async_set("light.changed", "on")
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 8, "type": "subscribe_entities", "since": version})
+    msg = await client.receive_json()
+    assert msg["success"]
+    msg = await client.receive_json()
+    assert msg["delta"] is True
+    assert set(msg["event"]["a"]) == {"light.changed", "light.added"}
+    assert msg["event"]["r"] == ["light.removed"]
+    version = msg["v"]
+
+    # The changes since the version are no longer in the buffer
+    hass.states.async_set("light.unchanged", "on")
+    msg = await client.receive_json()
+    assert msg["event"]["c"]["light.unchanged"]["+"]["s"] == "on"
+    with patch.object(
+        hass.data["websocket_api_state_subscription_hub"],
+        "_changes",
+        deque(maxlen=1),
+    ):
+        hass.states.async_set("light.changed", "off")
+        msg = await client.receive_json()
+        assert msg["event"]["c"]["light.changed"]["+"]["s"] == "off"
+        for msg_id, since in ((9, version), (10, "unknown:1"), (11, "invalid")):
+            await client.send_json(
+                {"id": msg_id, "type": "subscribe_entities", "since": since}
+            )
+            msg = await client.receive_json()
+            assert msg["success"]
+            msg = await client.receive_json()
+            assert "delta" not in msg
+            assert set(msg["event"]["a"]) == {
+                "light.unchanged",
+                "light.changed",
+                "light.added",
+            }
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
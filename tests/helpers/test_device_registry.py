@@ -1688,6 +1688,34 @@ async def test_loading_saving_data(
     assert orig_kitchen_light_witout_suggested_area == new_kitchen_light
 
 
+async def test_items_to_save(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test only changed devices get new items to append to the storage log."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("hue", "1234")}
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("hue", "5678")}
+    )
+    items = device_registry._items_to_save()
+    assert items["devices"].keys() == {device1.id, device2.id}
+    assert items["deleted_devices"] == {}
+
+    device_registry.async_update_device(device1.id, name_by_user="Kitchen")
+    device_registry.async_remove_device(device2.id)
+    new_items = device_registry._items_to_save()
+    assert new_items["devices"].keys() == {device1.id}
+    assert new_items["devices"][device1.id] is not items["devices"][device1.id]
+    assert new_items["deleted_devices"].keys() == {device2.id}
+    assert (
+        device_registry._items_to_save()["devices"][device1.id]
+        is (new_items["devices"][device1.id])
+    )
+
+
 async def test_no_unnecessary_changes(
     device_registry: dr.DeviceRegistry, mock_config_entry: MockConfigEntry
 ) -> None:
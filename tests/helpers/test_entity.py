@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -917,6 +918,49 @@ async def test_attribution_attribute(hass: HomeAssistant) -> None:
     assert state.attributes.get(ATTR_ATTRIBUTION) == "Home Assistant"
 
 
+async def test_static_attributes_updated(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the static attributes follow the properties and registry entry."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer", name="Test")
+    await platform.async_add_entities([ent])
+    ent._attr_icon = "mdi:one"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {ATTR_FRIENDLY_NAME: "Test", ATTR_ICON: "mdi:one"}
+
+    ent._attr_icon = "mdi:two"
+    ent._attr_attribution = "Home Assistant"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        ATTR_ATTRIBUTION: "Home Assistant",
+        ATTR_FRIENDLY_NAME: "Test",
+        ATTR_ICON: "mdi:two",
+    }
+
+    entity_registry.async_update_entity(ent.entity_id, name="Renamed", icon="mdi:reg")
+    await hass.async_block_till_done()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        ATTR_ATTRIBUTION: "Home Assistant",
+        ATTR_FRIENDLY_NAME: "Renamed",
+        ATTR_ICON: "mdi:reg",
+    }
+
+    # State attributes with the same key are overridden by the static attributes
+    ent._attr_extra_state_attributes = {ATTR_ICON: "mdi:state", "extra": 1}
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        ATTR_ATTRIBUTION: "Home Assistant",
+        ATTR_FRIENDLY_NAME: "Renamed",
+        ATTR_ICON: "mdi:reg",
+        "extra": 1,
+    }
+
+
 async def test_entity_category_property(hass: HomeAssistant) -> None:
     """Test entity category property."""
     mock_entity1 = entity.Entity()
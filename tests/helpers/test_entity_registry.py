@@ -1,12 +1,16 @@
 """Tests for the Entity Registry."""
 
+import asyncio
 from datetime import datetime, timedelta
 from functools import partial
+import json
+import os
 from typing import Any
 from unittest.mock import patch
 
 import attr
 from freezegun.api import FrozenDateTimeFactory
+import py
 import pytest
 import voluptuous as vol
 
@@ -26,6 +30,7 @@ from tests.common import (
     MockConfigEntry,
     async_capture_events,
     async_fire_time_changed,
+    async_test_home_assistant,
     flush_store,
 )
 
@@ -458,6 +463,70 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+async def test_items_to_save(entity_registry: er.EntityRegistry) -> None:
+    """Test only changed entries get new items to append to the storage log."""
+    entry1 = entity_registry.async_get_or_create("light", "hue", "1234")
+    entry2 = entity_registry.async_get_or_create("light", "hue", "5678")
+    items = entity_registry._items_to_save()
+    assert items["entities"].keys() == {entry1.id, entry2.id}
+    assert items["deleted_entities"] == {}
+
+    entity_registry.async_update_entity(entry1.entity_id, name="Kitchen")
+    entity_registry.async_remove(entry2.entity_id)
+    new_items = entity_registry._items_to_save()
+    assert new_items["entities"].keys() == {entry1.id}
+    assert new_items["entities"][entry1.id] is not items["entities"][entry1.id]
+    assert new_items["deleted_entities"].keys() == {entry2.id}
+    assert (
+        entity_registry._items_to_save()["entities"][entry1.id]
+        is (new_items["entities"][entry1.id])
+    )
+
+
+async def test_save_to_append_log(tmpdir: py.path.local) -> None:
+    """Test changed entries are appended to the storage log and loaded again."""
+
+    def read_log(store_log_path: str) -> list[dict[str, Any]]:
+        with open(store_log_path, encoding="utf8") as fdesc:
+            return [json.loads(line) for line in fdesc]
+
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(
+        config_dir=tmp_storage.strpath, load_registries=False
+    ) as hass:
+        registry = er.EntityRegistry(hass)
+        await registry.async_load()
+        store = registry._store
+
+        entry1 = registry.async_get_or_create("light", "hue", "1234")
+        entry2 = registry.async_get_or_create("light", "hue", "5678")
+        await flush_store(store)
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+
+        registry.async_update_entity(entry1.entity_id, name="Kitchen")
+        registry.async_remove(entry2.entity_id)
+        await flush_store(store)
+        records = await hass.async_add_executor_job(read_log, store.log_path)
+        assert [
+            (record["collection"], record["id"], "removed" in record)
+            for record in records[1:]
+        ] == [
+            ("entities", entry1.id, False),
+            ("entities", entry2.id, True),
+            ("deleted_entities", entry2.id, False),
+        ]
+
+        registry2 = er.EntityRegistry(hass)
+        await registry2.async_load()
+        assert list(registry2.entities) == [entry1.entity_id]
+        assert registry2.entities[entry1.entity_id].name == "Kitchen"
+        assert registry2.async_get_entity_id("light", "hue", "5678") is None
+        assert ("light", "hue", "5678") in registry2.deleted_entities
+
+        await hass.async_stop(force=True)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
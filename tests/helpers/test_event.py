@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -552,6 +552,37 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_keyed_by_the_bus(
+    hass: HomeAssistant,
+) -> None:
+    """Test the event bus only runs the listeners of the changed entity."""
+    calls = []
+
+    @ha.callback
+    def listener(event: Event[EventStateChangedData]) -> None:
+        calls.append(event.data["entity_id"])
+
+    unsub_one = async_track_state_change_event(
+        hass, ["light.one", "light.two"], listener
+    )
+    unsub_two = async_track_state_change_event(hass, "light.two", listener)
+    keyed = hass.bus._keyed_listeners[EVENT_STATE_CHANGED]
+    assert {
+        entity_id: len(listeners) for entity_id, listeners in keyed.entity_ids.items()
+    } == {"light.one": 1, "light.two": 1}
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.three", "on")
+    await hass.async_block_till_done()
+    assert calls == ["light.one", "light.two", "light.two"]
+
+    unsub_one()
+    assert list(keyed.entity_ids) == ["light.two"]
+    unsub_two()
+    assert EVENT_STATE_CHANGED not in hass.bus._keyed_listeners
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -26,6 +26,7 @@ from homeassistant.helpers.restore_state import (
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockEntityPlatform,
@@ -42,6 +43,17 @@ DOMAIN = "test_domain"
 PLATFORM = "test_platform"
 
 
+def _stored_data(stored_states: list[StoredState]) -> dict[str, Any]:
+    """Return the data of the store for the stored states."""
+    return {
+        "states": [
+            {"id": stored_state.state.entity_id, **stored_state.as_dict()}
+            for stored_state in stored_states
+        ],
+        "dump": [],
+    }
+
+
 async def test_caching_data(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     now = dt_util.utcnow()
@@ -53,7 +65,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(_stored_data(stored_states))
 
     # Emulate a fresh load
     hass.data.pop(DATA_RESTORE_STATE)
@@ -63,7 +75,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
             "homeassistant.helpers.restore_state.Store.async_load",
             side_effect=HomeAssistantError,
         ),
-        patch("homeassistant.helpers.restore_state.Store.async_save"),
+        patch("homeassistant.helpers.restore_state.Store.async_save_items"),
     ):
         # Failure to load should not be treated as fatal
         await async_load(hass)
@@ -73,7 +85,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         await async_load(hass)
         await hass.async_block_till_done()
@@ -112,11 +124,11 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     """Test that we write periodiclly but not after stop."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save(_stored_data([]))
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -132,7 +144,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -140,7 +152,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -148,7 +160,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -160,11 +172,11 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     """Test that we cancel the currently running job, save the data, and verify the perdiodic job continues."""
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([])
+    await data.store.async_save(_stored_data([]))
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -181,7 +193,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -190,7 +202,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -198,7 +210,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -206,7 +218,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -227,7 +239,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(_stored_data(stored_states))
 
     # Emulate a fresh load
     hass.set_state(CoreState.not_running)
@@ -245,7 +257,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -260,7 +272,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -308,13 +320,13 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = list(args[0]["states"].values())
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -342,13 +354,13 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.Store.async_save_items"
     ) as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = list(args[0]["states"].values())
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -358,6 +370,88 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_only_writes_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the states which changed are serialized again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b2": StoredState(State("input_boolean.b2", "off"), None, now),
+    }
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save_items"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+
+    first_states = mock_write_data.mock_calls[0][1][0]["states"]
+    second_states = mock_write_data.mock_calls[1][1][0]["states"]
+    assert list(second_states) == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+    assert second_states["input_boolean.b0"] is first_states["input_boolean.b0"]
+    assert second_states["input_boolean.b1"] is not first_states["input_boolean.b1"]
+    assert second_states["input_boolean.b2"] is first_states["input_boolean.b2"]
+    assert json_round_trip(second_states["input_boolean.b1"])["state"]["state"] == (
+        "off"
+    )
+    # The registered entities are last seen at the time of the dump
+    assert json_round_trip(second_states["input_boolean.b0"])["last_seen"] is None
+    assert json_round_trip(second_states["input_boolean.b2"])["last_seen"] == (
+        now.isoformat()
+    )
+
+
+async def test_load_last_seen_from_last_dump(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test states without a last_seen use the time of the last dump."""
+    last_dump = datetime(2024, 1, 1, tzinfo=dt_util.UTC)
+    last_seen = datetime(2023, 12, 31, tzinfo=dt_util.UTC)
+    state = State("input_boolean.b0", "on").as_dict_json.decode()
+    hass_storage[STORAGE_KEY] = {
+        "version": 2,
+        "key": STORAGE_KEY,
+        "data": {
+            "states": [
+                {
+                    "id": "input_boolean.b0",
+                    "state": json_loads(state),
+                    "extra_data": None,
+                    "last_seen": None,
+                },
+                {
+                    "id": "input_boolean.b1",
+                    "state": {**json_loads(state), "entity_id": "input_boolean.b1"},
+                    "extra_data": None,
+                    "last_seen": last_seen.isoformat(),
+                },
+            ],
+            "dump": [{"id": "last", "last_seen": last_dump.isoformat()}],
+        },
+    }
+    await async_load(hass)
+    data = async_get(hass)
+    assert data.last_states["input_boolean.b0"].last_seen == last_dump
+    assert data.last_states["input_boolean.b1"].last_seen == last_seen
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -383,7 +477,7 @@ async def test_dump_error(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
+        "homeassistant.helpers.restore_state.Store.async_save_items",
         side_effect=HomeAssistantError,
     ) as mock_write_data:
         await data.async_dump_states()
@@ -531,7 +625,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
@@ -546,7 +640,7 @@ async def test_restore_entity_end_to_end(
     await data.async_dump_states()
     await hass.async_block_till_done()
 
-    storage_data = hass_storage[STORAGE_KEY]["data"]
+    storage_data = hass_storage[STORAGE_KEY]["data"]["states"]
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
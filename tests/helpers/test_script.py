@@ -38,6 +38,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -280,6 +281,43 @@ async def test_calling_service_basic(
     )
 
 
+async def test_calling_service_static_prepared_once(hass: HomeAssistant) -> None:
+    """Test a service call without dynamic templates is prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "action": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world", "colors": ["red", "blue"]},
+            },
+            {"action": "test.script", "data": {"hello": "{{ 'dynamic' }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as prepare_call_mock:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    # Prepared once for the static step and on every run for the dynamic step
+    assert prepare_call_mock.call_count == 3
+    assert len(calls) == 4
+    assert calls[0].data == {
+        "entity_id": ["light.kitchen"],
+        "hello": "world",
+        "colors": ["red", "blue"],
+    }
+    assert calls[2].data == calls[0].data
+    # The runs do not share the service data
+    assert calls[2].data["colors"] is not calls[0].data["colors"]
+    assert calls[1].data == {"hello": "dynamic"}
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -715,6 +715,41 @@ async def test_extract_entity_ids_from_devices(
     )
 
 
+async def test_extract_entity_ids_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the resolved targets are cached until a registry changes."""
+    kitchen = area_registry.async_create("Kitchen")
+    living_room = area_registry.async_create("Living room")
+    entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="ceiling"
+    )
+    entity_registry.async_update_entity("light.ceiling", area_id=kitchen.id)
+    call = ServiceCall("light", "turn_on", {"area_id": kitchen.id})
+
+    with patch.object(
+        service,
+        "_async_resolve_registry_targets",
+        wraps=service._async_resolve_registry_targets,
+    ) as resolve_mock:
+        assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {"light.ceiling"}
+        assert resolve_mock.call_count == 1
+
+        # Changing the returned selection does not change the cache
+        selected.indirectly_referenced.clear()
+        entity_registry.async_update_entity("light.ceiling", area_id=living_room.id)
+        assert await service.async_extract_entity_ids(hass, call) == set()
+        assert resolve_mock.call_count == 2
+
+        area_registry.async_delete(living_room.id)
+        assert await service.async_extract_entity_ids(hass, call) == set()
+        assert resolve_mock.call_count == 3
+
+
 @pytest.mark.usefixtures("floor_area_mock")
 async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with floors."""
@@ -0,0 +1,120 @@
+"""Test the startup tracer."""
+
+from unittest.mock import patch
+
+from homeassistant import setup
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.startup_trace import (
+    CATEGORY_COMPONENT_IMPORT,
+    CATEGORY_DEPENDENCIES,
+    CATEGORY_EXECUTOR,
+    CATEGORY_IMPORT,
+    CATEGORY_SETUP,
+    DATA_STARTUP_TRACER,
+    StartupTracer,
+    async_enable_startup_trace,
+    async_get_startup_tracer,
+    trace_startup,
+)
+from homeassistant.util.json import json_loads
+
+from tests.common import MockModule, mock_integration
+
+
+async def test_critical_path(hass: HomeAssistant) -> None:
+    """Test the critical path follows the dependencies which finished last."""
+    tracer = StartupTracer(hass)
+    tracer.start = 0
+    for name, start, end in (
+        ("http", 0, 2),
+        ("auth", 0, 1),
+        ("api", 0, 6),
+        ("zone", 0.5, 3),
+    ):
+        tracer.add_span(name, CATEGORY_SETUP, name, start, end)
+    tracer.add_span(
+        "api", CATEGORY_DEPENDENCIES, "api", 0, 2, {"dependencies": ["auth", "http"]}
+    )
+    tracer.add_span("api", CATEGORY_COMPONENT_IMPORT, "api", 2, 3)
+    tracer.add_span("homeassistant.components.api", CATEGORY_IMPORT, "Import", 2, 3)
+    tracer.add_span("job", CATEGORY_EXECUTOR, "Sync", 3, 4, {"queue_wait": 0.5})
+
+    assert [span.name for span in tracer.critical_path()] == ["http", "api"]
+
+    report = tracer.report()
+    assert "api: dependencies 2.000s, import 1.000s, total 6.000s" in report
+    assert "finished at 6.000s" in report
+    assert "1.000s homeassistant.components.api" in report
+    assert "Executor jobs: 1, queue wait total 0.500s, max 0.500s" in report
+
+
+async def test_chrome_trace(hass: HomeAssistant) -> None:
+    """Test the spans are converted to the Chrome trace event format."""
+    tracer = StartupTracer(hass)
+    tracer.start = 10
+    tracer.add_span("api", CATEGORY_SETUP, "api", 10.5, 11)
+    tracer.add_span("job", CATEGORY_EXECUTOR, "Sync", 10.25, 10.5, {"queue_wait": 0})
+
+    trace = tracer.chrome_trace()
+    events = trace["traceEvents"]
+    assert [
+        (event["ph"], event["name"], event.get("ts"), event.get("dur"), event["tid"])
+        for event in events
+    ] == [
+        ("X", "api", 500000, 500000, 1),
+        ("X", "job", 250000, 250000, 2),
+        ("M", "thread_name", None, None, 1),
+        ("M", "thread_name", None, None, 2),
+    ]
+    assert events[1]["args"] == {"queue_wait": 0}
+    assert events[3]["args"] == {"name": "Sync"}
+
+
+async def test_trace_setup_and_executors(hass: HomeAssistant) -> None:
+    """Test the setups and executor jobs are traced until started."""
+    assert async_get_startup_tracer(hass) is None
+    with trace_startup(hass, "untraced", CATEGORY_IMPORT):
+        pass
+
+    tracer = async_enable_startup_trace(hass)
+    assert async_get_startup_tracer(hass) is tracer
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    def _job() -> None:
+        """Run in the executor."""
+
+    await hass.async_add_executor_job(_job)
+    await hass.async_add_import_executor_job(_job)
+
+    spans = {(span.category, span.name) for span in tracer.spans}
+    assert {
+        (CATEGORY_SETUP, "comp"),
+        (CATEGORY_SETUP, "comp_dep"),
+        (CATEGORY_DEPENDENCIES, "comp"),
+        (CATEGORY_COMPONENT_IMPORT, "comp"),
+    } <= spans
+    executor_jobs = [span for span in tracer.spans if span.name.endswith("._job")]
+    assert len(executor_jobs) == 2
+    assert all(
+        span.category == CATEGORY_EXECUTOR and span.args["queue_wait"] >= 0
+        for span in executor_jobs
+    )
+    assert [span.name for span in tracer.critical_path()] == ["comp_dep", "comp"]
+
+    with patch(
+        "homeassistant.helpers.startup_trace.write_utf8_file"
+    ) as write_utf8_file_mock:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    path, data = write_utf8_file_mock.call_args[0]
+    assert path == hass.config.path("startup_trace.json")
+    assert len(json_loads(data)["traceEvents"]) > len(spans)
+    assert DATA_STARTUP_TRACER not in hass.data
+
+    spans_count = len(tracer.spans)
+    await hass.async_add_executor_job(_job)
+    assert len(tracer.spans) == spans_count
@@ -21,7 +21,7 @@ from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAs
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
@@ -1180,3 +1180,204 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def _async_save_items(
+    hass: HomeAssistant, store: storage.Store, items: dict[str, dict[str, Any]]
+) -> None:
+    """Save items with an append log store and wait for the write."""
+    store.async_delay_save_items(lambda: items, 1)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+
+def _read_log(store: storage.Store) -> list[dict[str, Any]]:
+    """Read the records of the append log of a store."""
+    with open(store.log_path, encoding="utf8") as fdesc:
+        return [json.loads(line) for line in fdesc]
+
+
+async def test_append_log_round_trip(tmpdir: py.path.local) -> None:
+    """Test changed items are appended to the log and replayed on load."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        item_a = {"id": "a", "name": "A"}
+        item_b = {"id": "b", "name": "B"}
+        item_c = {"id": "c", "name": "C"}
+        deleted_d = {"id": "d", "name": "D"}
+
+        # The first write is a snapshot
+        await _async_save_items(
+            hass,
+            store,
+            {"items": {"a": item_a, "b": item_b, "c": item_c}, "deleted": {}},
+        )
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+        snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+        assert snapshot["data"] == {"items": [item_a, item_b, item_c], "deleted": []}
+        assert snapshot["log_id"]
+
+        # Only the changed items are appended
+        item_b_changed = {"id": "b", "name": "B2"}
+        item_e = {"id": "e", "name": "E"}
+        await _async_save_items(
+            hass,
+            store,
+            {
+                "items": {"a": item_a, "b": item_b_changed, "e": item_e},
+                "deleted": {"d": deleted_d},
+            },
+        )
+        assert (
+            await hass.async_add_executor_job(json_util.load_json, store.path)
+            == snapshot
+        )
+        assert await hass.async_add_executor_job(_read_log, store) == [
+            {"log_id": snapshot["log_id"]},
+            {"collection": "items", "id": "b", "item": item_b_changed},
+            {"collection": "items", "id": "e", "item": item_e},
+            {"collection": "items", "id": "c", "removed": True},
+            {"collection": "deleted", "id": "d", "item": deleted_d},
+        ]
+
+        # Nothing is appended if nothing changed
+        await _async_save_items(
+            hass,
+            store,
+            {
+                "items": {"a": item_a, "b": item_b_changed, "e": item_e},
+                "deleted": {"d": deleted_d},
+            },
+        )
+        assert len(await hass.async_add_executor_job(_read_log, store)) == 5
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        assert await store2.async_load() == {
+            "items": [item_a, item_b_changed, item_e],
+            "deleted": [deleted_d],
+        }
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_compaction(tmpdir: py.path.local) -> None:
+    """Test the append log is compacted into the snapshot."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        items = {"a": {"id": "a", "value": 0}}
+        await _async_save_items(hass, store, {"items": items})
+
+        with patch("homeassistant.helpers.storage.APPEND_LOG_MAX_RECORDS", 2):
+            for value in (1, 2):
+                items = {"a": {"id": "a", "value": value}}
+                await _async_save_items(hass, store, {"items": items})
+            assert len(await hass.async_add_executor_job(_read_log, store)) == 3
+
+            items = {"a": {"id": "a", "value": 3}}
+            await _async_save_items(hass, store, {"items": items})
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+        snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+        assert snapshot["data"] == {"items": [{"id": "a", "value": 3}]}
+
+        # A full save replaces the log as well
+        items = {"a": {"id": "a", "value": 4}}
+        await _async_save_items(hass, store, {"items": items})
+        assert await hass.async_add_executor_job(os.path.exists, store.log_path)
+        await store.async_save({"items": [{"id": "a", "value": 5}]})
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        assert await store2.async_load() == {"items": [{"id": "a", "value": 5}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_stale_or_truncated(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a stale log is ignored and a truncated record stops the replay."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        await _async_save_items(hass, store, {"items": {"a": {"id": "a"}}})
+        snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+
+        def _write_log(lines: list[str]) -> None:
+            with open(store.log_path, "w", encoding="utf8") as fdesc:
+                fdesc.write("\n".join(lines))
+
+        added_b = json.dumps({"collection": "items", "id": "b", "item": {"id": "b"}})
+        await hass.async_add_executor_job(
+            _write_log, [json.dumps({"log_id": "stale"}), added_b]
+        )
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        assert await store2.async_load() == {"items": [{"id": "a"}]}
+
+        await hass.async_add_executor_job(
+            _write_log,
+            [json.dumps({"log_id": snapshot["log_id"]}), added_b, added_b[:10]],
+        )
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        assert await store3.async_load() == {"items": [{"id": "a"}, {"id": "b"}]}
+        assert "Ignoring truncated record" in caplog.text
+
+        await hass.async_stop(force=True)
+
+
+async def test_append_log_fsync(tmpdir: py.path.local) -> None:
+    """Test the log is flushed to the disk after each append."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        await _async_save_items(hass, store, {"items": {"a": {"id": "a"}}})
+
+        with patch("homeassistant.helpers.storage.os.fsync") as mock_fsync:
+            # Creating the log flushes the log and the directory
+            await _async_save_items(hass, store, {"items": {"b": {"id": "b"}}})
+            assert len(mock_fsync.mock_calls) == 2
+            # Appending to the log only flushes the log
+            await _async_save_items(hass, store, {"items": {"c": {"id": "c"}}})
+            assert len(mock_fsync.mock_calls) == 3
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize("pending_write", [False, True])
+async def test_append_log_compacted_on_final_write(
+    tmpdir: py.path.local, pending_write: bool
+) -> None:
+    """Test the log is compacted into the snapshot on the final write."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, append_log=True)
+        await _async_save_items(hass, store, {"items": {"a": {"id": "a"}}})
+        items = {"a": {"id": "a"}, "b": {"id": "b"}}
+        await _async_save_items(hass, store, {"items": items})
+        assert await hass.async_add_executor_job(os.path.exists, store.log_path)
+
+        if pending_write:
+            items = {"a": {"id": "a"}, "c": {"id": "c"}}
+            store.async_delay_save_items(lambda: {"items": items}, 10)
+
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.log_path)
+        snapshot = await hass.async_add_executor_job(json_util.load_json, store.path)
+        assert snapshot["data"] == {"items": list(items.values())}
+        assert "compact_log" not in snapshot
+
+        hass.set_state(CoreState.running)
+        await hass.async_stop(force=True)
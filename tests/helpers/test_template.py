@@ -6,13 +6,16 @@ from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -6582,3 +6585,137 @@ async def test_merge_response_not_mutate_original_object(
 
     tpl = template.Template(_template, hass)
     assert tpl.async_render()
+
+
+async def test_template_code_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled template code is persisted and reused after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+
+    tmpl = template.Template("{{ 1 + value }}", hass)
+    assert tmpl.async_render({"value": 1}) == 2
+    limited_tmpl = template.Template("{{ 2 + value }}", hass)
+    assert limited_tmpl.async_render({"value": 1}, limited=True) == 3
+    assert code_cache.get("default", "{{ 1 + value }}")
+    # Templates are compiled before they are bound to the limited environment
+    assert code_cache.get("default", "{{ 2 + value }}")
+    assert not code_cache.get("limited", "{{ 2 + value }}")
+    await hass.async_block_till_done()
+    await code_cache.async_save()
+    assert Path(code_cache.path).exists()
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    hass.data.pop(template._ENVIRONMENT_LIMITED)
+    await template.async_load_template_code_cache(hass)
+    with patch.object(
+        jinja2.sandbox.ImmutableSandboxedEnvironment, "compile"
+    ) as mock_compile:
+        tmpl = template.Template("{{ 1 + value }}", hass)
+        assert tmpl.async_render({"value": 2}) == 3
+        limited_tmpl = template.Template("{{ 2 + value }}", hass)
+        assert limited_tmpl.async_render({"value": 2}, limited=True) == 4
+    assert not mock_compile.called
+
+
+async def test_template_code_cache_version_change(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the template code cache is discarded when the version changes."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    await hass.async_block_till_done()
+    await code_cache.async_save()
+
+    with patch.object(template, "__version__", "0.0.0"):
+        await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert not code_cache.get("default", "{{ 1 + 1 }}")
+
+    with patch.object(template.sys, "version", "0.0.0"):
+        await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert not code_cache.get("default", "{{ 1 + 1 }}")
+
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert code_cache.get("default", "{{ 1 + 1 }}")
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        ("other", "0" * 64, compile("1", "<template>", "eval")),
+        ("default", "0", compile("1", "<template>", "eval")),
+        ("default", "0" * 64, b"code"),
+        ("default", "0" * 64),
+    ],
+)
+async def test_template_code_cache_malformed(
+    hass: HomeAssistant, tmp_path: Path, entry: tuple
+) -> None:
+    """Test a template code cache with a malformed entry is discarded."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    await hass.async_block_till_done()
+    await code_cache.async_save()
+
+    path = Path(code_cache.path)
+    version, codes = marshal.loads(path.read_bytes())
+    path.write_bytes(marshal.dumps((version, [*codes, entry])))
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert not code_cache.get("default", "{{ 1 + 1 }}")
+
+
+async def test_template_code_cache_save_from_thread(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test templates compiled outside of the event loop schedule one save."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+
+    def _compile() -> None:
+        for number in range(3):
+            template.Template(f"{{{{ {number} }}}}", hass).ensure_valid()
+
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        await hass.async_add_executor_job(_compile)
+        await hass.async_block_till_done()
+    assert len(mock_call_later.mock_calls) == 1
+    assert code_cache.get("default", "{{ 2 }}")
+
+
+async def test_template_code_cache_corrupt(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a corrupt template code cache is discarded."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    (tmp_path / ".storage" / template.TEMPLATE_CODE_CACHE_FILE).write_bytes(b"bad")
+    await template.async_load_template_code_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    await hass.async_block_till_done()
+    await hass.data[template._TEMPLATE_CODE_CACHE].async_save()
+
+
+async def test_template_code_cache_lru(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the template code cache evicts the least recently used code."""
+    hass.config.config_dir = str(tmp_path)
+    with patch.object(template, "TEMPLATE_CODE_CACHE_SIZE", 2):
+        await template.async_load_template_code_cache(hass)
+        code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+        for source in ("{{ 1 }}", "{{ 2 }}", "{{ 3 }}"):
+            template.Template(source, hass).ensure_valid()
+        await hass.async_block_till_done()
+        await code_cache.async_save()
+        await template.async_load_template_code_cache(hass)
+
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    assert not code_cache.get("default", "{{ 1 }}")
+    assert code_cache.get("default", "{{ 2 }}")
+    assert code_cache.get("default", "{{ 3 }}")
@@ -0,0 +1,172 @@
+"""Test the timer wheel."""
+
+from datetime import datetime, timedelta
+from functools import partial
+import time
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+    async_track_utc_time_change,
+)
+from homeassistant.helpers.timer_wheel import (
+    TIMER_WHEEL_RESOLUTION,
+    TimerWheel,
+    async_enable_timer_wheel,
+    async_get_timer_wheel,
+    async_get_timer_wheel_stats,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+async def test_timers_run_in_slots(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the timers are run together once their slot has passed."""
+    await hass.async_block_till_done()
+    assert async_get_timer_wheel(hass) is None
+    assert async_get_timer_wheel_stats(hass) is None
+    timer_wheel = async_enable_timer_wheel(hass)
+    assert async_get_timer_wheel(hass) is timer_wheel
+    calls: list[str] = []
+    now = dt_util.utcnow()
+
+    @callback
+    def _action(name: str, _now: datetime) -> None:
+        """Record the call."""
+        calls.append(name)
+
+    async_track_point_in_utc_time(
+        hass, partial(_action, "first"), now + timedelta(seconds=1)
+    )
+    async_call_later(hass, 1.01, partial(_action, "second"))
+    unsub_cancelled = async_call_later(hass, 1, partial(_action, "cancelled"))
+    async_call_later(hass, 3600, partial(_action, "later"))
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == 4
+    assert stats["rotations"] == 1
+    # The delays are on the wheel of the monotonic clock
+    assert timer_wheel.async_stats()["timers"] == 1
+
+    unsub_cancelled()
+    freezer.tick(0.5)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert calls == []
+
+    freezer.tick(0.5 + TIMER_WHEEL_RESOLUTION * 2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert calls == ["first", "second"]
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == 1
+    assert stats["fired"] == 2
+
+    freezer.tick(3600)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    # The rotation is moved to the slots before running the timer
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert calls == ["first", "second", "later"]
+    assert async_get_timer_wheel_stats(hass)["timers"] == 0
+
+
+async def test_delays_ignore_wall_clock_changes(hass: HomeAssistant) -> None:
+    """Test the delays run on the monotonic clock and points in time do not."""
+    await hass.async_block_till_done()
+    async_enable_timer_wheel(hass)
+    calls: list[str] = []
+    now = dt_util.utcnow()
+
+    @callback
+    def _action(name: str, _now: datetime) -> None:
+        """Record the call."""
+        calls.append(name)
+
+    async_call_later(hass, 10, partial(_action, "call_later"))
+    async_track_time_interval(hass, partial(_action, "interval"), timedelta(seconds=10))
+    async_track_point_in_utc_time(
+        hass, partial(_action, "point_in_time"), now + timedelta(seconds=10)
+    )
+
+    with patch(
+        "homeassistant.helpers.timer_wheel.time.time",
+        return_value=time.time() + 3600,
+    ):
+        async_fire_time_changed(hass, now + timedelta(hours=1), fire_all=True)
+        await hass.async_block_till_done()
+    assert calls == ["point_in_time"]
+
+
+async def test_cancel_timer_from_timer(hass: HomeAssistant) -> None:
+    """Test a timer cancelled by a timer of the same slot is not run."""
+    timer_wheel = TimerWheel(hass)
+    calls: list[str] = []
+    handles = []
+
+    @callback
+    def _first() -> None:
+        """Cancel the second timer."""
+        calls.append("first")
+        handles[1].cancel()
+
+    @callback
+    def _second() -> None:
+        """Record the call."""
+        calls.append("second")
+
+    now = dt_util.utcnow().timestamp() - 1
+    handles.append(timer_wheel.async_call_at(now, _first))
+    handles.append(timer_wheel.async_call_at(now, _second))
+    await hass.async_block_till_done()
+    timer_wheel._async_run_due()
+    assert calls == ["first"]
+    assert handles[0].cancelled()
+    assert timer_wheel.async_stats()["timers"] == 0
+
+
+async def test_interval_and_time_patterns(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the intervals and time patterns run on the timer wheel."""
+    start = dt_util.utcnow().replace(second=0, microsecond=900000) + timedelta(
+        minutes=1
+    )
+    freezer.move_to(start)
+    await hass.async_block_till_done()
+    timer_wheel = async_enable_timer_wheel(hass)
+    interval_calls: list[datetime] = []
+    pattern_calls: list[datetime] = []
+    async_track_time_interval(
+        hass, callback(lambda now: interval_calls.append(now)), timedelta(seconds=10)
+    )
+    for _ in range(3):
+        async_track_utc_time_change(
+            hass, callback(lambda now: pattern_calls.append(now)), second=5
+        )
+    stats = async_get_timer_wheel_stats(hass)
+    assert stats["timers"] == 4
+    assert stats["time_patterns"] == 1
+    assert stats["time_pattern_misses"] == 1
+    assert stats["time_pattern_hits"] == 2
+
+    freezer.move_to(start + timedelta(seconds=4.7))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(pattern_calls) == 3
+    assert timer_wheel.async_stats()["time_pattern_misses"] == 2
+
+    freezer.move_to(start + timedelta(seconds=10.1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(interval_calls) == 1
+    # The interval and the time patterns are scheduled again
+    assert async_get_timer_wheel_stats(hass)["timers"] == 4
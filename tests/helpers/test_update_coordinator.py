@@ -11,8 +11,15 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -492,6 +499,53 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+@pytest.mark.parametrize(
+    ("batch_state_writes", "written_before_events"),
+    [(False, [["sensor.first"], ["sensor.first", "sensor.second"]]), (True, None)],
+)
+async def test_batch_state_writes(
+    hass: HomeAssistant,
+    batch_state_writes: bool,
+    written_before_events: list[list[str]] | None,
+) -> None:
+    """Test the state writes of the listeners can be batched."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        batch_state_writes=batch_state_writes,
+    )
+    entity_ids = ["sensor.first", "sensor.second"]
+    written: list[list[str]] = []
+    contexts: list[Context] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        """Record the states written when the event is fired."""
+        written.append(hass.states.async_entity_ids("sensor"))
+        contexts.append(event.context)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    remove_callbacks = [
+        crd.async_add_listener(
+            lambda entity_id=entity_id: hass.states.async_set(entity_id, str(crd.data))
+        )
+        for entity_id in entity_ids
+    ]
+    crd.async_set_updated_data(1)
+    await hass.async_block_till_done()
+
+    assert written == (written_before_events or [entity_ids, entity_ids])
+    # Each state keeps its own context
+    assert contexts[0] is not contexts[1]
+    assert hass.states.get("sensor.first").context is contexts[0]
+    assert hass.states.get("sensor.second").context is contexts[1]
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
@@ -42,6 +42,8 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import (
     CoreState,
+    Event,
+    EventStateChangedData,
     HassJob,
     HomeAssistant,
     ReleaseChannel,
@@ -1169,6 +1171,158 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen to events keyed by entity_id and domain."""
+    entity_calls = []
+    domain_calls = []
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        entity_listener,
+        entity_ids=["light.kitchen", "light.bedroom"],
+    )
+    unsub_domain = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, domain_listener, domains="switch"
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 3
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.office", "on")
+    hass.states.async_set("switch.fan", "on")
+    hass.bus.async_fire(EVENT_STATE_CHANGED)
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": None})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == ["switch.fan"]
+
+    unsub_entity()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 2
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 1
+
+    unsub_domain()
+    hass.states.async_set("switch.fan", "off")
+    await hass.async_block_till_done()
+    assert len(domain_calls) == 1
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+
+
+async def test_eventbus_keyed_listener_with_filter(hass: HomeAssistant) -> None:
+    """Test keyed listeners respect the event filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["new_state"].state == "on"
+
+    unsub = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        listener,
+        entity_ids="light.kitchen",
+        event_filter=mock_filter,
+    )
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["new_state"].state == "on"
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_invalid(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test invalid keyed listener arguments and removing twice."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    def not_a_callback(event_data):
+        """Mock filter that is not a callback."""
+        return True
+
+    with pytest.raises(HomeAssistantError, match="Exactly one of"):
+        hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, listener)
+    with pytest.raises(HomeAssistantError, match="Exactly one of"):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, listener, entity_ids="light.a", domains="light"
+        )
+    with pytest.raises(HomeAssistantError, match="can not listen"):
+        hass.bus.async_listen_keyed(MATCH_ALL, listener, domains="light")
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED,
+            listener,
+            domains="light",
+            event_filter=not_a_callback,
+        )
+
+    unsub = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, listener, entity_ids="light.kitchen"
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
+async def test_eventbus_keyed_listener_removed_from_all_keys_or_none(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a keyed listener is not removed from only some of its keys."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    unsub = hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        listener,
+        entity_ids=["light.kitchen", "light.kitchen", "light.bowl"],
+    )
+    keyed = hass.bus._keyed_listeners[EVENT_STATE_CHANGED]
+    assert len(keyed.entity_ids["light.kitchen"]) == 1
+    bowl_listeners = keyed.entity_ids.pop("light.bowl")
+
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert calls == ["light.kitchen"]
+
+    keyed.entity_ids["light.bowl"] = bowl_listeners
+    unsub()
+    assert EVENT_STATE_CHANGED not in hass.bus._keyed_listeners
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1564,6 +1718,126 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once shares context and timestamp."""
+    hass.states.async_set("light.bowl", "off")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    seen_states: list[tuple[str | None, str | None]] = []
+
+    @ha.callback
+    def _capture_batch_states(event: Event[EventStateChangedData]) -> None:
+        """Capture the states visible when the event is fired."""
+        seen_states.append(
+            (
+                hass.states.get("light.bowl").state,
+                getattr(hass.states.get("light.kitchen"), "state", None),
+            )
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _capture_batch_states)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.kitchen", "on", None),
+            ("light.office", 5, {}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+        "light.office",
+    ]
+    assert seen_states == [("on", "on")] * 3
+    assert len({event.context.id for event in events}) == 1
+    assert len({event.time_fired_timestamp for event in events}) == 1
+    assert hass.states.get("light.office").state == "5"
+    bowl = hass.states.get("light.bowl")
+    assert bowl.attributes == {"brightness": 100}
+    assert bowl.context is events[0].context
+    assert bowl.last_updated == hass.states.get("light.kitchen").last_updated
+
+
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test batched writes hold back events until the batch ends."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.office", "on")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[Event] = []
+
+    @ha.callback
+    def _capture_reported(event: Event) -> None:
+        """Capture state reported events."""
+        reported_events.append(event)
+
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_REPORTED, _capture_reported, entity_ids="light.bowl"
+    )
+    context = ha.Context()
+    own_context = ha.Context()
+
+    with hass.states.async_batch(context):
+        hass.states.async_set("light.bowl", "on")
+        with hass.states.async_batch():
+            hass.states.async_set("light.kitchen", "on", context=own_context)
+        hass.states.async_remove("light.office")
+        await asyncio.sleep(0)
+        assert changed_events == []
+        assert reported_events == []
+
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.kitchen",
+        "light.office",
+    ]
+    assert changed_events[0].context is own_context
+    assert changed_events[1].context is context
+    assert len(reported_events) == 1
+    assert reported_events[0].context is context
+
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert changed_events[2].context is not context
+
+
+async def test_statemachine_batch_own_contexts(hass: HomeAssistant) -> None:
+    """Test batched writes can keep a context per write."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with hass.states.async_batch(shared_context=False):
+        hass.states.async_set("light.bowl", "on")
+        hass.states.async_set("light.kitchen", "on")
+        await asyncio.sleep(0)
+        assert events == []
+
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    assert events[0].context is not events[1].context
+    assert hass.states.get("light.bowl").context is events[0].context
+
+
+async def test_statemachine_batch_fires_events_on_error(
+    hass: HomeAssistant,
+) -> None:
+    """Test events of a batch are still fired if writing a state fails."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("light.kitchen", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == ["light.bowl"]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from datetime import timedelta
 import os
 import pathlib
 import sys
@@ -17,9 +18,15 @@ from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2025,3 +2032,46 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are resolved from the manifest cache."""
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    assert manifest_cache.resolved_domains == []
+    integration = await loader.async_get_integration(hass, "hue")
+    manifest = integration.manifest
+
+    hass.data[loader.DATA_INTEGRATIONS].clear()
+    with patch("homeassistant.loader.json_loads") as json_loads_mock:
+        integration = await loader.async_get_integration(hass, "hue")
+    json_loads_mock.assert_not_called()
+    assert integration.manifest == manifest
+    assert integration.platforms_exists(["light", "not_a_platform"]) == ["light"]
+
+    manifest_cache.async_save(["hue"])
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["resolved_domains"] == ["hue"]
+    manifest_path = str(integration.file_path / "manifest.json")
+    assert data["integrations"][manifest_path]["manifest"]["domain"] == "hue"
+
+    # A changed integration is read again
+    data["integrations"][manifest_path]["dir_mtime"] = 0
+    hass.data.pop(loader.DATA_MANIFEST_CACHE)
+    hass.data[loader.DATA_INTEGRATIONS].clear()
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    assert manifest_cache.resolved_domains == ["hue"]
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as json_loads_mock:
+        await loader.async_get_integration(hass, "hue")
+    assert len(json_loads_mock.mock_calls) == 1
+
+    # The cache of another version is not used
+    data["ha_version"] = "2020.1.0"
+    hass.data.pop(loader.DATA_MANIFEST_CACHE)
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    assert manifest_cache.resolved_domains == []
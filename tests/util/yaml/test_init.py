@@ -627,3 +627,116 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def test_load_yaml_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test parsed files are only parsed again once something they use changes."""
+    mtime = 1_000_000_000_000_000_000
+
+    def write(path: pathlib.Path, content: str) -> None:
+        """Write a file which was not modified recently."""
+        nonlocal mtime
+        path.write_text(content)
+        mtime += 1_000_000_000
+        os.utime(path, ns=(mtime, mtime))
+
+    config_file = tmp_path / "configuration.yaml"
+    write(
+        config_file,
+        "included: !include included.yaml\n"
+        "packages: !include_dir_merge_named packages\n"
+        "secret: !secret password\n"
+        "env: !env_var CACHE_TEST_VAR default\n",
+    )
+    write(tmp_path / "included.yaml", "- one\n")
+    (tmp_path / "packages").mkdir()
+    write(tmp_path / "packages" / "a.yaml", "a: 1\n")
+    write(tmp_path / "secrets.yaml", "password: pwhash\n")
+    monkeypatch.delenv("CACHE_TEST_VAR", raising=False)
+    cache = yaml.YamlCache()
+
+    def load() -> dict:
+        return yaml_loader.load_yaml_dict(
+            str(config_file), yaml_loader.Secrets(tmp_path), cache
+        )
+
+    parse_yaml = yaml_loader.parse_yaml
+    with patch.object(
+        yaml_loader, "parse_yaml", side_effect=parse_yaml
+    ) as parse_yaml_mock:
+        data = load()
+        assert data == {
+            "included": ["one"],
+            "packages": {"a": 1},
+            "secret": "pwhash",
+            "env": "default",
+        }
+        parsed = parse_yaml_mock.call_count
+        data["included"].append("two")
+
+        cached_data = load()
+        assert parse_yaml_mock.call_count == parsed + 1  # secrets.yaml
+        assert cached_data["included"] == ["one"]
+        assert cached_data.__config_file__ == str(config_file)
+        assert cached_data["included"].__line__ == 1
+        assert cached_data["packages"].__line__ == 2
+
+        # Only the changed file and the files including it are parsed again
+        write(tmp_path / "included.yaml", "- three\n")
+        parsed = parse_yaml_mock.call_count
+        assert load()["included"] == ["three"]
+        assert parse_yaml_mock.call_count == parsed + 3
+
+        write(tmp_path / "packages" / "b.yaml", "b: 2\n")
+        assert load()["packages"] == {"a": 1, "b": 2}
+
+        # The secrets are resolved again without parsing the files using them
+        write(tmp_path / "secrets.yaml", "password: changed\n")
+        parsed = parse_yaml_mock.call_count
+        assert load()["secret"] == "changed"
+        assert parse_yaml_mock.call_count == parsed + 1
+
+        monkeypatch.setenv("CACHE_TEST_VAR", "set")
+        assert load()["env"] == "set"
+
+        parsed = parse_yaml_mock.call_count
+        load()
+        assert parse_yaml_mock.call_count == parsed + 1
+
+        # Recently modified files are parsed on each load
+        (tmp_path / "included.yaml").write_text("- four\n")
+        assert load()["included"] == ["four"]
+        parsed = parse_yaml_mock.call_count
+        assert load()["included"] == ["four"]
+        assert parse_yaml_mock.call_count == parsed + 3
+
+    # The cached data does not contain the secrets
+    assert "changed" not in repr(cache._files)
+    assert str(tmp_path / "secrets.yaml") not in cache._files
+
+    # Without a cache the files are parsed on each load
+    assert yaml_loader.load_yaml_dict(
+        str(config_file), yaml_loader.Secrets(tmp_path)
+    ) == {
+        "included": ["four"],
+        "packages": {"a": 1, "b": 2},
+        "secret": "changed",
+        "env": "set",
+    }
+
+
+def test_yaml_cache_keeps_last_loaded_files(tmp_path: pathlib.Path) -> None:
+    """Test the cache only keeps the files which were loaded last."""
+    cache = yaml.YamlCache(max_files=2)
+    files = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(f"{name}: 1\n")
+        os.utime(path, ns=(1_000_000_000_000_000_000,) * 2)
+        files.append(str(path))
+
+    for fname in (files[0], files[1], files[0], files[2]):
+        yaml_loader.load_yaml(fname, None, cache)
+    assert list(cache._files) == [files[0], files[2]]